@@ -1,38 +1,44 @@
 """Streamlit app for transcript cleaning"""
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
+from datetime import datetime
+import hashlib
 import os
+import time
 import traceback
 
 from src import (
-    TranscriptParser,
-    SmartChunker,
     LLMProcessor,
-    LLMProvider,
-    OutputValidator,
     MarkdownWriter,
     CostEstimator,
-    process_transcript,
     ResumableProcessor,
     StateManager,
-    PauseRequested
+    PauseRequested,
+    ProcessingError,
+    ChunkBatcher,
+    ResponseCache,
+    SmartChunker,
+    pipeline
 )
 
-try:
-    import anthropic
-except ImportError:
-    anthropic = None
-
-try:
-    from openai import AuthenticationError as OpenAIAuthError, RateLimitError as OpenAIRateError, APIConnectionError as OpenAIConnectionError
-    openai_errors = True
-except ImportError:
-    openai_errors = False
-
 # Load environment variables
 load_dotenv()
 
+# Fragments (Streamlit >= 1.37) rerun only their own section on interaction
+fragment = getattr(st, "fragment", lambda func: func)
+
+PROMPT_PATH = Path(__file__).parent / "prompts" / "base_prompt.txt"
+PREVIEW_CHARS = 2000
+LIVE_PREVIEW_CHARS = 3000
+# Cheaper model of the same provider that short chunks can be routed to
+SMALL_MODELS = {
+    "claude-3-5-sonnet-20241022": "claude-3-5-haiku-20241022",
+    "deepseek-reasoner": "deepseek-chat"
+}
+
 # Page config
 st.set_page_config(
     page_title="Transcript Cleaner",
@@ -75,6 +81,157 @@ mark:hover {
 """, unsafe_allow_html=True)
 
 
+# Cached helpers: widget interactions rerun the script, so reuse work
+# across reruns for the same file bytes and settings
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse(file_bytes: bytes, file_name: str) -> str:
+    """Parse uploaded transcript to plain text"""
+    return pipeline.parse(file_bytes, file_name)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _chunk(text: str, chunk_size: int, overlap: int, adaptive: bool) -> tuple:
+    """Split plain text into chunks"""
+    return tuple(pipeline.chunk(text, chunk_size, overlap, adaptive))
+
+
+def load_transcript(uploaded_file) -> tuple[str, str]:
+    """
+    Parse upload once per session.
+
+    The content hash is remembered per upload id, so reruns don't re-hash
+    or re-parse the file bytes.
+
+    Returns:
+        (file_hash, plain_text)
+    """
+    cached = st.session_state.get("transcript")
+    if cached is not None and cached["file_id"] == uploaded_file.file_id:
+        return cached["file_hash"], cached["plain_text"]
+
+    file_bytes = uploaded_file.getvalue()
+    file_hash = hashlib.blake2b(file_bytes, digest_size=8).hexdigest()
+    plain_text = _parse(file_bytes, uploaded_file.name)
+
+    # Only the current upload is kept, and its chunkings
+    st.session_state.transcript = {
+        "file_id": uploaded_file.file_id,
+        "file_hash": file_hash,
+        "plain_text": plain_text,
+        "chunks": {},
+        "requests": {}
+    }
+    return file_hash, plain_text
+
+
+def chunk_transcript(plain_text: str, chunk_size: int, overlap: int, adaptive: bool) -> list:
+    """Chunk current upload, reusing chunks for settings already seen"""
+    chunkings = st.session_state.transcript["chunks"]
+    key = (chunk_size, overlap, adaptive)
+    if key not in chunkings:
+        chunkings[key] = _chunk(plain_text, chunk_size, overlap, adaptive)
+    return list(chunkings[key])
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _pack(
+    chunking_key: tuple,
+    _chunks: tuple,
+    prompt_template: str,
+    batch_size: int
+) -> list:
+    """
+    Pack chunks into batched requests.
+
+    chunking_key (file hash, chunk size, overlap, adaptive) identifies the chunks, so
+    Streamlit skips hashing _chunks themselves on every rerun.
+    """
+    return pipeline.pack(list(_chunks), prompt_template, batch_size)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _token_counts(request_key: tuple, _llm_chunks: tuple, prompt_template: str) -> tuple:
+    """
+    Token counts (prompt, per request) for packed requests.
+
+    Counts are model-independent, so switching model or batch mode only
+    re-prices them. request_key (chunking key + batch size) identifies
+    _llm_chunks.
+    """
+    prompt_tokens, chunk_tokens = pipeline.count_tokens(list(_llm_chunks), prompt_template)
+    return prompt_tokens, tuple(chunk_tokens)
+
+
+def prepare_requests(
+    chunks: list,
+    chunking_key: tuple,
+    prompt_template: str,
+    batch_size: int
+) -> dict:
+    """
+    Packed requests and their token counts, reused for settings already seen.
+
+    Kept in session state like chunkings, so reruns skip the cache_data
+    hashing and copying of batches.
+    """
+    requests = st.session_state.transcript["requests"]
+    key = (chunking_key, batch_size, prompt_template)
+    if key not in requests:
+        batches = _pack(chunking_key, tuple(chunks), prompt_template, batch_size)
+        llm_chunks = [batch.to_chunk() for batch in batches]
+        prompt_tokens, request_tokens = _token_counts(
+            chunking_key + (batch_size,), tuple(llm_chunks), prompt_template
+        )
+        requests[key] = {
+            "batches": batches,
+            "llm_chunks": llm_chunks,
+            "prompt_tokens": prompt_tokens,
+            "request_tokens": request_tokens,
+            "cache_keys": {}
+        }
+    return requests[key]
+
+
+def request_cache_keys(
+    requests: dict,
+    model: str,
+    prompt_template: str,
+    video_title: str,
+    output_language: str,
+    small_model: Optional[str] = None
+) -> list:
+    """Response cache keys for prepared requests, memoized per model/title/language"""
+    memo = requests["cache_keys"]
+    key = (model, small_model, video_title, output_language)
+    if key not in memo:
+        memo[key] = pipeline.cache_keys(
+            requests["llm_chunks"], model, prompt_template, video_title, output_language,
+            small_model=small_model
+        )
+    return memo[key]
+
+
+@lru_cache(maxsize=4)
+def _prompt_tokens(prompt_template: str) -> int:
+    """Prompt token count as pack() sees it (tiktoken; ~4 chars per token without it)"""
+    return CostEstimator().count_tokens(prompt_template)
+
+
+@lru_cache(maxsize=4)
+def _load_prompt(path: str, mtime: float) -> str:
+    """Read prompt template once per version (keyed on path + mtime)"""
+    return Path(path).read_text()
+
+
+def load_prompt(path: Path = PROMPT_PATH) -> Optional[str]:
+    """Get prompt template, or None if missing"""
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    return _load_prompt(str(path), mtime)
+
+
 def show_resume_prompt(state_manager: StateManager):
     """Show prompt to resume incomplete job"""
     summary = state_manager.get_state_summary()
@@ -98,11 +255,18 @@ def show_resume_prompt(state_manager: StateManager):
         st.progress(summary["progress_pct"] / 100)
 
         if summary["failed_chunks"] > 0:
-            st.warning(f"⚠️ {summary['failed_chunks']} chunks failed and will be skipped")
+            st.warning(f"⚠️ {summary['failed_chunks']} chunks failed and will be retried")
+
+    st.caption("Upload the same file with the same settings to resume.")
 
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("📥 Resume Processing", use_container_width=True, type="primary"):
+        next_chunk = min(summary["completed_chunks"] + 1, summary["total_chunks"])
+        if st.button(
+            f"📥 Resume from chunk {next_chunk}/{summary['total_chunks']}",
+            use_container_width=True,
+            type="primary"
+        ):
             st.session_state.resume_job = True
             st.rerun()
     with col2:
@@ -123,10 +287,12 @@ def main():
         st.session_state.resumable_processor = None
     if "pause_requested" not in st.session_state:
         st.session_state.pause_requested = False
+    if "resume_job" not in st.session_state:
+        st.session_state.resume_job = False
 
     # Check for resumable state on startup
     state_manager = StateManager()
-    if state_manager.has_resumable_state():
+    if state_manager.has_resumable_state() and not st.session_state.resume_job:
         show_resume_prompt(state_manager)
 
     # Sidebar configuration
@@ -166,6 +332,40 @@ def main():
             options=model_options,
             help=model_help
         )
+        small_model = None
+        if model in SMALL_MODELS and st.checkbox(
+            f"Route short chunks to {SMALL_MODELS[model]}",
+            help=f"Requests under {LLMProcessor.ROUTE_MAX_CHARS:,} characters go to the cheaper model"
+        ):
+            small_model = SMALL_MODELS[model]
+
+        # Optional failover to the other provider
+        fallback_endpoints = None
+        with st.expander("Failover (optional)"):
+            if provider == "Anthropic (Claude)":
+                fallback_name, fallback_env = "DeepSeek", "DEEPSEEK_API_KEY"
+                fallback_options = ["deepseek-chat", "deepseek-reasoner"]
+            else:
+                fallback_name, fallback_env = "Anthropic", "ANTHROPIC_API_KEY"
+                fallback_options = ["claude-3-5-sonnet-20241022", "claude-3-5-haiku-20241022"]
+
+            if st.checkbox(
+                f"Fail over to {fallback_name}",
+                help="Chunks hitting rate limits or connection errors are retried on the other provider"
+            ):
+                fallback_key = st.text_input(
+                    f"{fallback_name} API Key",
+                    value=os.getenv(fallback_env, ""),
+                    type="password",
+                    key="fallback_api_key"
+                )
+                fallback_model = st.selectbox(
+                    "Fallback model",
+                    options=fallback_options,
+                    key="fallback_model"
+                )
+                if fallback_key:
+                    fallback_endpoints = [{"model": fallback_model, "api_key": fallback_key}]
 
         # Language selection
         output_language = st.selectbox(
@@ -194,9 +394,44 @@ def main():
             help="Context from previous chunk included for continuity"
         )
 
+        adaptive = st.checkbox(
+            "Adaptive chunking (recommended)",
+            value=True,
+            help=f"Aim for at most {SmartChunker.ADAPTIVE_TARGET:,} chars per chunk for steadier "
+                 "response times; the chunk size is used only when no sentence break is near"
+        )
+        target_size = min(chunk_size, SmartChunker.ADAPTIVE_TARGET) if adaptive else chunk_size
+
+        prompt_template = load_prompt()
+        prompt_tokens = _prompt_tokens(prompt_template) if prompt_template else 0
+        # Chunk sizes are in chars; convert them at the prompt's measured ratio
+        chars_per_token = len(prompt_template) / prompt_tokens if prompt_tokens else 4.0
+        batch_size = st.slider(
+            "Batch size (chunks/call)",
+            min_value=1,
+            max_value=8,
+            value=ChunkBatcher.suggest_batch_size(
+                target_size, overlap, prompt_tokens, chars_per_token=chars_per_token
+            ),
+            help="Pack consecutive chunks into one API call. Fewer calls = less prompt overhead"
+        )
+
+        # Batch API is Anthropic-only
+        batch_mode = False
+        if provider == "Anthropic (Claude)":
+            batch_mode = st.checkbox(
+                "Batch mode (50% cheaper, async)",
+                help="Submit all chunks via the Message Batches API. Results may take up to 24h"
+            )
+
         st.divider()
         st.caption("Built with Streamlit + Claude/DeepSeek API")
 
+    # Show pending batch job, if any
+    if st.session_state.get("batch_job") and api_key:
+        show_batch_job(api_key)
+        return
+
     # Main content area
     col1, col2 = st.columns([1, 1])
 
@@ -217,13 +452,8 @@ def main():
     # Process if file uploaded
     if uploaded_file is not None:
         # Parse transcript
-        parser = TranscriptParser()
         try:
-            segments = parser.parse_from_bytes(
-                uploaded_file.getvalue(),
-                uploaded_file.name
-            )
-            plain_text = parser.to_plain_text(segments)
+            file_hash, plain_text = load_transcript(uploaded_file)
         except Exception as e:
             st.error(f"Error parsing file: {e}")
             return
@@ -235,85 +465,230 @@ def main():
         # Show original preview
         with col1:
             with st.expander("Preview original transcript", expanded=False):
-                st.text(plain_text[:2000] + ("..." if len(plain_text) > 2000 else ""))
-                st.caption(f"Total length: {len(plain_text):,} characters")
+                st.text(plain_text[:PREVIEW_CHARS])
+                if len(plain_text) > PREVIEW_CHARS:
+                    st.caption(
+                        f"Showing first {PREVIEW_CHARS:,} of {len(plain_text):,} characters"
+                    )
+                else:
+                    st.caption(f"Total length: {len(plain_text):,} characters")
 
         # Chunk transcript
-        chunker = SmartChunker(chunk_size=chunk_size, overlap=overlap)
-        chunks = chunker.chunk_transcript(plain_text)
+        chunks = chunk_transcript(plain_text, chunk_size, overlap, adaptive)
 
         with col2:
             st.subheader("2. Cost Estimate")
 
             # Estimate cost
             estimator = CostEstimator(model=model)
-            prompt_path = Path(__file__).parent / "prompts" / "base_prompt.txt"
 
-            if prompt_path.exists():
-                prompt_template = prompt_path.read_text()
-                estimate = estimator.estimate_total(chunks, prompt_template)
+            if prompt_template is not None:
+                # Pack chunks into fewer requests
+                requests = prepare_requests(
+                    chunks, (file_hash, chunk_size, overlap, adaptive), prompt_template, batch_size
+                )
+                batches = requests["batches"]
+                llm_chunks = requests["llm_chunks"]
+
+                # Only uncached requests cost anything
+                uncached = pipeline.uncached_indices(
+                    llm_chunks, model, prompt_template, video_title, output_language,
+                    cache=ResponseCache(),
+                    keys=request_cache_keys(
+                        requests, model, prompt_template, video_title, output_language,
+                        small_model
+                    )
+                )
+                request_tokens = requests["request_tokens"]
+                # Routed requests are priced at the model they go to
+                routed = None
+                if small_model:
+                    models = pipeline.route_models(llm_chunks, model, small_model)
+                    routed = [models[i] for i in uncached]
+                estimate = estimator.estimate_from_counts(
+                    [request_tokens[i] for i in uncached],
+                    requests["prompt_tokens"],
+                    batch_mode=batch_mode,
+                    models=routed
+                )
 
                 # Display estimate
                 metric_cols = st.columns(3)
                 with metric_cols[0]:
                     st.metric("Estimated Cost", f"${estimate.total_cost:.4f}")
                 with metric_cols[1]:
-                    st.metric("Chunks", estimate.chunks)
+                    st.metric("Chunks", len(chunks))
                 with metric_cols[2]:
                     st.metric("Est. Time", f"~{estimate.processing_time_minutes} min")
 
+                if len(llm_chunks) < len(chunks):
+                    st.caption(f"Packed into {len(llm_chunks)} API calls")
+                if len(uncached) < len(llm_chunks):
+                    st.caption(f"Cached: {len(llm_chunks) - len(uncached)}/{len(llm_chunks)} chunks")
+
+                # Suggest batch mode for large jobs (re-pricing counts is cheap)
+                if (
+                    provider == "Anthropic (Claude)"
+                    and not batch_mode
+                    and len(uncached) >= LLMProcessor.BATCH_THRESHOLD
+                ):
+                    batch_estimate = estimator.estimate_from_counts(
+                        [request_tokens[i] for i in uncached],
+                        requests["prompt_tokens"],
+                        batch_mode=True,
+                        models=routed
+                    )
+                    st.info(
+                        f"💡 {len(uncached)} requests: Batch mode would cost "
+                        f"~${batch_estimate.total_cost:.4f} if you can wait for results"
+                    )
+
                 with st.expander("Cost breakdown"):
                     st.markdown(estimator.format_estimate(estimate))
             else:
                 st.warning("Prompt template not found. Create prompts/base_prompt.txt")
                 estimate = None
 
-        # Process button
         if api_key and estimate:
-            st.divider()
-
-            # Confirmation for high costs
-            if estimate.total_cost > 1.0:
-                st.warning(f"⚠️ Estimated cost is ${estimate.total_cost:.2f}. Please confirm.")
-                confirm = st.checkbox("I understand and want to proceed")
-                if not confirm:
-                    return
-
-            if st.button("🚀 Process Transcript", type="primary", use_container_width=True):
-                process_transcript_ui_resumable(
-                    chunks=chunks,
-                    api_key=api_key,
-                    model=model,
-                    video_title=video_title,
-                    prompt_template=prompt_template,
-                    output_language=output_language,
-                    file_name=uploaded_file.name,
-                    estimated_cost=estimate.total_cost
-                )
-
+            process_section(
+                llm_chunks=llm_chunks,
+                batches=batches,
+                estimate=estimate,
+                api_key=api_key,
+                model=model,
+                video_title=video_title,
+                prompt_template=prompt_template,
+                output_language=output_language,
+                file_name=uploaded_file.name,
+                batch_mode=batch_mode,
+                fallback_endpoints=fallback_endpoints,
+                small_model=small_model
+            )
         elif not api_key:
             st.info("👈 Enter your API key in the sidebar to continue")
 
 
+@fragment
+def process_section(
+    llm_chunks: list,
+    batches: list,
+    estimate,
+    api_key: str,
+    model: str,
+    video_title: str,
+    prompt_template: str,
+    output_language: str,
+    file_name: str,
+    batch_mode: bool,
+    fallback_endpoints: Optional[list],
+    small_model: Optional[str] = None
+):
+    """
+    Resume, confirmation and Process controls.
+
+    Runs as a fragment, so clicking the confirmation checkbox or Process
+    button reruns only this section, not parsing, sidebar and estimate.
+    """
+    # Resume a saved job for this exact upload and settings
+    if st.session_state.resume_job:
+        st.session_state.resume_job = False
+        resumer = ResumableProcessor(api_key=api_key, model=model, small_model=small_model)
+        state = resumer.find_resumable_job(
+            llm_chunks, prompt_template, video_title, output_language
+        )
+        batch_id = resumer.pending_batch_id() if state is not None else None
+        if state is None:
+            st.warning("Saved job doesn't match this file or settings. Starting fresh.")
+        elif batch_id is not None:
+            # Keep polling the submitted batch instead of paying for the chunks again
+            remember_batch_job(
+                batch_id, state, llm_chunks, model, video_title,
+                prompt_template, output_language, batches,
+                submitted_at=datetime.fromisoformat(state.last_updated).timestamp(),
+                small_model=small_model
+            )
+            st.rerun()
+        else:
+            process_transcript_ui_resumable(
+                chunks=llm_chunks,
+                api_key=api_key,
+                model=model,
+                video_title=video_title,
+                prompt_template=prompt_template,
+                output_language=output_language,
+                file_name=file_name,
+                estimated_cost=estimate.total_cost,
+                batches=batches,
+                resume=True,
+                fallback_endpoints=fallback_endpoints,
+                small_model=small_model
+            )
+            return
+
+    st.divider()
+
+    # Confirmation for high costs
+    if estimate.total_cost > 1.0:
+        st.warning(f"⚠️ Estimated cost is ${estimate.total_cost:.2f}. Please confirm.")
+        confirm = st.checkbox("I understand and want to proceed")
+        if not confirm:
+            return
+
+    if not st.button("🚀 Process Transcript", type="primary", use_container_width=True):
+        # Keep showing this upload's last output across reruns
+        rendered = st.session_state.transcript.get("output")
+        if rendered is not None:
+            render_output(rendered)
+        return
+
+    if batch_mode:
+        submit_batch_ui(
+            chunks=llm_chunks,
+            api_key=api_key,
+            model=model,
+            video_title=video_title,
+            prompt_template=prompt_template,
+            file_name=file_name,
+            estimated_cost=estimate.total_cost,
+            output_language=output_language,
+            batches=batches,
+            small_model=small_model
+        )
+        return
+
+    process_transcript_ui_resumable(
+        chunks=llm_chunks,
+        api_key=api_key,
+        model=model,
+        video_title=video_title,
+        prompt_template=prompt_template,
+        output_language=output_language,
+        file_name=file_name,
+        estimated_cost=estimate.total_cost,
+        batches=batches,
+        fallback_endpoints=fallback_endpoints,
+        small_model=small_model
+    )
+
+
 def safe_process(func):
     """Wrap processing with user-friendly errors"""
     try:
         return func()
     except Exception as e:
-        error_name = type(e).__name__
+        # Match SDK errors by origin and class names (incl. base classes),
+        # so neither SDK is imported just to classify the error
+        sdk = type(e).__module__.split(".")[0]
+        names = {cls.__name__ for cls in type(e).__mro__}
+        from_sdk = sdk in ("anthropic", "openai")
 
-        # Check for specific errors by name
-        if anthropic and error_name == "AuthenticationError":
+        if sdk == "anthropic" and "AuthenticationError" in names:
             st.error("❌ Invalid API key. Check your Anthropic API key.")
-        elif openai_errors and isinstance(e, OpenAIAuthError):
+        elif sdk == "openai" and "AuthenticationError" in names:
             st.error("❌ Invalid API key. Check your DeepSeek API key.")
-        elif anthropic and error_name == "RateLimitError":
-            st.error("⏳ Rate limit reached. Please wait a moment and try again.")
-        elif openai_errors and isinstance(e, OpenAIRateError):
+        elif from_sdk and "RateLimitError" in names:
             st.error("⏳ Rate limit reached. Please wait a moment and try again.")
-        elif anthropic and error_name == "APIConnectionError":
-            st.error("🌐 Network error. Check your internet connection.")
-        elif openai_errors and isinstance(e, OpenAIConnectionError):
+        elif from_sdk and "APIConnectionError" in names:
             st.error("🌐 Network error. Check your internet connection.")
         else:
             st.error(f"❌ Unexpected error: {str(e)}")
@@ -331,27 +706,39 @@ def process_transcript_ui_resumable(
     prompt_template: str,
     file_name: str,
     estimated_cost: float,
-    output_language: str = "English"
+    output_language: str = "English",
+    batches: Optional[list] = None,
+    resume: bool = False,
+    fallback_endpoints: Optional[list] = None,
+    small_model: Optional[str] = None
 ):
     """Process transcript with pause/resume capability"""
 
     # Create resumable processor
-    processor = ResumableProcessor(api_key=api_key, model=model)
-
-    # Start new job
-    processor.start_new_job(
-        chunks=chunks,
-        file_name=file_name,
-        video_title=video_title,
-        prompt_template=prompt_template,
-        output_language=output_language,
-        estimated_cost=estimated_cost
+    processor = ResumableProcessor(
+        api_key=api_key,
+        model=model,
+        cache=ResponseCache(),
+        fallback_endpoints=fallback_endpoints,
+        small_model=small_model
     )
 
+    # Start new job unless continuing from saved checkpoint
+    if not resume:
+        processor.start_new_job(
+            chunks=chunks,
+            file_name=file_name,
+            video_title=video_title,
+            prompt_template=prompt_template,
+            output_language=output_language,
+            estimated_cost=estimated_cost
+        )
+
     # Progress UI
     progress_bar = st.progress(0)
     status_text = st.empty()
     pause_button_container = st.empty()
+    live_preview = st.empty()
 
     # Show pause button
     if pause_button_container.button("⏸️ Pause", key="pause_btn", use_container_width=True):
@@ -367,6 +754,40 @@ def process_transcript_ui_resumable(
         elif status == "skipped":
             status_text.text(f"Skipped chunk {current}/{total} (already processed)")
 
+    # Show the transcript start as soon as its chunks are done
+    batcher = ChunkBatcher()
+    batches_by_index = {b.index: b for b in batches or []}
+    writer = MarkdownWriter()
+    completed = {}
+    shown = [0]
+
+    def show_completed(result):
+        batch = batches_by_index.get(result.chunk_index)
+        try:
+            parts = batcher.unpack(batch, result) if batch else [result]
+        except ProcessingError:
+            # Reported when the results are finalized
+            return
+        for part in parts:
+            completed[part.chunk_index] = part
+
+        # Contiguous results from the first chunk, up to preview size
+        prefix = []
+        chars = 0
+        while len(prefix) in completed and chars <= LIVE_PREVIEW_CHARS:
+            prefix.append(completed[len(prefix)])
+            chars += len(prefix[-1].cleaned_text)
+        if len(prefix) > shown[0]:
+            shown[0] = len(prefix)
+            live_preview.markdown(
+                writer.get_content_for_preview(prefix, max_chars=LIVE_PREVIEW_CHARS),
+                unsafe_allow_html=True
+            )
+
+    if resume:
+        for saved in processor.job_results()[0]:
+            show_completed(saved)
+
     # Process with error handling
     def do_process():
         return processor.process_all_chunks(
@@ -375,12 +796,14 @@ def process_transcript_ui_resumable(
             video_title=video_title,
             output_language=output_language,
             progress_callback=update_progress,
-            resume=False
+            resume=resume,
+            result_callback=show_completed
         )
 
     try:
         result = safe_process(do_process)
         if result is None:
+            st.info("💾 Completed chunks were saved. Reload the page to resume.")
             return
 
         results, summary = result
@@ -396,10 +819,198 @@ def process_transcript_ui_resumable(
     pause_button_container.empty()
     progress_bar.empty()
     status_text.empty()
+    live_preview.empty()
+
+    state = processor.get_current_state()
+    if state is not None and state.failed_chunks:
+        st.warning(
+            f"⚠️ {len(state.failed_chunks)} requests failed: "
+            + describe_failed_chunks(state.failed_chunks, batches)
+            + ". Reload the page to resume and retry them."
+        )
+
+    show_results(results, summary, video_title, batches)
 
-    # Validate output
-    validator = OutputValidator()
-    validation = validator.validate_all(results)
+
+def submit_batch_ui(
+    chunks: list,
+    api_key: str,
+    model: str,
+    video_title: str,
+    prompt_template: str,
+    file_name: str,
+    estimated_cost: float,
+    output_language: str = "English",
+    batches: Optional[list] = None,
+    small_model: Optional[str] = None
+):
+    """Submit chunks as a Message Batch and remember it in session state"""
+    processor = ResumableProcessor(
+        api_key=api_key, model=model, cache=ResponseCache(), small_model=small_model
+    )
+    processor.start_new_job(
+        chunks=chunks,
+        file_name=file_name,
+        video_title=video_title,
+        prompt_template=prompt_template,
+        output_language=output_language,
+        estimated_cost=estimated_cost
+    )
+
+    # Cached chunks are checkpointed, not resubmitted
+    batch_id = safe_process(lambda: processor.submit_batch(
+        chunks, prompt_template, video_title, output_language
+    ))
+    state = processor.get_current_state()
+    if batch_id is None:
+        if state is not None and state.status == "completed":
+            results, summary = processor.job_results()
+            show_results(results, summary, video_title, batches)
+        return
+
+    remember_batch_job(
+        batch_id, state, chunks, model, video_title, prompt_template, output_language, batches,
+        small_model=small_model
+    )
+    st.rerun()
+
+
+def remember_batch_job(
+    batch_id: str,
+    state,
+    chunks: list,
+    model: str,
+    video_title: str,
+    prompt_template: str,
+    output_language: str,
+    batches: Optional[list] = None,
+    submitted_at: Optional[float] = None,
+    small_model: Optional[str] = None
+):
+    """Keep a submitted batch in session state so show_batch_job polls it"""
+    st.session_state.batch_job = {
+        "batch_id": batch_id,
+        "model": model,
+        "small_model": small_model,
+        "video_title": video_title,
+        "prompt_template": prompt_template,
+        "output_language": output_language,
+        "chunks": [c for c in chunks if not state.is_completed(c.index)],
+        "batches": batches,
+        "submitted_at": submitted_at if submitted_at is not None else time.time()
+    }
+
+
+def show_batch_job(api_key: str):
+    """Show status of a pending batch job and its results once ended"""
+    job = st.session_state.batch_job
+    processor = ResumableProcessor(
+        api_key=api_key, model=job["model"], cache=ResponseCache(),
+        small_model=job.get("small_model")
+    )
+
+    status = safe_process(lambda: LLMProcessor(
+        api_key=api_key, model=job["model"]
+    ).get_batch_status(job["batch_id"]))
+    if status is None:
+        return
+
+    total = len(job["chunks"])
+    done = total - status["processing"]
+
+    if status["status"] != "ended":
+        st.info(f"📦 Batch `{job['batch_id']}` is {status['status'].replace('_', ' ')}")
+        st.progress(done / total if total else 0.0)
+
+        elapsed = time.time() - job["submitted_at"]
+        if done > 0:
+            eta_min = elapsed / done * (total - done) / 60
+            st.caption(f"{done}/{total} requests done · ETA ~{eta_min:.0f} min")
+        else:
+            st.caption(f"{done}/{total} requests done · batches finish within 24h")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔄 Refresh Status", use_container_width=True, type="primary"):
+                st.rerun()
+        with col2:
+            if st.button("🗑️ Discard Batch", use_container_width=True):
+                del st.session_state.batch_job
+                st.rerun()
+        return
+
+    # Results are checkpointed into the job state and response cache
+    result = safe_process(lambda: processor.collect_batch(
+        job["batch_id"], job["chunks"], job["prompt_template"],
+        job["video_title"], job["output_language"]
+    ))
+    if result is None:
+        return
+    results, summary = result
+    del st.session_state.batch_job
+
+    state = processor.get_current_state()
+    if state is not None and state.failed_chunks:
+        st.warning(
+            f"⚠️ {len(state.failed_chunks)} batch requests did not succeed: "
+            + describe_failed_chunks(state.failed_chunks, job["batches"])
+            + ". Resume the job to retry them."
+        )
+
+    show_results(results, summary, job["video_title"], job["batches"])
+
+
+def describe_failed_chunks(failed_chunks: dict, batches: Optional[list] = None) -> str:
+    """List failed requests by the transcript chunks they cover"""
+    # Failed indices are request indices; packed requests span several chunks
+    batches_by_index = {b.index: b for b in batches or []}
+    parts = []
+    for i, reason in sorted(failed_chunks.items(), key=lambda item: int(item[0])):
+        batch = batches_by_index.get(int(i))
+        members = [m.index for m in batch.members] if batch else [int(i)]
+        if len(members) == 1:
+            parts.append(f"chunk {members[0]} ({reason})")
+        else:
+            parts.append(f"chunks {members[0]}–{members[-1]} ({reason})")
+    return ", ".join(parts)
+
+
+def show_results(
+    results: list,
+    summary: dict,
+    video_title: str,
+    batches: Optional[list] = None
+):
+    """Validate and write processed results, then display them"""
+    try:
+        final = pipeline.finalize(results, summary, video_title, batches)
+    except ProcessingError as e:
+        st.error(f"❌ {e}")
+        return
+    output = final.output
+
+    # Everything rendered is kept with the upload, so later reruns (e.g.
+    # download clicks) redraw it without re-finalizing or re-encoding
+    rendered = {
+        "summary": summary,
+        "validation": final.validation,
+        "preview": MarkdownWriter().get_content_for_preview(final.results, max_chars=3000),
+        "highlighted": output.highlighted_markdown,
+        "md_bytes": output.markdown_bytes,
+        "md_name": output.md_path.name,
+        "json_bytes": output.metadata_bytes,
+        "json_name": output.json_path.name
+    }
+    transcript = st.session_state.get("transcript")
+    if transcript is not None:
+        transcript["output"] = rendered
+
+    render_output(rendered)
+
+
+def render_output(rendered: dict):
+    """Display validation, preview tabs and downloads of a written output"""
+    summary, validation = rendered["summary"], rendered["validation"]
 
     if validation.has_errors or validation.has_warnings:
         with st.expander(
@@ -412,16 +1023,11 @@ def process_transcript_ui_resumable(
                 if issue.snippet:
                     st.code(issue.snippet, language=None)
 
-    # Write output
-    writer = MarkdownWriter()
-    md_path, json_path = writer.write(
-        processed_chunks=results,
-        title=video_title,
-        summary=summary
-    )
-
     # Success message
-    st.success(f"✅ Processing complete! Cost: ${summary['total_cost']:.4f}")
+    message = f"✅ Processing complete! Cost: ${summary['total_cost']:.4f}"
+    if summary.get("cache_hits"):
+        message += f" · {summary['cache_hits']} chunks from cache"
+    st.success(message)
 
     # Show results
     st.subheader("3. Results")
@@ -430,13 +1036,10 @@ def process_transcript_ui_resumable(
     tab1, tab2, tab3 = st.tabs(["Preview", "Full Output", "Stats"])
 
     with tab1:
-        preview = writer.get_content_for_preview(results, max_chars=3000)
-        st.markdown(preview, unsafe_allow_html=True)
+        st.markdown(rendered["preview"], unsafe_allow_html=True)
 
     with tab2:
-        full_content = md_path.read_text()
-        highlighted_content = writer._apply_highlights_for_streamlit(full_content)
-        st.markdown(highlighted_content, unsafe_allow_html=True)
+        st.markdown(rendered["highlighted"], unsafe_allow_html=True)
 
     with tab3:
         st.json(summary)
@@ -447,8 +1050,8 @@ def process_transcript_ui_resumable(
     with col1:
         st.download_button(
             label="📥 Download Markdown",
-            data=md_path.read_bytes(),
-            file_name=md_path.name,
+            data=rendered["md_bytes"],
+            file_name=rendered["md_name"],
             mime="text/markdown",
             use_container_width=True
         )
@@ -456,8 +1059,8 @@ def process_transcript_ui_resumable(
     with col2:
         st.download_button(
             label="📥 Download Metadata (JSON)",
-            data=json_path.read_bytes(),
-            file_name=json_path.name,
+            data=rendered["json_bytes"],
+            file_name=rendered["json_name"],
             mime="application/json",
             use_container_width=True
         )
@@ -1,31 +1,53 @@
 """Transcript cleaning modules"""
-from .transcript_parser import TranscriptParser, TranscriptSegment
-from .chunker import SmartChunker, Chunk
-from .llm_processor import LLMProcessor, LLMProvider, ProcessedChunk, process_transcript
-from .validator import OutputValidator, ValidationResult, ValidationSeverity
-from .markdown_writer import MarkdownWriter
-from .cost_estimator import CostEstimator, CostBreakdown
-from .state_manager import StateManager, ProcessingState
-from .resumable_processor import ResumableProcessor, PauseRequested, process_transcript_resumable
-
-__all__ = [
-    "TranscriptParser",
-    "TranscriptSegment",
-    "SmartChunker",
-    "Chunk",
-    "LLMProcessor",
-    "LLMProvider",
-    "ProcessedChunk",
-    "process_transcript",
-    "OutputValidator",
-    "ValidationResult",
-    "ValidationSeverity",
-    "MarkdownWriter",
-    "CostEstimator",
-    "CostBreakdown",
-    "StateManager",
-    "ProcessingState",
-    "ResumableProcessor",
-    "PauseRequested",
-    "process_transcript_resumable",
-]
+from importlib import import_module
+
+# Public name -> defining submodule; imported on first access (PEP 562)
+_EXPORTS = {
+    "TranscriptParser": ".transcript_parser",
+    "TranscriptSegment": ".transcript_parser",
+    "SmartChunker": ".chunker",
+    "Chunk": ".chunker",
+    "LLMProcessor": ".llm_processor",
+    "LLMProvider": ".llm_processor",
+    "ProcessedChunk": ".llm_processor",
+    "ProcessingError": ".llm_processor",
+    "process_transcript": ".llm_processor",
+    "OutputValidator": ".validator",
+    "ValidationResult": ".validator",
+    "ValidationSeverity": ".validator",
+    "MarkdownWriter": ".markdown_writer",
+    "CostEstimator": ".cost_estimator",
+    "CostBreakdown": ".cost_estimator",
+    "StateManager": ".state_manager",
+    "ProcessingState": ".state_manager",
+    "ResumableProcessor": ".resumable_processor",
+    "PauseRequested": ".resumable_processor",
+    "process_transcript_resumable": ".resumable_processor",
+    "ChunkBatcher": ".chunk_batcher",
+    "ChunkBatch": ".chunk_batcher",
+    "PackedChunk": ".chunk_batcher",
+    "ResponseCache": ".response_cache",
+    "LLMClientPool": ".client_pool",
+    "pipeline": None,
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name = _EXPORTS[name]
+    if module_name is None:
+        value = import_module(f".{name}", __name__)
+    else:
+        value = getattr(import_module(module_name, __name__), name)
+
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
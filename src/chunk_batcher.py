@@ -0,0 +1,239 @@
+"""Pack consecutive chunks into a single LLM request"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import re
+
+from .chunker import Chunk
+from .llm_processor import ProcessedChunk, ProcessingError
+
+
+OUTPUT_SECTION_PATTERN = re.compile(r"<<<OUT (\d+)>>>\s*(.*?)\s*<<<END \1>>>", re.DOTALL)
+
+BATCH_INSTRUCTION = (
+    "[MULTIPLE SECTIONS] The new content below is split into numbered sections "
+    "marked <<<CHUNK i>>> ... <<<END i>>>. Clean each section separately and wrap "
+    "each cleaned result exactly as <<<OUT i>>> ... <<<END i>>>, keeping the same "
+    "numbers and order."
+)
+
+
+def _approx_tokens(text: str) -> int:
+    """Character-based token estimate (~4 chars per token)"""
+    return len(text) // 4
+
+
+def _output_sections(cleaned_text: str) -> Dict[int, str]:
+    """Cleaned text of each <<<OUT i>>> block, by position"""
+    return {
+        int(match.group(1)): match.group(2)
+        for match in OUTPUT_SECTION_PATTERN.finditer(cleaned_text)
+    }
+
+
+@dataclass
+class PackedChunk(Chunk):
+    """
+    Combined chunk of a multi-member batch.
+
+    Its response must hold one <<<OUT i>>> block per member; others are
+    rejected before they're cached or checkpointed.
+    """
+    sections: int = 1
+
+    def accepts_output(self, cleaned_text: str) -> bool:
+        return _output_sections(cleaned_text).keys() == set(range(self.sections))
+
+
+@dataclass
+class ChunkBatch:
+    """Group of consecutive chunks sent as one request"""
+    index: int
+    members: List[Chunk]
+
+    def to_chunk(self) -> Chunk:
+        """Build the combined chunk sent to the LLM"""
+        if len(self.members) == 1:
+            member = self.members[0]
+            return Chunk(
+                index=self.index,
+                text=member.text,
+                start_timestamp=member.start_timestamp,
+                context_buffer=member.context_buffer
+            )
+
+        sections = [BATCH_INSTRUCTION, ""]
+        for position, member in enumerate(self.members):
+            sections.append(f"<<<CHUNK {position}>>>")
+            sections.append(member.text)
+            sections.append(f"<<<END {position}>>>")
+            sections.append("")
+
+        first = self.members[0]
+        return PackedChunk(
+            index=self.index,
+            text="\n".join(sections).strip(),
+            start_timestamp=first.start_timestamp,
+            context_buffer=first.context_buffer,
+            sections=len(self.members)
+        )
+
+
+class ChunkBatcher:
+    """Greedy-pack chunks so fewer, larger API calls are made"""
+
+    OUTPUT_RATIO = 0.8  # Same output/input ratio used by CostEstimator
+
+    def __init__(
+        self,
+        max_chunks_per_call: int = 4,
+        context_limit: int = 8000,
+        count_tokens: Optional[Callable[[str], int]] = None
+    ):
+        """
+        Args:
+            max_chunks_per_call: Upper bound on chunks packed into one request
+            context_limit: Token budget for prompt + content + expected response
+            count_tokens: Token counter (default: ~4 chars per token)
+        """
+        self.max_chunks_per_call = max(1, max_chunks_per_call)
+        self.context_limit = context_limit
+        self.count_tokens = count_tokens or _approx_tokens
+
+    @classmethod
+    def suggest_batch_size(
+        cls,
+        chunk_size: int,
+        overlap: int,
+        prompt_tokens: int,
+        context_limit: int = 8000,
+        upper_bound: int = 8,
+        chars_per_token: float = 4.0
+    ) -> int:
+        """
+        Suggest how many chunks of the given size fit in one request.
+
+        chunk_size and overlap are in characters, converted at chars_per_token
+        (measure it on the prompt to match the tokenizer pack() counts with).
+        """
+        per_chunk = ((chunk_size + overlap) // max(chars_per_token, 1.0)) * (1 + cls.OUTPUT_RATIO)
+        if per_chunk <= 0:
+            return 1
+        fit = int((context_limit - prompt_tokens) // per_chunk)
+        return max(1, min(upper_bound, fit))
+
+    def pack(self, chunks: List[Chunk], prompt_template: str) -> List[ChunkBatch]:
+        """Group consecutive chunks within the token budget"""
+        prompt_tokens = self.count_tokens(prompt_template)
+        batches: List[ChunkBatch] = []
+        members: List[Chunk] = []
+        used = prompt_tokens
+
+        for chunk in chunks:
+            # Content is tokenized once; the context prefix only when the
+            # chunk opens a request
+            text_tokens = self.count_tokens(chunk.text)
+            cost = self._request_tokens(chunk, text_tokens, first=not members)
+            full = len(members) >= self.max_chunks_per_call
+            if members and (full or used + cost > self.context_limit):
+                batches.append(ChunkBatch(index=len(batches), members=members))
+                members = []
+                used = prompt_tokens
+                cost = self._request_tokens(chunk, text_tokens, first=True)
+
+            members.append(chunk)
+            used += cost
+
+        if members:
+            batches.append(ChunkBatch(index=len(batches), members=members))
+
+        return batches
+
+    def unpack(
+        self,
+        batch: ChunkBatch,
+        processed: ProcessedChunk
+    ) -> List[ProcessedChunk]:
+        """
+        Split a combined result back into per-chunk results.
+
+        Raises:
+            ProcessingError: If the output sections don't match the members
+                (missing, extra or garbled <<<OUT i>>> blocks)
+        """
+        if len(batch.members) == 1:
+            member = batch.members[0]
+            return [ProcessedChunk(
+                chunk_index=member.index,
+                original_text=member.text,
+                cleaned_text=processed.cleaned_text,
+                input_tokens=processed.input_tokens,
+                output_tokens=processed.output_tokens,
+                cost=processed.cost,
+                model=processed.model,
+                provider=processed.provider,
+                cached=processed.cached
+            )]
+
+        sections = _output_sections(processed.cleaned_text)
+        if sections.keys() != set(range(len(batch.members))):
+            # Never guess which text belongs to which chunk
+            raise ProcessingError(
+                batch.index,
+                f"Expected {len(batch.members)} output sections, got {len(sections)} "
+                "(reduce chunks per request and retry)"
+            )
+
+        # Attribute usage proportionally to each member's input size
+        total_chars = sum(len(m.text) for m in batch.members) or 1
+        results = []
+        assigned_in = assigned_out = 0
+        assigned_cost = 0.0
+        last = len(batch.members) - 1
+
+        for position, member in enumerate(batch.members):
+            if position == last:
+                input_tokens = processed.input_tokens - assigned_in
+                output_tokens = processed.output_tokens - assigned_out
+                cost = round(processed.cost - assigned_cost, 6)
+            else:
+                share = len(member.text) / total_chars
+                input_tokens = int(processed.input_tokens * share)
+                output_tokens = int(processed.output_tokens * share)
+                cost = round(processed.cost * share, 6)
+                assigned_in += input_tokens
+                assigned_out += output_tokens
+                assigned_cost += cost
+
+            results.append(ProcessedChunk(
+                chunk_index=member.index,
+                original_text=member.text,
+                cleaned_text=sections[position],
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost=cost,
+                model=processed.model,
+                provider=processed.provider,
+                cached=processed.cached
+            ))
+
+        return results
+
+    def unpack_all(
+        self,
+        batches: List[ChunkBatch],
+        processed: List[ProcessedChunk]
+    ) -> List[ProcessedChunk]:
+        """Split all combined results, matched by batch index"""
+        by_index = {p.chunk_index: p for p in processed}
+        results = []
+        for batch in batches:
+            if batch.index in by_index:
+                results.extend(self.unpack(batch, by_index[batch.index]))
+        return results
+
+    def _request_tokens(self, chunk: Chunk, text_tokens: int, first: bool) -> int:
+        """Tokens a chunk adds to a request, including its expected response"""
+        tokens = text_tokens
+        if first:
+            tokens += self.count_tokens(chunk.llm_prefix)
+        return int(tokens * (1 + self.OUTPUT_RATIO))
@@ -1,9 +1,17 @@
 """Smart chunking with context preservation"""
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 import re
 
 
+PARAGRAPH_PATTERN = re.compile(r"\n\n")
+SENTENCE_PATTERN = re.compile(r"[.!?][\s\n]")
+TIMESTAMP_PATTERN = re.compile(r"\[[\d:]+\]")
+CONTEXT_SENTENCE_PATTERN = re.compile(r"[.!?]\s+")
+FIRST_TIMESTAMP_PATTERN = re.compile(r"\[(\d{2}:\d{2}:\d{2})\]")
+
+
 @dataclass
 class Chunk:
     """Represents a text chunk with metadata"""
@@ -12,9 +20,16 @@ class Chunk:
     start_timestamp: str
     context_buffer: Optional[str] = None
 
-    @property
-    def full_text_for_llm(self) -> str:
-        """Build text to send to LLM"""
+    def __setattr__(self, name, value):
+        # Built LLM text is cached; drop it when its inputs change
+        if name in ("text", "context_buffer"):
+            self.__dict__.pop("full_text_for_llm", None)
+            self.__dict__.pop("llm_prefix", None)
+        super().__setattr__(name, value)
+
+    @cached_property
+    def llm_prefix(self) -> str:
+        """Context and section markers sent ahead of the content"""
         parts = []
         if self.context_buffer:
             parts.append("[CONTEXT FROM PREVIOUS SECTION]")
@@ -22,27 +37,51 @@ class Chunk:
             parts.append("")
 
         parts.append("[NEW CONTENT TO PROCESS]")
-        parts.append(self.text)
+        parts.append("")
 
         return "\n".join(parts)
 
+    @cached_property
+    def full_text_for_llm(self) -> str:
+        """Build text to send to LLM (once per chunk)"""
+        return self.llm_prefix + self.text
+
     @property
     def char_count(self) -> int:
         """Total chars including context"""
         return len(self.full_text_for_llm)
 
+    def accepts_output(self, cleaned_text: str) -> bool:
+        """Whether an LLM response is usable for this chunk (see PackedChunk)"""
+        return True
+
 
 class SmartChunker:
     """Split transcript at sentence boundaries with context"""
 
-    def __init__(self, chunk_size: int = 2000, overlap: int = 200):
+    # Adaptive target: per-chunk latency grows faster than linearly past this
+    ADAPTIVE_TARGET = 2000
+    # Adaptive boundary search reach around the target
+    ADAPTIVE_WINDOW = 200
+
+    def __init__(self, chunk_size: int = 2000, overlap: int = 200, adaptive: bool = True):
         """
         Args:
             chunk_size: Target characters per chunk (excluding context)
             overlap: Characters to include from previous chunk as context
+            adaptive: Target at most ADAPTIVE_TARGET chars, using chunk_size
+                only when no boundary is found near that target
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.adaptive = adaptive
+
+    @property
+    def target_size(self) -> int:
+        """Characters aimed for per chunk"""
+        if self.adaptive:
+            return min(self.chunk_size, self.ADAPTIVE_TARGET)
+        return self.chunk_size
 
     def chunk_transcript(self, text: str) -> List[Chunk]:
         """Split transcript into chunks with context preservation"""
@@ -52,11 +91,7 @@ class SmartChunker:
         previous_chunk_text = ""
 
         while current_pos < len(text):
-            end_pos = min(current_pos + self.chunk_size, len(text))
-
-            if end_pos < len(text):
-                end_pos = self._find_best_split(text, current_pos, end_pos)
-
+            end_pos = self._chunk_end(text, current_pos)
             chunk_text = text[current_pos:end_pos].strip()
 
             if not chunk_text:
@@ -82,26 +117,66 @@ class SmartChunker:
 
         return chunks
 
+    def _chunk_end(self, text: str, start: int) -> int:
+        """End position of the chunk starting at start"""
+        end_pos = min(start + self.target_size, len(text))
+        if end_pos >= len(text):
+            return end_pos
+
+        if self.target_size < self.chunk_size:
+            split = self._find_split(
+                text, start, end_pos, self.ADAPTIVE_WINDOW, self.ADAPTIVE_WINDOW
+            )
+            if split is None:
+                # No boundary near the target: fall back to the full chunk size
+                end_pos = min(start + self.chunk_size, len(text))
+                if end_pos >= len(text):
+                    return end_pos
+                split = self._find_best_split(text, start, end_pos)
+        else:
+            split = self._find_best_split(text, start, end_pos)
+
+        # A timestamp at the window start would never advance
+        return split if split > start else end_pos
+
     def _find_best_split(
         self, text: str, start: int, target_end: int
     ) -> int:
         """Find best split point near target_end (prefer sentence boundary)"""
-        search_start = max(start, target_end - 100)
-        search_text = text[search_start:target_end + 50]
-
-        para_match = list(re.finditer(r"\n\n", search_text))
+        split = self._find_split(text, start, target_end, 100, 50)
+        return target_end if split is None else split
+
+    def _find_split(
+        self, text: str, start: int, target_end: int, before: int, after: int
+    ) -> Optional[int]:
+        """Boundary in [target_end - before, target_end + after], if any"""
+        search_start = max(start, target_end - before)
+        search_end = min(target_end + after, len(text))
+
+        # Scan the window in place (pos/endpos) instead of slicing it out
+        para_match = self._last_match(PARAGRAPH_PATTERN, text, search_start, search_end)
         if para_match:
-            return search_start + para_match[-1].end()
+            return para_match.end()
 
-        sent_match = list(re.finditer(r"[.!?][\s\n]", search_text))
+        sent_match = self._last_match(SENTENCE_PATTERN, text, search_start, search_end)
         if sent_match:
-            return search_start + sent_match[-1].end()
+            return sent_match.end()
 
-        ts_match = list(re.finditer(r"\[[\d:]+\]", search_text))
+        ts_match = self._last_match(TIMESTAMP_PATTERN, text, search_start, search_end)
         if ts_match:
-            return search_start + ts_match[-1].start()
+            return ts_match.start()
+
+        return None
 
-        return target_end
+    @staticmethod
+    def _last_match(
+        pattern: re.Pattern, text: str, pos: int, endpos: int
+    ) -> Optional[re.Match]:
+        """Last non-overlapping match of pattern in text[pos:endpos]"""
+        match = None
+        for match in pattern.finditer(text, pos, endpos):
+            pass
+        return match
 
     def _get_context_buffer(self, previous_text: str) -> str:
         """Extract last N chars from previous chunk as context"""
@@ -109,7 +184,7 @@ class SmartChunker:
             return previous_text
 
         text = previous_text[-self.overlap - 50:]
-        sent_match = re.search(r"[.!?]\s+", text)
+        sent_match = CONTEXT_SENTENCE_PATTERN.search(text)
 
         if sent_match:
             return text[sent_match.end():].strip()
@@ -118,5 +193,5 @@ class SmartChunker:
 
     def _extract_first_timestamp(self, text: str) -> Optional[str]:
         """Extract first timestamp [HH:MM:SS] from text"""
-        match = re.search(r"\[(\d{2}:\d{2}:\d{2})\]", text)
+        match = FIRST_TIMESTAMP_PATTERN.search(text)
         return match.group(1) if match else None
@@ -0,0 +1,239 @@
+"""Load-balance chunk requests across LLM endpoints with failover"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Optional, Callable, List, Dict, Any, TYPE_CHECKING
+
+from .chunker import Chunk
+from .llm_processor import LLMProcessor, ProcessedChunk
+
+if TYPE_CHECKING:
+    from .response_cache import ResponseCache
+
+
+@dataclass
+class EndpointStats:
+    """Per-endpoint usage counters"""
+    name: str
+    requests: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+
+
+class _Endpoint:
+    """One API key/model with its own concurrency limit"""
+
+    def __init__(self, name: str, processor: LLMProcessor, concurrency_limit: int):
+        self.name = name
+        self.processor = processor
+        self.concurrency_limit = max(1, concurrency_limit)
+        self.slots = threading.BoundedSemaphore(self.concurrency_limit)
+        self.in_flight = 0
+        self.failed_at = None  # time.monotonic() of the last retryable error
+        self.stats = EndpointStats(name=name)
+
+
+class LLMClientPool:
+    """
+    Pool of LLM endpoints (providers/keys) used as one processor.
+
+    Each chunk goes to the endpoint with the most free capacity, preferring
+    endpoints without a retryable error (rate limit, connection, server
+    error) in the last FAILURE_COOLDOWN seconds. On such an error the chunk
+    is retried on the next endpoint after exponential backoff; with
+    max_retries=0 the error is raised and the caller's retry lands on a
+    healthy endpoint instead.
+
+    Exposes process_chunk() like LLMProcessor, so it can stand in for one.
+    """
+
+    # Seconds an endpoint is passed over after a retryable error
+    FAILURE_COOLDOWN = 30.0
+
+    def __init__(
+        self,
+        endpoints: List[Dict[str, Any]],
+        max_retries: int = 3,
+        backoff_base: float = 2.0,
+        max_backoff: float = 10.0,
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache: Optional["ResponseCache"] = None
+    ):
+        """
+        Args:
+            endpoints: [{"model", "api_key", "concurrency_limit", "name",
+                "small_model"}, ...] (concurrency_limit defaults to 2, name to
+                the model; small_model routes short chunks to a cheaper model)
+            max_retries: Failover attempts per chunk after the first try
+            backoff_base: Base seconds for exponential backoff between attempts
+            max_backoff: Upper bound on backoff seconds
+            temperature: LLM temperature
+            max_tokens: Max output tokens per request
+            cache: Optional response cache shared by all endpoints
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._endpoints: List[_Endpoint] = []
+
+        for i, config in enumerate(endpoints):
+            processor = LLMProcessor(
+                api_key=config.get("api_key"),
+                model=config.get("model", "claude-3-5-sonnet-20241022"),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                cache=cache,
+                small_model=config.get("small_model"),
+                # Retries happen here, failing over to the next endpoint
+                max_attempts=1
+            )
+            name = config.get("name") or f"{i}:{processor.model}"
+            self._endpoints.append(
+                _Endpoint(name, processor, config.get("concurrency_limit", 2))
+            )
+
+    # Primary endpoint identifies the pool for state/config
+    @property
+    def primary(self) -> LLMProcessor:
+        return self._endpoints[0].processor
+
+    @property
+    def model(self) -> str:
+        return self.primary.model
+
+    @property
+    def small_model(self) -> Optional[str]:
+        return self.primary.small_model
+
+    @property
+    def provider(self):
+        return self.primary.provider
+
+    @property
+    def temperature(self) -> float:
+        return self.primary.temperature
+
+    @property
+    def max_tokens(self) -> int:
+        return self.primary.max_tokens
+
+    @property
+    def total_concurrency(self) -> int:
+        """Sum of endpoint concurrency limits"""
+        return sum(e.concurrency_limit for e in self._endpoints)
+
+    def route_model(self, chunk: Chunk) -> str:
+        """Model the primary endpoint would use for chunk"""
+        return self.primary.route_model(chunk)
+
+    def load_prompt_template(self, template_path: Optional[str] = None) -> str:
+        """Load prompt template from file"""
+        return self.primary.load_prompt_template(template_path)
+
+    def process_chunk(
+        self,
+        chunk: Chunk,
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English"
+    ) -> ProcessedChunk:
+        """Process chunk on the least loaded endpoint, failing over on errors"""
+        start = self._pick_endpoint()
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            endpoint = self._endpoints[(start + attempt) % len(self._endpoints)]
+
+            if attempt > 0:
+                time.sleep(min(self.backoff_base ** (attempt - 1), self.max_backoff))
+
+            with endpoint.slots:
+                with self._lock:
+                    endpoint.in_flight += 1
+                    endpoint.stats.requests += 1
+                try:
+                    result = endpoint.processor.process_chunk(
+                        chunk, prompt_template, video_title, output_language
+                    )
+                except Exception as e:
+                    with self._lock:
+                        endpoint.stats.failed += 1
+                    if not isinstance(e, endpoint.processor._get_retry_exceptions()):
+                        raise
+                    endpoint.failed_at = time.monotonic()
+                    last_error = e
+                    continue
+                finally:
+                    with self._lock:
+                        endpoint.in_flight -= 1
+
+            with self._lock:
+                endpoint.failed_at = None
+                endpoint.stats.succeeded += 1
+                endpoint.stats.input_tokens += result.input_tokens
+                endpoint.stats.output_tokens += result.output_tokens
+                endpoint.stats.cost += result.cost
+            return result
+
+        raise last_error
+
+    def process_all_chunks(
+        self,
+        chunks: List[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[ProcessedChunk]:
+        """Process all chunks across endpoints, returned in chunk order"""
+        results: List[Optional[ProcessedChunk]] = [None] * len(chunks)
+        if not chunks:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(self.total_concurrency, len(chunks)))
+        try:
+            futures = {
+                executor.submit(
+                    self.process_chunk, chunk, prompt_template, video_title, output_language
+                ): i
+                for i, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+
+                if progress_callback:
+                    progress_callback(done, len(chunks))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-endpoint usage counters"""
+        with self._lock:
+            return [
+                {**asdict(e.stats), "cost": round(e.stats.cost, 6)}
+                for e in self._endpoints
+            ]
+
+    def _pick_endpoint(self) -> int:
+        """Index of the healthiest endpoint with the most free capacity"""
+        cutoff = time.monotonic() - self.FAILURE_COOLDOWN
+        with self._lock:
+            rank = [
+                (
+                    e.failed_at is None or e.failed_at < cutoff,
+                    e.concurrency_limit - e.in_flight
+                )
+                for e in self._endpoints
+            ]
+        return max(range(len(rank)), key=lambda i: rank[i])
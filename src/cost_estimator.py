@@ -1,6 +1,8 @@
 """Estimate API costs before processing"""
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, NamedTuple, Optional
 from enum import Enum
 
 try:
@@ -10,12 +12,54 @@ except ImportError:
     HAS_TIKTOKEN = False
 
 
+@lru_cache(maxsize=1)
+def _load_encoder():
+    """
+    Load cl100k_base once per process (None if unavailable).
+
+    Shared by all estimators, so Streamlit reruns and sessions reuse one
+    BPE table. Encoding data is downloaded on first use; offline that fails,
+    and the failure is cached too so it isn't retried per call.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
 class LLMProvider(Enum):
     """Available LLM providers"""
     ANTHROPIC = "anthropic"
     DEEPSEEK = "deepseek"
 
 
+class ModelPricing(NamedTuple):
+    """Per-model rates (per 1K tokens) and expected seconds per chunk"""
+    input: float
+    output: float
+    time_per_chunk: int
+    provider: LLMProvider
+
+
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+
+# Single source of truth for model pricing (estimates and billed cost)
+MODEL_PRICING = MappingProxyType({
+    # Anthropic Claude
+    "claude-3-5-sonnet-20241022": ModelPricing(0.003, 0.015, 5, LLMProvider.ANTHROPIC),
+    "claude-3-5-haiku-20241022": ModelPricing(0.001, 0.005, 3, LLMProvider.ANTHROPIC),
+    # DeepSeek
+    "deepseek-chat": ModelPricing(0.00027, 0.0011, 3, LLMProvider.DEEPSEEK),
+    "deepseek-reasoner": ModelPricing(0.00056, 0.0022, 4, LLMProvider.DEEPSEEK),
+})
+
+
+@lru_cache(maxsize=None)
+def get_pricing(model: str) -> ModelPricing:
+    """Pricing for model (unknown models are priced as the default model)"""
+    return MODEL_PRICING.get(model, MODEL_PRICING[DEFAULT_MODEL])
+
+
 @dataclass
 class CostBreakdown:
     """Cost estimation breakdown"""
@@ -31,22 +75,20 @@ class CostBreakdown:
 class CostEstimator:
     """Estimate costs before processing"""
 
-    # Pricing per 1K tokens (input, output)
-    PRICING = {
-        # Anthropic Claude
-        "claude-3-5-sonnet-20241022": {"input": 0.003, "output": 0.015, "provider": LLMProvider.ANTHROPIC},
-        "claude-3-5-haiku-20241022": {"input": 0.001, "output": 0.005, "provider": LLMProvider.ANTHROPIC},
-        # DeepSeek
-        "deepseek-chat": {"input": 0.00027, "output": 0.0011, "provider": LLMProvider.DEEPSEEK},
-        "deepseek-reasoner": {"input": 0.00056, "output": 0.0022, "provider": LLMProvider.DEEPSEEK},
-    }
+    # Read-only views of MODEL_PRICING: per 1K tokens (input, output)
+    PRICING = MappingProxyType({
+        model: MappingProxyType(
+            {"input": p.input, "output": p.output, "provider": p.provider}
+        )
+        for model, p in MODEL_PRICING.items()
+    })
 
-    TIME_PER_CHUNK = {
-        "claude-3-5-sonnet-20241022": 5,
-        "claude-3-5-haiku-20241022": 3,
-        "deepseek-chat": 3,
-        "deepseek-reasoner": 4,
-    }
+    # Anthropic Message Batches API discount
+    BATCH_DISCOUNT = 0.5
+
+    TIME_PER_CHUNK = MappingProxyType({
+        model: p.time_per_chunk for model, p in MODEL_PRICING.items()
+    })
 
     # Provider groupings for UI
     PROVIDER_MODELS = {
@@ -57,22 +99,19 @@ class CostEstimator:
     @staticmethod
     def get_provider(model: str) -> LLMProvider:
         """Get provider for a model"""
-        model_info = CostEstimator.PRICING.get(model)
-        if model_info:
-            return model_info["provider"]
-        return LLMProvider.ANTHROPIC
+        return get_pricing(model).provider
 
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self, model: str = DEFAULT_MODEL):
         self.model = model
         self._encoder = None
 
     @property
     def encoder(self):
-        """Lazy load tiktoken encoder"""
+        """Lazy load shared tiktoken encoder (None if unavailable)"""
         if not HAS_TIKTOKEN:
             return None
         if self._encoder is None:
-            self._encoder = tiktoken.get_encoding("cl100k_base")
+            self._encoder = _load_encoder()
         return self._encoder
 
     def count_tokens(self, text: str) -> int:
@@ -95,33 +134,61 @@ class CostEstimator:
         Returns:
             (input_tokens, estimated_output_tokens)
         """
-        input_tokens = self.count_tokens(prompt_template) + self.count_tokens(chunk_text)
-        output_estimate = int(self.count_tokens(chunk_text) * 0.8)
+        chunk_tokens = self.count_tokens(chunk_text)
+        input_tokens = self.count_tokens(prompt_template) + chunk_tokens
+        output_estimate = int(chunk_tokens * 0.8)
         return input_tokens, output_estimate
 
+    def count_chunk_tokens(self, chunks: list) -> List[int]:
+        """Count tokens of each chunk's LLM input (content + context)"""
+        return [self.count_tokens(chunk.full_text_for_llm) for chunk in chunks]
+
     def estimate_total(
         self,
         chunks: list,
-        prompt_template: str
+        prompt_template: str,
+        batch_mode: bool = False
+    ) -> CostBreakdown:
+        """Estimate total cost for all chunks (batch_mode applies batch discount)"""
+        return self.estimate_from_counts(
+            self.count_chunk_tokens(chunks),
+            self.count_tokens(prompt_template),
+            batch_mode=batch_mode
+        )
+
+    def estimate_from_counts(
+        self,
+        chunk_tokens: List[int],
+        prompt_tokens: int,
+        batch_mode: bool = False,
+        models: Optional[List[str]] = None
     ) -> CostBreakdown:
-        """Estimate total cost for all chunks"""
-        total_input = 0
-        total_output = 0
-
-        for chunk in chunks:
-            input_t, output_t = self.estimate_chunk_tokens(
-                chunk.full_text_for_llm,
-                prompt_template
-            )
-            total_input += input_t
-            total_output += output_t
-
-        prices = self.PRICING.get(self.model, {"input": 0.003, "output": 0.015})
-        input_cost = (total_input / 1000) * prices["input"]
-        output_cost = (total_output / 1000) * prices["output"]
-
-        time_per_chunk = self.TIME_PER_CHUNK.get(self.model, 5)
-        total_time_seconds = len(chunks) * time_per_chunk
+        """
+        Estimate total cost from precomputed token counts.
+
+        Counts don't depend on the model, so callers can tokenize once and
+        re-price for each model without re-encoding. models gives the model
+        of each chunk when some are routed elsewhere (default: self.model).
+        """
+        total_input = prompt_tokens * len(chunk_tokens) + sum(chunk_tokens)
+        total_output = sum(int(tokens * 0.8) for tokens in chunk_tokens)
+
+        if models is None:
+            prices = get_pricing(self.model)
+            input_cost = (total_input / 1000) * prices.input
+            output_cost = (total_output / 1000) * prices.output
+            total_time_seconds = len(chunk_tokens) * prices.time_per_chunk
+        else:
+            input_cost = output_cost = total_time_seconds = 0.0
+            for tokens, model in zip(chunk_tokens, models):
+                prices = get_pricing(model)
+                input_cost += ((prompt_tokens + tokens) / 1000) * prices.input
+                output_cost += (int(tokens * 0.8) / 1000) * prices.output
+                total_time_seconds += prices.time_per_chunk
+        if batch_mode:
+            input_cost *= self.BATCH_DISCOUNT
+            output_cost *= self.BATCH_DISCOUNT
+
         time_minutes = total_time_seconds / 60
 
         return CostBreakdown(
@@ -130,7 +197,7 @@ class CostEstimator:
             input_cost=round(input_cost, 4),
             output_cost=round(output_cost, 4),
             total_cost=round(input_cost + output_cost, 4),
-            chunks=len(chunks),
+            chunks=len(chunk_tokens),
             processing_time_minutes=round(time_minutes, 1)
         )
 
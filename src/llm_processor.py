@@ -1,25 +1,55 @@
 """Process chunks via Claude/DeepSeek API with retry logic"""
+import asyncio
+import importlib.util
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Optional, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional, Callable, Any, TYPE_CHECKING
 from pathlib import Path
-from enum import Enum
 
-import anthropic
 from tenacity import (
-    retry,
+    AsyncRetrying,
+    Retrying,
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type
 )
 
 from .chunker import Chunk
+from .cost_estimator import LLMProvider, MODEL_PRICING, get_pricing
 
+if TYPE_CHECKING:
+    from .response_cache import ResponseCache
 
-class LLMProvider(Enum):
-    """Available LLM providers"""
-    ANTHROPIC = "anthropic"
-    DEEPSEEK = "deepseek"
+
+def _lazy_import(name: str):
+    """
+    Import module on first attribute access.
+
+    SDK imports take seconds on a cold start; the app shouldn't pay that
+    on reruns that never call a provider.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+anthropic = _lazy_import("anthropic")
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HAS_H2 = importlib.util.find_spec("h2") is not None
 
 
 @dataclass
@@ -33,6 +63,7 @@ class ProcessedChunk:
     cost: float
     model: str
     provider: str
+    cached: bool = False  # Served from the response cache, no API call
 
 
 class ProcessingError(Exception):
@@ -45,6 +76,97 @@ class ProcessingError(Exception):
         super().__init__(f"Chunk {chunk_index}: {message}")
 
 
+@lru_cache(maxsize=8)
+def _shared_client(provider: LLMProvider, api_key: str):
+    """
+    Build one API client per provider + key.
+
+    Clients are thread-safe and keep an HTTP connection pool, so sharing
+    them across processors (reruns, pool endpoints) avoids a new TCP/TLS
+    handshake per job.
+    """
+    if provider == LLMProvider.ANTHROPIC:
+        return anthropic.Anthropic(api_key=api_key, **_http_client_option(anthropic))
+    elif provider == LLMProvider.DEEPSEEK:
+        import openai
+        return openai.OpenAI(
+            api_key=api_key,
+            base_url="https://api.deepseek.com",
+            **_http_client_option(openai)
+        )
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+
+def _http_client_option(sdk: Any, asynchronous: bool = False) -> dict:
+    """
+    SDK client kwargs for an HTTP/2 transport, if h2 is available.
+
+    HTTP/2 multiplexes concurrent chunk requests over one kept-alive
+    connection. The SDK's default httpx client (pool limits, timeouts)
+    is kept otherwise.
+    """
+    if not HAS_H2:
+        return {}
+    factory = sdk.DefaultAsyncHttpxClient if asynchronous else sdk.DefaultHttpxClient
+    return {"http_client": factory(http2=True)}
+
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After header), if any"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # HTTP-date form
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _wait_retry_after(fallback: Callable, max_wait: float = 60.0) -> Callable:
+    """Tenacity wait honoring Retry-After (capped), else the fallback wait"""
+    def wait(retry_state) -> float:
+        delay = _retry_after(retry_state.outcome.exception())
+        if delay is None:
+            return fallback(retry_state)
+        return min(delay, max_wait)
+    return wait
+
+
+@lru_cache(maxsize=32)
+def _template_parts(template: str, video_title: str, output_language: str) -> tuple[str, ...]:
+    """
+    Template with title/language filled in, split at {{chunkText}}.
+
+    Filled once per job instead of re-scanning the whole template for
+    every chunk; the prompt is then the chunk text joined between parts.
+    """
+    filled = template.replace("{{fileName}}", video_title)
+    filled = filled.replace("{{outputLanguage}}", output_language)
+    return tuple(filled.split("{{chunkText}}"))
+
+
+def _cache_usage(usage: Any) -> tuple[int, int]:
+    """(cache write, cache read) prompt tokens of an Anthropic usage block"""
+    # Absent (or None) when caching wasn't used or on older SDKs
+    counts = (
+        getattr(usage, "cache_creation_input_tokens", 0),
+        getattr(usage, "cache_read_input_tokens", 0)
+    )
+    return tuple(n if isinstance(n, int) else 0 for n in counts)
+
+
 class LLMProcessor:
     """Process transcript chunks via Claude or DeepSeek API"""
 
@@ -54,21 +176,18 @@ class LLMProcessor:
         LLMProvider.DEEPSEEK: "DEEPSEEK_API_KEY"
     }
 
-    # Model to provider mapping
-    MODEL_PROVIDER = {
-        "claude-3-5-sonnet-20241022": LLMProvider.ANTHROPIC,
-        "claude-3-5-haiku-20241022": LLMProvider.ANTHROPIC,
-        "deepseek-chat": LLMProvider.DEEPSEEK,
-        "deepseek-reasoner": LLMProvider.DEEPSEEK,
-    }
+    # Model to provider mapping (prices live in cost_estimator.MODEL_PRICING)
+    MODEL_PROVIDER = {model: p.provider for model, p in MODEL_PRICING.items()}
 
-    # Pricing per 1K tokens
-    PRICING = {
-        "claude-3-5-sonnet-20241022": {"input": 0.003, "output": 0.015},
-        "claude-3-5-haiku-20241022": {"input": 0.001, "output": 0.005},
-        "deepseek-chat": {"input": 0.00027, "output": 0.0011},
-        "deepseek-reasoner": {"input": 0.00056, "output": 0.0022},
-    }
+    # Message Batches API bills at half the standard rate
+    BATCH_DISCOUNT = 0.5
+    # Jobs this large are worth the batch turnaround when latency doesn't matter
+    BATCH_THRESHOLD = 100
+    # Prompt caching: writes bill at 125% of the input rate, reads at 10%
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.1
+    # Chunks shorter than this (with context) go to small_model when set
+    ROUTE_MAX_CHARS = 2000
 
     def __init__(
         self,
@@ -76,7 +195,11 @@ class LLMProcessor:
         model: str = "claude-3-5-sonnet-20241022",
         provider: Optional[LLMProvider] = None,
         temperature: float = 0.3,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache: Optional["ResponseCache"] = None,
+        small_model: Optional[str] = None,
+        stream: bool = False,
+        max_attempts: int = 3
     ):
         """
         Args:
@@ -85,14 +208,27 @@ class LLMProcessor:
             provider: LLM provider (inferred from model if not specified)
             temperature: Lower = more deterministic
             max_tokens: Max output tokens per request
+            cache: Optional response cache; hits skip the API call
+            small_model: Cheaper model of the same provider for short chunks
+                (see route_model)
+            stream: Stream responses (needed for very large max_tokens, which
+                the SDKs refuse to send as one blocking request)
+            max_attempts: Tries per chunk on rate limit, connection and server
+                errors (1 = no retries, e.g. when a caller fails over itself)
         """
         # Determine provider from model if not specified
         if provider is None:
             provider = self.MODEL_PROVIDER.get(model, LLMProvider.ANTHROPIC)
+        if small_model is not None and self.MODEL_PROVIDER.get(small_model) != provider:
+            raise ValueError(f"small_model must be a {provider.value} model: {small_model}")
         self.provider = provider
         self.model = model
+        self.small_model = small_model
+        self.stream = stream
+        self.max_attempts = max(1, max_attempts)
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
 
         # Get API key
         env_key = self.PROVIDER_ENV_KEYS[provider]
@@ -103,18 +239,36 @@ class LLMProcessor:
         # Initialize provider-specific client
         self.client = self._init_client()
 
-    def _init_client(self):
-        """Initialize provider-specific API client"""
-        if self.provider == LLMProvider.ANTHROPIC:
-            return anthropic.Anthropic(api_key=self.api_key)
-        elif self.provider == LLMProvider.DEEPSEEK:
-            from openai import OpenAI
-            return OpenAI(
-                api_key=self.api_key,
-                base_url="https://api.deepseek.com"
+        # Resolve provider dispatch once instead of branching per chunk
+        self._params, self._call, self._call_async = {
+            LLMProvider.ANTHROPIC: (
+                self._anthropic_params, self._call_anthropic, self._call_anthropic_async
+            ),
+            LLMProvider.DEEPSEEK: (
+                self._deepseek_params, self._call_deepseek, self._call_deepseek_async
             )
-        else:
-            raise ValueError(f"Unsupported provider: {self.provider}")
+        }[provider]
+        self._retry_exceptions = None
+
+    def _init_client(self):
+        """Get provider-specific API client (shared per provider + key)"""
+        return _shared_client(self.provider, self.api_key)
+
+    def route_model(self, chunk: Chunk) -> str:
+        """Model for chunk: small_model for short chunks, else the configured model"""
+        return self.route_for(chunk, self.model, self.small_model)
+
+    @classmethod
+    def route_for(cls, chunk: Chunk, model: str, small_model: Optional[str] = None) -> str:
+        """Routing of route_model without a processor (e.g. for cache keys and estimates)"""
+        if small_model and len(chunk.full_text_for_llm) < cls.ROUTE_MAX_CHARS:
+            return small_model
+        return model
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the provider offers a batch API (Anthropic Message Batches)"""
+        return self.provider == LLMProvider.ANTHROPIC
 
     def load_prompt_template(
         self, template_path: Optional[str] = None
@@ -132,21 +286,34 @@ class LLMProcessor:
             return f.read()
 
     def _get_retry_exceptions(self):
-        """Get retryable exceptions for current provider"""
-        if self.provider == LLMProvider.ANTHROPIC:
-            return (anthropic.RateLimitError, anthropic.APIConnectionError,
-                    anthropic.InternalServerError)
-        elif self.provider == LLMProvider.DEEPSEEK:
-            # OpenAI exceptions for DeepSeek
-            from openai import RateLimitError, APIConnectionError, InternalServerError
-            return (RateLimitError, APIConnectionError, InternalServerError)
-        return ()
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(())
-    )
+        """Get retryable exceptions for current provider (resolved once)"""
+        if self._retry_exceptions is None:
+            if self.provider == LLMProvider.ANTHROPIC:
+                self._retry_exceptions = (anthropic.RateLimitError, anthropic.APIConnectionError,
+                                          anthropic.InternalServerError)
+            else:
+                # OpenAI exceptions for DeepSeek
+                from openai import RateLimitError, APIConnectionError, InternalServerError
+                self._retry_exceptions = (RateLimitError, APIConnectionError, InternalServerError)
+        return self._retry_exceptions
+
+    def _retry_policy(self) -> dict:
+        """
+        Retrying/AsyncRetrying arguments for this provider's transient errors.
+
+        Waits follow the server's Retry-After when a 429/503 carries one, so
+        throttled workers resume when capacity is back rather than on a guess.
+
+        Built per call: the retryable exceptions depend on the provider, and
+        controllers keep per-run state that threads mustn't share.
+        """
+        return {
+            "stop": stop_after_attempt(self.max_attempts),
+            "wait": _wait_retry_after(wait_exponential(multiplier=1, min=2, max=10)),
+            "retry": retry_if_exception_type(self._get_retry_exceptions()),
+            "reraise": True
+        }
+
     def process_chunk(
         self,
         chunk: Chunk,
@@ -157,6 +324,9 @@ class LLMProcessor:
         """
         Process single chunk through LLM API.
 
+        Rate limit, connection and server errors are retried with
+        exponential backoff, up to max_attempts tries.
+
         Args:
             chunk: Chunk object with text and context
             prompt_template: Template with {{fileName}}, {{chunkText}}, {{outputLanguage}} placeholders
@@ -166,81 +336,310 @@ class LLMProcessor:
         Returns:
             ProcessedChunk with cleaned text and usage stats
         """
-        # Build final prompt
-        user_message = self._build_prompt(
-            chunk, prompt_template, video_title, output_language
-        )
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                self.route_model(chunk), chunk, prompt_template, video_title, output_language,
+                self.temperature
+            )
+            cached = self.cache.get(cache_key, chunk)
+            if cached is not None:
+                return cached
 
         # Call provider API
-        if self.provider == LLMProvider.ANTHROPIC:
-            return self._call_anthropic(chunk, user_message)
-        elif self.provider == LLMProvider.DEEPSEEK:
-            return self._call_deepseek(chunk, user_message)
-        else:
-            raise ValueError(f"Unsupported provider: {self.provider}")
+        params = self._params(chunk, prompt_template, video_title, output_language)
+        for attempt in Retrying(**self._retry_policy()):
+            with attempt:
+                result = self._call(chunk, params)
+        self._check_output(chunk, result)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    @staticmethod
+    def _check_output(chunk: Chunk, result: ProcessedChunk) -> None:
+        """Reject responses the chunk can't use, before they're cached"""
+        if not chunk.accepts_output(result.cleaned_text):
+            raise ProcessingError(
+                chunk.index, "Response sections don't match the packed chunks", recoverable=True
+            )
 
-    def _call_anthropic(self, chunk: Chunk, user_message: str) -> ProcessedChunk:
-        """Call Anthropic API"""
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
-            messages=[{"role": "user", "content": user_message}]
+    def _request_params(self, chunk: Chunk, user_message: str) -> dict:
+        """Message request shared by both providers' APIs"""
+        return {
+            "model": self.route_model(chunk),
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": user_message}]
+        }
+
+    def _anthropic_params(
+        self,
+        chunk: Chunk,
+        template: str,
+        video_title: str,
+        output_language: str = "English"
+    ) -> dict:
+        """
+        Anthropic request with the static part of the prompt as a cached system block.
+
+        Everything before {{chunkText}} is identical for every chunk of a job,
+        so it's marked for prompt caching and later chunks read it at 10% of
+        the input price. Prefixes below the model's cacheable minimum (~1024
+        tokens) are simply billed at the normal rate.
+        """
+        prefix, user_message = self._split_prompt(chunk, template, video_title, output_language)
+        params = self._request_params(chunk, user_message)
+        if prefix:
+            params["system"] = [{
+                "type": "text",
+                "text": prefix,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return params
+
+    def _deepseek_params(
+        self,
+        chunk: Chunk,
+        template: str,
+        video_title: str,
+        output_language: str = "English"
+    ) -> dict:
+        """DeepSeek request (its context cache matches shared prefixes on its own)"""
+        return self._request_params(
+            chunk, self._build_prompt(chunk, template, video_title, output_language)
         )
 
-        cleaned_text = response.content[0].text
+    def _call_anthropic(self, chunk: Chunk, params: dict) -> ProcessedChunk:
+        """Call Anthropic API"""
+        if self.stream:
+            with self.client.messages.stream(**params) as stream:
+                return self._anthropic_result(chunk, stream.get_final_message())
+
+        response = self.client.messages.create(**params)
+        return self._anthropic_result(chunk, response)
+
+    def _call_deepseek(self, chunk: Chunk, params: dict) -> ProcessedChunk:
+        """Call DeepSeek API (OpenAI-compatible)"""
+        if self.stream:
+            parts = []
+            usage = None
+            for event in self.client.chat.completions.create(
+                **params, stream=True, stream_options={"include_usage": True}
+            ):
+                if event.choices and event.choices[0].delta.content:
+                    parts.append(event.choices[0].delta.content)
+                # Usage arrives on the last event, which has no choices
+                if event.usage:
+                    usage = event.usage
+            return self._deepseek_result(chunk, "".join(parts), usage)
+
+        response = self.client.chat.completions.create(**params)
+        return self._deepseek_result(chunk, response.choices[0].message.content, response.usage)
+
+    async def _call_anthropic_async(
+        self, client: Any, chunk: Chunk, params: dict
+    ) -> ProcessedChunk:
+        """Call Anthropic API with an async client"""
+        if self.stream:
+            async with client.messages.stream(**params) as stream:
+                return self._anthropic_result(chunk, await stream.get_final_message())
+
+        response = await client.messages.create(**params)
+        return self._anthropic_result(chunk, response)
+
+    async def _call_deepseek_async(
+        self, client: Any, chunk: Chunk, params: dict
+    ) -> ProcessedChunk:
+        """Call DeepSeek API (OpenAI-compatible) with an async client"""
+        if self.stream:
+            parts = []
+            usage = None
+            async for event in await client.chat.completions.create(
+                **params, stream=True, stream_options={"include_usage": True}
+            ):
+                if event.choices and event.choices[0].delta.content:
+                    parts.append(event.choices[0].delta.content)
+                # Usage arrives on the last event, which has no choices
+                if event.usage:
+                    usage = event.usage
+            return self._deepseek_result(chunk, "".join(parts), usage)
+
+        response = await client.chat.completions.create(**params)
+        return self._deepseek_result(chunk, response.choices[0].message.content, response.usage)
+
+    def _anthropic_result(self, chunk: Chunk, message: Any, batch: bool = False) -> ProcessedChunk:
+        """Build result from an Anthropic message, billing prompt cache usage"""
+        model = self.route_model(chunk)
+        usage = message.usage
+        cache_write, cache_read = _cache_usage(usage)
         cost = self._calculate_cost(
-            response.usage.input_tokens,
-            response.usage.output_tokens
+            usage.input_tokens, usage.output_tokens, batch, cache_write, cache_read, model
         )
 
         return ProcessedChunk(
             chunk_index=chunk.index,
             original_text=chunk.text,
-            cleaned_text=cleaned_text,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            cleaned_text=message.content[0].text,
+            input_tokens=usage.input_tokens + cache_write + cache_read,
+            output_tokens=usage.output_tokens,
             cost=cost,
-            model=self.model,
+            model=model,
             provider=self.provider.value
         )
 
-    def _call_deepseek(self, chunk: Chunk, user_message: str) -> ProcessedChunk:
-        """Call DeepSeek API (OpenAI-compatible)"""
-        response = self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
-            messages=[{"role": "user", "content": user_message}]
-        )
-
-        cleaned_text = response.choices[0].message.content
+    def _deepseek_result(self, chunk: Chunk, cleaned_text: str, usage: Any) -> ProcessedChunk:
+        """Build result from OpenAI-compatible completion text and usage"""
+        model = self.route_model(chunk)
         cost = self._calculate_cost(
-            response.usage.prompt_tokens,
-            response.usage.completion_tokens
+            usage.prompt_tokens,
+            usage.completion_tokens,
+            model=model
         )
 
         return ProcessedChunk(
             chunk_index=chunk.index,
             original_text=chunk.text,
             cleaned_text=cleaned_text,
-            input_tokens=response.usage.prompt_tokens,
-            output_tokens=response.usage.completion_tokens,
+            input_tokens=usage.prompt_tokens,
+            output_tokens=usage.completion_tokens,
             cost=cost,
-            model=self.model,
+            model=model,
             provider=self.provider.value
         )
 
+    def _init_async_client(self):
+        """
+        New async API client.
+
+        Async clients keep connections bound to the event loop that opened
+        them, so they're created per run rather than shared like sync ones.
+        """
+        if self.provider == LLMProvider.ANTHROPIC:
+            return anthropic.AsyncAnthropic(
+                api_key=self.api_key, **_http_client_option(anthropic, asynchronous=True)
+            )
+        elif self.provider == LLMProvider.DEEPSEEK:
+            import openai
+            return openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url="https://api.deepseek.com",
+                **_http_client_option(openai, asynchronous=True)
+            )
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    async def process_chunk_async(
+        self,
+        chunk: Chunk,
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        client: Any = None
+    ) -> ProcessedChunk:
+        """
+        Process single chunk on the event loop.
+
+        Rate limit, connection and server errors are retried with
+        exponential backoff.
+
+        Args:
+            client: Async client to reuse (from _init_async_client); a
+                temporary one is opened if omitted
+        """
+        if client is None:
+            async with self._init_async_client() as client:
+                return await self.process_chunk_async(
+                    chunk, prompt_template, video_title, output_language, client
+                )
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                self.route_model(chunk), chunk, prompt_template, video_title, output_language,
+                self.temperature
+            )
+            cached = self.cache.get(cache_key, chunk)
+            if cached is not None:
+                return cached
+
+        params = self._params(chunk, prompt_template, video_title, output_language)
+
+        async for attempt in AsyncRetrying(**self._retry_policy()):
+            with attempt:
+                result = await self._call_async(client, chunk, params)
+        self._check_output(chunk, result)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def process_all_chunks_async(
+        self,
+        chunks: list[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_concurrency: int = 8
+    ) -> list[ProcessedChunk]:
+        """
+        Process all chunks concurrently on one event loop.
+
+        A semaphore bounds in-flight requests to max_concurrency; results are
+        returned in chunk order. From sync code, run it with asyncio.run().
+        """
+        if not chunks:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        done = 0
+        failed = False
+
+        async with self._init_async_client() as client:
+            async def run(chunk: Chunk) -> ProcessedChunk:
+                nonlocal done, failed
+                async with semaphore:
+                    # A waiting chunk may get the slot before gather cancels it
+                    if failed:
+                        raise asyncio.CancelledError()
+                    try:
+                        result = await self.process_chunk_async(
+                            chunk, prompt_template, video_title, output_language, client
+                        )
+                    except Exception:
+                        failed = True
+                        raise
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(chunks))
+                return result
+
+            tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+            try:
+                return list(await asyncio.gather(*tasks))
+            except BaseException:
+                # On failure, drop waiting chunks instead of paying for them
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
     def process_all_chunks(
         self,
         chunks: list[Chunk],
         prompt_template: str,
         video_title: str = "Untitled",
         output_language: str = "English",
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_concurrency: int = 1
     ) -> list[ProcessedChunk]:
         """
-        Process all chunks sequentially with progress tracking.
+        Process all chunks with progress tracking.
+
+        API calls are network-bound, so with max_concurrency > 1 chunks are
+        dispatched from a thread pool to overlap round-trips. Results are
+        always returned in chunk order.
 
         Args:
             chunks: List of Chunk objects
@@ -248,21 +647,189 @@ class LLMProcessor:
             video_title: Video title
             output_language: Output language (default: "English")
             progress_callback: fn(current, total) called after each chunk
+            max_concurrency: Max in-flight API requests (1 = sequential)
 
         Returns:
             List of ProcessedChunk objects
         """
+        if max_concurrency <= 1 or len(chunks) <= 1:
+            results = []
+
+            for i, chunk in enumerate(chunks):
+                result = self.process_chunk(chunk, prompt_template, video_title, output_language)
+                results.append(result)
+
+                if progress_callback:
+                    progress_callback(i + 1, len(chunks))
+
+            return results
+
+        results: list[Optional[ProcessedChunk]] = [None] * len(chunks)
+        executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks)))
+        try:
+            futures = {
+                executor.submit(
+                    self.process_chunk, chunk, prompt_template, video_title, output_language
+                ): i
+                for i, chunk in enumerate(chunks)
+            }
+            # Callback runs on the calling thread, so UI updates stay safe
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+
+                if progress_callback:
+                    progress_callback(done, len(chunks))
+        finally:
+            # On failure, drop queued chunks instead of paying for them
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    def submit_batch(
+        self,
+        chunks: list[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English"
+    ) -> str:
+        """
+        Submit all chunks as one Anthropic Message Batch.
+
+        Batches are billed at 50% of the standard rate but may take up to
+        24h to finish. Poll with get_batch_status() and fetch results with
+        collect_batch_results().
+
+        Returns:
+            Batch id
+        """
+        if not self.supports_batch:
+            raise ValueError(f"Batch mode not supported for provider: {self.provider.value}")
+
+        requests = [
+            {
+                "custom_id": self._batch_custom_id(chunk),
+                "params": self._anthropic_params(
+                    chunk, prompt_template, video_title, output_language
+                )
+            }
+            for chunk in chunks
+        ]
+
+        batch = self.client.messages.batches.create(requests=requests)
+        return batch.id
+
+    def get_batch_status(self, batch_id: str) -> dict[str, Any]:
+        """Get processing status and request counts for a submitted batch"""
+        batch = self.client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+
+        return {
+            "status": batch.processing_status,
+            "processing": counts.processing,
+            "succeeded": counts.succeeded,
+            "errored": counts.errored,
+            "canceled": counts.canceled,
+            "expired": counts.expired,
+            "created_at": batch.created_at
+        }
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        total: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 300.0
+    ) -> dict[str, Any]:
+        """
+        Block until a batch has ended.
+
+        The poll interval doubles while nothing new has finished (up to
+        max_poll_interval), so day-long batches don't poll every 30s.
+
+        Returns:
+            Final batch status
+        """
+        interval = poll_interval
+        last_done = -1
+
+        while True:
+            status = self.get_batch_status(batch_id)
+            done = total - status["processing"]
+            if progress_callback:
+                progress_callback(done, total)
+            if status["status"] == "ended":
+                return status
+
+            if done > last_done:
+                interval = poll_interval
+            else:
+                interval = min(interval * 2, max_poll_interval)
+            last_done = done
+            time.sleep(interval)
+
+    def collect_batch_results(
+        self,
+        batch_id: str,
+        chunks: list[Chunk]
+    ) -> tuple[list[ProcessedChunk], dict[int, str]]:
+        """
+        Fetch results of an ended batch, keyed back to chunks via custom_id.
+
+        Returns:
+            (processed_chunks in chunk order, {chunk_index: failure type})
+        """
+        by_custom_id = {self._batch_custom_id(chunk): chunk for chunk in chunks}
         results = []
+        failed = {}
 
-        for i, chunk in enumerate(chunks):
-            result = self.process_chunk(chunk, prompt_template, video_title, output_language)
+        for entry in self.client.messages.batches.results(batch_id):
+            chunk = by_custom_id.get(entry.custom_id)
+            if chunk is None:
+                continue
+
+            if entry.result.type != "succeeded":
+                failed[chunk.index] = entry.result.type
+                continue
+
+            result = self._anthropic_result(chunk, entry.result.message, batch=True)
+            if not chunk.accepts_output(result.cleaned_text):
+                failed[chunk.index] = "mismatched_sections"
+                continue
             results.append(result)
 
-            if progress_callback:
-                progress_callback(i + 1, len(chunks))
+        results.sort(key=lambda r: r.chunk_index)
+        return results, failed
+
+    def process_all_chunks_batch(
+        self,
+        chunks: list[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        poll_interval: float = 30.0
+    ) -> list[ProcessedChunk]:
+        """
+        Process all chunks via the Message Batches API, blocking until done.
+
+        Raises:
+            ProcessingError: If any request in the batch did not succeed
+        """
+        batch_id = self.submit_batch(chunks, prompt_template, video_title, output_language)
+        self.wait_for_batch(batch_id, len(chunks), progress_callback, poll_interval)
+
+        results, failed = self.collect_batch_results(batch_id, chunks)
+        if failed:
+            index = min(failed)
+            raise ProcessingError(index, f"Batch request {failed[index]}", recoverable=True)
 
         return results
 
+    def _batch_custom_id(self, chunk: Chunk) -> str:
+        """Batch request id used to key results back to a chunk"""
+        return f"chunk_{chunk.index}"
+
     def _build_prompt(
         self,
         chunk: Chunk,
@@ -271,29 +838,70 @@ class LLMProcessor:
         output_language: str = "English"
     ) -> str:
         """Build final prompt from template and chunk"""
-        # Get chunk text with context
-        chunk_text = chunk.full_text_for_llm
+        parts = _template_parts(template, video_title, output_language)
+        return chunk.full_text_for_llm.join(parts)
 
-        # Replace placeholders
-        prompt = template.replace("{{fileName}}", video_title)
-        prompt = prompt.replace("{{chunkText}}", chunk_text)
-        prompt = prompt.replace("{{outputLanguage}}", output_language)
+    def _split_prompt(
+        self,
+        chunk: Chunk,
+        template: str,
+        video_title: str,
+        output_language: str = "English"
+    ) -> tuple[str, str]:
+        """
+        Split the built prompt at {{chunkText}}.
 
-        return prompt
+        Returns:
+            (static prefix shared by all chunks, per-chunk remainder)
+        """
+        parts = _template_parts(template, video_title, output_language)
+        if len(parts) == 1:
+            return "", parts[0]
+        return parts[0], chunk.full_text_for_llm.join(("",) + parts[1:])
 
     def _calculate_cost(
-        self, input_tokens: int, output_tokens: int
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        batch: bool = False,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        model: Optional[str] = None
     ) -> float:
-        """Calculate cost based on token usage"""
-        prices = self.PRICING.get(self.model, self.PRICING["claude-3-5-sonnet-20241022"])
+        """Calculate cost based on token usage (input_tokens excludes cached prompt tokens)"""
+        prices = get_pricing(model or self.model)
 
         cost = (
-            (input_tokens / 1000) * prices["input"] +
-            (output_tokens / 1000) * prices["output"]
+            (input_tokens / 1000) * prices.input +
+            (cache_write_tokens / 1000) * prices.input * self.CACHE_WRITE_MULTIPLIER +
+            (cache_read_tokens / 1000) * prices.input * self.CACHE_READ_MULTIPLIER +
+            (output_tokens / 1000) * prices.output
         )
+        if batch:
+            cost *= self.BATCH_DISCOUNT
         return round(cost, 6)
 
 
+def summarize_results(results: list[ProcessedChunk], model: str) -> dict:
+    """Usage totals for results, in one pass over them"""
+    input_tokens = output_tokens = cache_hits = 0
+    cost = 0.0
+    for r in results:
+        input_tokens += r.input_tokens
+        output_tokens += r.output_tokens
+        cost += r.cost
+        cache_hits += r.cached
+
+    return {
+        "chunks_processed": len(results),
+        "total_input_tokens": input_tokens,
+        "total_output_tokens": output_tokens,
+        "total_cost": round(cost, 4),
+        "model": model,
+        "cache_hits": cache_hits
+    }
+
+
 # Convenience function for single-file processing
 def process_transcript(
     chunks: list[Chunk],
@@ -302,32 +910,68 @@ def process_transcript(
     model: str = "claude-3-5-sonnet-20241022",
     prompt_path: Optional[str] = None,
     output_language: str = "English",
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_concurrency: int = 4,
+    batch_mode: Optional[bool] = False,
+    cache: Optional["ResponseCache"] = None,
+    fallback_endpoints: Optional[list[dict]] = None,
+    small_model: Optional[str] = None
 ) -> tuple[list[ProcessedChunk], dict]:
     """
     Process entire transcript and return results with summary.
 
+    Args:
+        max_concurrency: Max in-flight API requests (1 = sequential)
+        batch_mode: Use the Message Batches API (50% cheaper, Anthropic only);
+            None picks it for jobs of at least LLMProcessor.BATCH_THRESHOLD
+            chunks when the provider supports it
+        cache: Optional response cache; unchanged chunks are not re-billed
+        fallback_endpoints: Extra {"model", "api_key", "concurrency_limit"}
+            endpoints to load-balance and fail over across
+        small_model: Cheaper model for short chunks (see LLMProcessor.route_model)
+
     Returns:
         (processed_chunks, summary_dict)
     """
-    processor = LLMProcessor(api_key=api_key, model=model)
-    template = processor.load_prompt_template(prompt_path)
+    if batch_mode is None:
+        batch_mode = (
+            len(chunks) >= LLMProcessor.BATCH_THRESHOLD
+            and LLMProcessor.MODEL_PROVIDER.get(model) == LLMProvider.ANTHROPIC
+        )
 
-    results = processor.process_all_chunks(
-        chunks, template, video_title, output_language, progress_callback
-    )
+    pool = None
+    if fallback_endpoints and not batch_mode:
+        from .client_pool import LLMClientPool
+
+        primary = {
+            "model": model,
+            "api_key": api_key,
+            "concurrency_limit": max_concurrency,
+            "small_model": small_model
+        }
+        pool = LLMClientPool([primary] + list(fallback_endpoints), cache=cache)
+        template = pool.load_prompt_template(prompt_path)
+        results = pool.process_all_chunks(
+            chunks, template, video_title, output_language, progress_callback
+        )
+    else:
+        processor = LLMProcessor(
+            api_key=api_key, model=model, cache=cache, small_model=small_model
+        )
+        template = processor.load_prompt_template(prompt_path)
 
-    # Calculate totals
-    total_input = sum(r.input_tokens for r in results)
-    total_output = sum(r.output_tokens for r in results)
-    total_cost = sum(r.cost for r in results)
+        if batch_mode:
+            results = processor.process_all_chunks_batch(
+                chunks, template, video_title, output_language, progress_callback
+            )
+        else:
+            results = processor.process_all_chunks(
+                chunks, template, video_title, output_language, progress_callback,
+                max_concurrency=max_concurrency
+            )
 
-    summary = {
-        "chunks_processed": len(results),
-        "total_input_tokens": total_input,
-        "total_output_tokens": total_output,
-        "total_cost": round(total_cost, 4),
-        "model": model
-    }
+    summary = summarize_results(results, model)
+    if pool is not None:
+        summary["endpoints"] = pool.stats()
 
     return results, summary
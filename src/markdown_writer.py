@@ -6,6 +6,25 @@ from pathlib import Path
 import json
 import re
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+HIGHLIGHT_PATTERN = re.compile(r'==\*\*([^*]+)\*\*==')
+HIGHLIGHT_REPLACEMENT = r'<mark style="background-color: #FEF08A; color: #713F12; padding: 3px 6px; margin: 0 1px; border-radius: 4px; border-left: 3px solid #F59E0B; font-weight: 600; letter-spacing: 0.005em; line-height: 1.75; transition: background-color 150ms ease;">\1</mark>'
+UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+WHITESPACE_RUN = re.compile(r'\s+')
+
+
+def _dumps_pretty(data: dict) -> bytes:
+    """Serialize metadata as indented UTF-8 JSON (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 @dataclass
 class TranscriptMetadata:
@@ -20,6 +39,16 @@ class TranscriptMetadata:
     output_tokens: int
 
 
+@dataclass
+class WrittenOutput:
+    """Paths, download bytes and highlighted preview of a written transcript"""
+    md_path: Path
+    json_path: Path
+    highlighted_markdown: str
+    markdown_bytes: bytes
+    metadata_bytes: bytes
+
+
 class MarkdownWriter:
     """Write cleaned transcript to Markdown file"""
 
@@ -40,6 +69,20 @@ class MarkdownWriter:
         Returns:
             (markdown_path, metadata_path)
         """
+        output = self.write_with_content(processed_chunks, title, summary, duration)
+        return output.md_path, output.json_path
+
+    def write_with_content(
+        self,
+        processed_chunks: list,
+        title: str,
+        summary: dict,
+        duration: Optional[str] = None
+    ) -> WrittenOutput:
+        """
+        Write outputs and also return their content, so callers can render
+        and offer downloads without reading the files back.
+        """
         metadata = TranscriptMetadata(
             title=title,
             original_duration=duration,
@@ -52,6 +95,7 @@ class MarkdownWriter:
         )
 
         content = self._build_markdown(processed_chunks, metadata)
+        metadata_bytes = _dumps_pretty(self._metadata_to_dict(metadata))
 
         safe_title = self._sanitize_filename(title)
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -60,14 +104,19 @@ class MarkdownWriter:
         md_path = self.output_dir / f"{base_name}.md"
         json_path = self.output_dir / f"{base_name}-metadata.json"
 
-        md_path.write_text(content, encoding="utf-8")
-        json_path.write_text(
-            json.dumps(self._metadata_to_dict(metadata), indent=2),
-            encoding="utf-8"
+        # Encoded once, for the files and for callers offering downloads
+        markdown_bytes = content.encode("utf-8")
+        md_path.write_bytes(markdown_bytes)
+        json_path.write_bytes(metadata_bytes)
+
+        return WrittenOutput(
+            md_path=md_path,
+            json_path=json_path,
+            highlighted_markdown=self._apply_highlights_for_streamlit(content),
+            markdown_bytes=markdown_bytes,
+            metadata_bytes=metadata_bytes
         )
 
-        return md_path, json_path
-
     def _build_markdown(
         self,
         chunks: list,
@@ -114,8 +163,8 @@ class MarkdownWriter:
 
     def _sanitize_filename(self, title: str) -> str:
         """Create safe filename from title"""
-        safe = re.sub(r'[<>:"/\\|?*]', '', title)
-        safe = re.sub(r'\s+', '-', safe)
+        safe = UNSAFE_FILENAME_CHARS.sub('', title)
+        safe = WHITESPACE_RUN.sub('-', safe)
         return safe[:50].strip('-')
 
     def _apply_highlights_for_streamlit(self, text: str) -> str:
@@ -133,12 +182,10 @@ class MarkdownWriter:
         Returns:
             HTML string with <mark> tags for Streamlit rendering
         """
-        highlighted = re.sub(
-            r'==\*\*([^*]+)\*\*==',
-            r'<mark style="background-color: #FEF08A; color: #713F12; padding: 3px 6px; margin: 0 1px; border-radius: 4px; border-left: 3px solid #F59E0B; font-weight: 600; letter-spacing: 0.005em; line-height: 1.75; transition: background-color 150ms ease;">\1</mark>',
-            text
-        )
-        return highlighted
+        # Skip the substitution pass entirely when there are no markers
+        if "==**" not in text:
+            return text
+        return HIGHLIGHT_PATTERN.sub(HIGHLIGHT_REPLACEMENT, text)
 
     def get_content_for_preview(
         self, chunks: list, max_chars: int = 5000
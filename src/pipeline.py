@@ -0,0 +1,127 @@
+"""Transcript pipeline steps (parse → chunk → pack → count tokens → finalize) without UI"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .transcript_parser import TranscriptParser
+from .chunker import SmartChunker, Chunk
+from .chunk_batcher import ChunkBatcher, ChunkBatch
+from .cost_estimator import CostEstimator
+from .llm_processor import LLMProcessor, ProcessedChunk
+from .validator import OutputValidator, ValidationResult
+from .markdown_writer import MarkdownWriter, WrittenOutput
+from .response_cache import ResponseCache
+
+
+@dataclass
+class FinalOutput:
+    """Per-chunk results with their validation and written files"""
+    results: List[ProcessedChunk]
+    validation: ValidationResult
+    output: WrittenOutput
+
+
+def parse(file_bytes: bytes, file_name: str) -> str:
+    """Parse transcript bytes to plain text"""
+    parser = TranscriptParser()
+    segments = parser.parse_from_bytes(file_bytes, file_name)
+    return parser.to_plain_text(segments)
+
+
+def chunk(
+    plain_text: str,
+    chunk_size: int = 2000,
+    overlap: int = 200,
+    adaptive: bool = True
+) -> List[Chunk]:
+    """Split plain text into chunks"""
+    chunker = SmartChunker(chunk_size=chunk_size, overlap=overlap, adaptive=adaptive)
+    return chunker.chunk_transcript(plain_text)
+
+
+def pack(chunks: List[Chunk], prompt_template: str, batch_size: int = 1) -> List[ChunkBatch]:
+    """Pack consecutive chunks into batched requests"""
+    batcher = ChunkBatcher(
+        max_chunks_per_call=batch_size,
+        count_tokens=CostEstimator().count_tokens
+    )
+    return batcher.pack(chunks, prompt_template)
+
+
+def count_tokens(chunks: List[Chunk], prompt_template: str) -> Tuple[int, List[int]]:
+    """
+    Count tokens for requests (model-independent).
+
+    Returns:
+        (prompt_tokens, per-chunk tokens)
+    """
+    estimator = CostEstimator()
+    return estimator.count_tokens(prompt_template), estimator.count_chunk_tokens(chunks)
+
+
+def cache_keys(
+    chunks: List[Chunk],
+    model: str,
+    prompt_template: str,
+    video_title: str = "Untitled",
+    output_language: str = "English",
+    temperature: float = 0.3,
+    small_model: Optional[str] = None
+) -> List[str]:
+    """Response cache key of each chunk request (keyed on its routed model)"""
+    return [
+        ResponseCache.make_key(
+            routed, c, prompt_template, video_title, output_language, temperature
+        )
+        for routed, c in zip(route_models(chunks, model, small_model), chunks)
+    ]
+
+
+def route_models(
+    chunks: List[Chunk],
+    model: str,
+    small_model: Optional[str] = None
+) -> List[str]:
+    """Model each chunk is sent to (short chunks go to small_model when set)"""
+    return [LLMProcessor.route_for(c, model, small_model) for c in chunks]
+
+
+def uncached_indices(
+    chunks: List[Chunk],
+    model: str,
+    prompt_template: str,
+    video_title: str = "Untitled",
+    output_language: str = "English",
+    cache: Optional[ResponseCache] = None,
+    keys: Optional[List[str]] = None,
+    small_model: Optional[str] = None
+) -> List[int]:
+    """Positions of chunks without a cached response (keys: precomputed cache_keys)"""
+    if cache is None:
+        return list(range(len(chunks)))
+    if keys is None:
+        keys = cache_keys(
+            chunks, model, prompt_template, video_title, output_language,
+            small_model=small_model
+        )
+    return [i for i, key in enumerate(keys) if not cache.contains(key)]
+
+
+def finalize(
+    results: List[ProcessedChunk],
+    summary: dict,
+    video_title: str,
+    batches: Optional[List[ChunkBatch]] = None,
+    output_dir: str = "output"
+) -> FinalOutput:
+    """Unpack batched results, validate and write output files"""
+    # Split packed responses back into per-chunk results
+    if batches:
+        results = ChunkBatcher().unpack_all(batches, results)
+
+    validation = OutputValidator().validate_all(results)
+    output = MarkdownWriter(output_dir).write_with_content(
+        processed_chunks=results,
+        title=video_title,
+        summary=summary
+    )
+    return FinalOutput(results=results, validation=validation, output=output)
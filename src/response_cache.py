@@ -0,0 +1,138 @@
+"""Content-addressed disk cache of LLM responses per chunk"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .chunker import Chunk
+from .llm_processor import LLMProcessor, ProcessedChunk
+
+
+class ResponseCache:
+    """
+    Cache cleaned chunk output on disk so unchanged chunks are never re-billed.
+
+    Entries are keyed on everything that shapes the response (model,
+    temperature, prompt template, title, output language, chunk text with
+    context), one JSON file per key.
+    """
+
+    def __init__(self, cache_dir: Path = None):
+        """
+        Args:
+            cache_dir: Directory for cache entries (default: output/.cache/llm)
+        """
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent / "output" / ".cache" / "llm"
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        chunk: Chunk,
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        temperature: float = 0.3
+    ) -> str:
+        """Build the cache key for a chunk request"""
+        # NUL-terminated fields, so text moving between fields changes the key
+        digest = hashlib.sha256()
+        for part in (
+            model, str(temperature), output_language, video_title,
+            prompt_template, chunk.full_text_for_llm
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Entry path (sharded by key prefix)"""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        """Check whether an entry exists"""
+        return self._path(key).exists()
+
+    def get(self, key: str, chunk: Chunk) -> Optional[ProcessedChunk]:
+        """
+        Load cached result for chunk.
+
+        Cached results report zero cost since no API call is made. Entries
+        the chunk doesn't accept (see Chunk.accepts_output) are misses.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # Treat unreadable entries as misses
+            return None
+        if not chunk.accepts_output(data["cleaned_text"]):
+            return None
+
+        return ProcessedChunk(
+            chunk_index=chunk.index,
+            original_text=chunk.text,
+            cleaned_text=data["cleaned_text"],
+            input_tokens=data["input_tokens"],
+            output_tokens=data["output_tokens"],
+            cost=0.0,
+            model=data["model"],
+            provider=data["provider"],
+            cached=True
+        )
+
+    def set(self, key: str, result: ProcessedChunk) -> None:
+        """Store result atomically"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "cleaned_text": result.cleaned_text,
+            "input_tokens": result.input_tokens,
+            "output_tokens": result.output_tokens,
+            "model": result.model,
+            "provider": result.provider
+        }
+
+        # Unique temp file so concurrent writers never collide
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def count_cached(
+        self,
+        model: str,
+        chunks: list[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English",
+        temperature: float = 0.3,
+        small_model: Optional[str] = None
+    ) -> int:
+        """Count chunks that already have a cached response (small_model: see route_model)"""
+        return sum(
+            self.contains(self.make_key(
+                LLMProcessor.route_for(chunk, model, small_model), chunk, prompt_template,
+                video_title, output_language, temperature
+            ))
+            for chunk in chunks
+        )
+
+    def clear(self) -> None:
+        """Remove all cache entries"""
+        for path in self.cache_dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
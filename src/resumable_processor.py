@@ -1,11 +1,19 @@
 """Resumable processor with pause/resume capability"""
+import hashlib
+import random
 import threading
-from typing import Optional, Callable, List, Dict, Any
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from typing import Optional, Callable, List, Dict, Any, Tuple
 from pathlib import Path
 
-from .llm_processor import LLMProcessor, ProcessedChunk, ProcessingError
+from .llm_processor import LLMProcessor, LLMProvider, ProcessedChunk, ProcessingError
 from .chunker import Chunk
 from .state_manager import StateManager, ProcessingState
+from .response_cache import ResponseCache
+from .client_pool import LLMClientPool
 
 
 class PauseRequested(Exception):
@@ -22,15 +30,34 @@ class ResumableProcessor:
     - Pause via threading.Event
     - Resume from saved state
     - Automatic crash recovery
+    - Concurrent requests (bounded per provider, adapted on rate limits)
     """
 
+    # In-flight requests per provider, within typical rate limits
+    DEFAULT_CONCURRENCY = {
+        LLMProvider.ANTHROPIC: 5,
+        LLMProvider.DEEPSEEK: 10,
+    }
+
+    # AIMD concurrency: halve on a rate limit, +1 after this many successes
+    INCREASE_AFTER = 10
+    # Chunks failing with recoverable errors (rate limits, connection and
+    # server errors) are requeued with jittered exponential backoff
+    RATE_LIMIT_RETRIES = 3
+    BACKOFF_BASE = 1.0
+    MAX_BACKOFF = 30.0
+
     def __init__(
         self,
         api_key: str,
         model: str = "claude-3-5-sonnet-20241022",
         state_dir: Optional[Path] = None,
         temperature: float = 0.3,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache: Optional[ResponseCache] = None,
+        fallback_endpoints: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        small_model: Optional[str] = None
     ):
         """
         Args:
@@ -39,13 +66,49 @@ class ResumableProcessor:
             state_dir: Directory for state files (default: output/.processing)
             temperature: LLM temperature
             max_tokens: Max output tokens per request
+            cache: Optional response cache; hits skip the API call
+            fallback_endpoints: Extra {"model", "api_key", "concurrency_limit"}
+                endpoints; chunks fail over to them on retryable errors
+            max_concurrency: Chunks in flight at once (default: per provider,
+                or the pool's total concurrency)
+            small_model: Cheaper model for short chunks (see LLMProcessor.route_model)
         """
-        self.processor = LLMProcessor(
-            api_key=api_key,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        if fallback_endpoints:
+            provider = LLMProcessor.MODEL_PROVIDER.get(model, LLMProvider.ANTHROPIC)
+            primary = {
+                "model": model,
+                "api_key": api_key,
+                "small_model": small_model,
+                "concurrency_limit": self.DEFAULT_CONCURRENCY.get(provider, 1)
+            }
+            self.processor = LLMClientPool(
+                [primary] + list(fallback_endpoints),
+                # Retries happen here; the requeued chunk goes to a healthy endpoint
+                max_retries=0,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                cache=cache
+            )
+        else:
+            self.processor = LLMProcessor(
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                cache=cache,
+                small_model=small_model,
+                # Retries happen here, requeued at adapted concurrency
+                max_attempts=1
+            )
+        if max_concurrency is None:
+            if isinstance(self.processor, LLMClientPool):
+                max_concurrency = self.processor.total_concurrency
+            else:
+                max_concurrency = self.DEFAULT_CONCURRENCY.get(self.processor.provider, 1)
+        self.max_concurrency = max(1, max_concurrency)
+        self.current_concurrency = self.max_concurrency
+        self._success_streak = 0
+
         self.state_manager = StateManager(state_dir)
         self.pause_event = threading.Event()
         self._is_processing = False
@@ -79,10 +142,14 @@ class ResumableProcessor:
         # Create new state
         config = {
             "model": self.processor.model,
+            "small_model": self.processor.small_model,
             "provider": self.processor.provider.value,
             "output_language": output_language,
             "temperature": self.processor.temperature,
-            "max_tokens": self.processor.max_tokens
+            "max_tokens": self.processor.max_tokens,
+            "fingerprint": self.job_fingerprint(
+                chunks, prompt_template, video_title, output_language
+            )
         }
 
         state = self.state_manager.create_new_state(
@@ -110,6 +177,50 @@ class ResumableProcessor:
             return None
         return state
 
+    def find_resumable_job(
+        self,
+        chunks: List[Chunk],
+        prompt_template: str,
+        video_title: str,
+        output_language: str = "English"
+    ) -> Optional[ProcessingState]:
+        """
+        Return saved state only if it was created for this exact job.
+
+        Chunk indices are only meaningful for the same chunks, prompt and
+        model, so a state from a different file or settings is ignored.
+        """
+        state = self.resume_from_state()
+        if state is None:
+            return None
+
+        fingerprint = self.job_fingerprint(chunks, prompt_template, video_title, output_language)
+        if state.config.get("fingerprint") != fingerprint:
+            return None
+        if state.config.get("model") != self.processor.model:
+            return None
+        if state.config.get("small_model") != self.processor.small_model:
+            return None
+        return state
+
+    @staticmethod
+    def job_fingerprint(
+        chunks: List[Chunk],
+        prompt_template: str,
+        video_title: str,
+        output_language: str = "English"
+    ) -> str:
+        """Hash of everything that determines per-chunk requests"""
+        digest = hashlib.sha256()
+        for part in (prompt_template, video_title, output_language):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for chunk in chunks:
+            digest.update(f"{chunk.index}:".encode("utf-8"))
+            digest.update(chunk.full_text_for_llm.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()[:16]
+
     def process_all_chunks(
         self,
         chunks: List[Chunk],
@@ -117,7 +228,8 @@ class ResumableProcessor:
         video_title: str = "Untitled",
         output_language: str = "English",
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
-        resume: bool = False
+        resume: bool = False,
+        result_callback: Optional[Callable[[ProcessedChunk], None]] = None
     ) -> tuple[List[ProcessedChunk], Dict[str, Any]]:
         """
         Process all chunks with pause/resume capability.
@@ -128,96 +240,123 @@ class ResumableProcessor:
             video_title: Video title
             output_language: Output language
             progress_callback: fn(current, total, status) called after each chunk
-            resume: Whether to resume from saved state
+            resume: Continue a paused or crashed job; refuses to start when
+                the saved state isn't resumable (completed chunks are skipped
+                either way)
+            result_callback: fn(result) called with each newly completed chunk
+                once it is checkpointed (for incremental display)
 
         Returns:
             (List of ProcessedChunk, summary dict)
 
         Raises:
             PauseRequested: When user pauses processing
+            ValueError: If there is no state, or resume is set and the state
+                isn't resumable
         """
+        # A fresh job and a resumed one load the same saved state; chunks
+        # it already holds are skipped either way
+        state = self.state_manager.read_state()
+        if state is None:
+            raise ValueError("No state found. Call start_new_job() first.")
+        if resume and not state.is_resumable():
+            raise ValueError(f"No resumable job found (status: {state.status}).")
+
         self._is_processing = True
         self.pause_event.clear()
 
-        # Load or create state
-        if resume:
-            state = self.state_manager.read_state()
-            if state is None or not state.is_resumable():
-                # Can't resume, start fresh
-                resume = False
-
-        if not resume:
-            # Start new job
-            state = self.state_manager.read_state()
-            if state is None:
-                raise ValueError("No state found. Call start_new_job() first.")
-
         # Update status to processing
         state.status = "processing"
         self.state_manager.write_state(state)
 
         # Rebuild results from cached data
-        results = []
-        for result_data in state.processed_results:
-            result = ProcessedChunk(
-                chunk_index=result_data["chunk_index"],
-                original_text=result_data["original_text"],
-                cleaned_text=result_data["cleaned_text"],
-                input_tokens=result_data["input_tokens"],
-                output_tokens=result_data["output_tokens"],
-                cost=result_data["cost"],
-                model=result_data["model"],
-                provider=result_data["provider"]
-            )
-            results.append(result)
-
-        # Sort results by chunk index
-        results.sort(key=lambda r: r.chunk_index)
-
+        results = self._saved_results(state)
+
+        # Skip chunks finished in an earlier run; pending holds (chunk, attempt)
+        pending = deque()
+        for chunk in chunks:
+            if state.is_completed(chunk.index):
+                if progress_callback:
+                    progress_callback(
+                        len(state.completed_chunks),
+                        state.total_chunks,
+                        "skipped"
+                    )
+            else:
+                pending.append((chunk, 0))
+
+        # Start each run at the provider ceiling
+        self.current_concurrency = self.max_concurrency
+        self._success_streak = 0
+
+        # Worker threads only call the API; state and progress updates stay
+        # on this thread
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        in_flight = {}
+        fatal_error = None
         try:
-            # Process remaining chunks
-            for i, chunk in enumerate(chunks):
-                # Check if already processed
-                if chunk.index in state.completed_chunks:
-                    if progress_callback:
-                        progress_callback(
-                            len(state.completed_chunks),
-                            state.total_chunks,
-                            "skipped"
-                        )
-                    continue
-
-                # Check pause signal
-                if self.pause_event.is_set():
-                    state.status = "paused"
-                    self.state_manager.write_state(state)
-                    self._is_processing = False
-                    raise PauseRequested("Processing paused by user")
-
-                # Process chunk
-                try:
+            while pending or in_flight:
+                # Keep up to current_concurrency requests running, unless paused
+                while (
+                    pending
+                    and fatal_error is None
+                    and len(in_flight) < self.current_concurrency
+                    and not self.pause_event.is_set()
+                ):
+                    chunk, attempt = pending.popleft()
                     if progress_callback:
                         progress_callback(
                             len(state.completed_chunks),
                             state.total_chunks,
                             "processing"
                         )
-
-                    result = self.processor.process_chunk(
+                    future = executor.submit(
+                        self._process_with_backoff,
                         chunk,
+                        attempt,
                         prompt_template,
                         video_title,
                         output_language
                     )
+                    in_flight[future] = (chunk, attempt)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk, attempt = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Back off and retry transient failures; rate limits
+                        # also lower concurrency
+                        if (
+                            self._is_recoverable_error(e)
+                            and attempt < self.RATE_LIMIT_RETRIES
+                        ):
+                            if self._is_rate_limit_error(e):
+                                self._on_rate_limited()
+                            pending.appendleft((chunk, attempt + 1))
+                            continue
+
+                        # Record failure
+                        state.add_failed_chunk(chunk.index, str(e))
+                        self.state_manager.write_state(state)
 
-                    # Add to results
-                    results.append(result)
-                    results.sort(key=lambda r: r.chunk_index)
+                        # Stop if not recoverable (after saving in-flight chunks)
+                        if not self._is_recoverable_error(e) and fatal_error is None:
+                            fatal_error = e
+                        continue
 
-                    # Update state
-                    state.add_completed_chunk(result)
-                    self.state_manager.write_state(state)
+                    self._on_success()
 
+                    # Add to results and update state
+                    results.append(result)
+                    self.state_manager.record_result(state, result)
+
+                    if result_callback:
+                        result_callback(result)
                     if progress_callback:
                         progress_callback(
                             len(state.completed_chunks),
@@ -225,31 +364,27 @@ class ResumableProcessor:
                             "completed"
                         )
 
-                except Exception as e:
-                    # Record failure
-                    error_msg = str(e)
-                    state.add_failed_chunk(chunk.index, error_msg)
-                    self.state_manager.write_state(state)
+            if fatal_error is not None:
+                state.status = "crashed"
+                self.state_manager.write_state(state)
+                raise fatal_error
 
-                    # Re-raise if not recoverable
-                    if not self._is_recoverable_error(e):
-                        state.status = "crashed"
-                        self.state_manager.write_state(state)
-                        raise
+            # Paused: in-flight chunks have been saved
+            if pending:
+                state.status = "paused"
+                self.state_manager.write_state(state)
+                self._is_processing = False
+                raise PauseRequested("Processing paused by user")
 
-            # All chunks processed successfully
-            state.status = "completed"
+            results.sort(key=lambda r: r.chunk_index)
+
+            # Chunks that failed after their retries stay resumable
+            state.status = "paused" if state.failed_chunks else "completed"
             self.state_manager.write_state(state)
 
-            # Build summary
-            summary = {
-                "chunks_processed": len(results),
-                "total_input_tokens": state.total_input_tokens,
-                "total_output_tokens": state.total_output_tokens,
-                "total_cost": round(state.actual_cost, 4),
-                "model": self.processor.model,
-                "failed_chunks": len(state.failed_chunks)
-            }
+            summary = self._build_summary(state, results)
+            if isinstance(self.processor, LLMClientPool):
+                summary["endpoints"] = self.processor.stats()
 
             self._is_processing = False
             return results, summary
@@ -263,9 +398,190 @@ class ResumableProcessor:
             self.state_manager.write_state(state)
             self._is_processing = False
             raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit_batch(
+        self,
+        chunks: List[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English"
+    ) -> Optional[str]:
+        """
+        Submit unfinished chunks of the current job as one Message Batch.
+
+        Chunks already completed in the saved state are not resubmitted, and
+        chunks with a cached response are checkpointed directly. The batch id
+        is saved in the job state, so polling can resume after a restart
+        (see pending_batch_id). Call start_new_job() first; fetch results
+        with collect_batch().
+
+        Returns:
+            Batch id, or None if nothing was left to submit
+        """
+        state = self._require_state()
+        cache = self._batch_processor.cache
+
+        pending = []
+        for chunk in chunks:
+            if state.is_completed(chunk.index):
+                continue
+            cached = None
+            if cache is not None:
+                key = cache.make_key(
+                    self.processor.route_model(chunk), chunk, prompt_template, video_title,
+                    output_language, self.processor.temperature
+                )
+                cached = cache.get(key, chunk)
+            if cached is not None:
+                state.add_completed_chunk(cached)
+            else:
+                pending.append(chunk)
+
+        if not pending:
+            state.status = "completed"
+            self.state_manager.write_state(state)
+            return None
+
+        batch_id = self._batch_processor.submit_batch(
+            pending, prompt_template, video_title, output_language
+        )
+
+        state.status = "processing"
+        state.config["batch_id"] = batch_id
+        self.state_manager.write_state(state)
+        return batch_id
+
+    def pending_batch_id(self) -> Optional[str]:
+        """Batch submitted for the saved job whose results weren't collected yet"""
+        state = self.state_manager.read_state()
+        if state is None or state.status != "processing":
+            return None
+        return state.config.get("batch_id")
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        chunks: List[Chunk],
+        prompt_template: str,
+        video_title: str = "Untitled",
+        output_language: str = "English"
+    ) -> tuple[List[ProcessedChunk], Dict[str, Any]]:
+        """
+        Checkpoint results of an ended batch into the job state.
+
+        Failed requests are recorded as failed chunks and the job is left
+        paused, so a normal resume retries only those.
+
+        Returns:
+            (all completed ProcessedChunks in chunk order, summary dict)
+        """
+        state = self._require_state()
+        cache = self._batch_processor.cache
+
+        batch_results, failed = self._batch_processor.collect_batch_results(batch_id, chunks)
+        chunks_by_index = {c.index: c for c in chunks}
+        for result in batch_results:
+            state.add_completed_chunk(result)
+            if cache is not None:
+                chunk = chunks_by_index[result.chunk_index]
+                cache.set(cache.make_key(
+                    self.processor.route_model(chunk), chunk,
+                    prompt_template, video_title, output_language,
+                    self.processor.temperature
+                ), result)
+        for index, reason in failed.items():
+            state.add_failed_chunk(index, f"Batch request {reason}")
+
+        done = len(state.completed_chunks) >= state.total_chunks
+        state.status = "completed" if done else "paused"
+        state.config.pop("batch_id", None)
+        self.state_manager.write_state(state)
+
+        results, summary = self.job_results()
+        summary["batch_id"] = batch_id
+        return results, summary
+
+    def job_results(self) -> tuple[List[ProcessedChunk], Dict[str, Any]]:
+        """Completed results and usage summary of the current job"""
+        state = self._require_state()
+        results = self._saved_results(state)
+        return results, self._build_summary(state, results)
+
+    def _require_state(self) -> ProcessingState:
+        """Current job state (start_new_job() must have been called)"""
+        state = self.state_manager.read_state()
+        if state is None:
+            raise ValueError("No state found. Call start_new_job() first.")
+        return state
+
+    @property
+    def _batch_processor(self) -> LLMProcessor:
+        """Processor used for Batch API calls (pool: primary endpoint)"""
+        if isinstance(self.processor, LLMClientPool):
+            return self.processor.primary
+        return self.processor
+
+    @staticmethod
+    def _saved_results(state: ProcessingState) -> List[ProcessedChunk]:
+        """Rebuild completed results from saved state, in chunk order"""
+        # Saved dicts carry exactly ProcessedChunk's fields ("cached" may be
+        # missing from older states and defaults to False)
+        results = [ProcessedChunk(**data) for data in state.processed_results]
+        results.sort(key=lambda r: r.chunk_index)
+        return results
+
+    def _build_summary(
+        self,
+        state: ProcessingState,
+        results: List[ProcessedChunk]
+    ) -> Dict[str, Any]:
+        """Usage totals for the job"""
+        return {
+            "chunks_processed": len(results),
+            "total_input_tokens": state.total_input_tokens,
+            "total_output_tokens": state.total_output_tokens,
+            "total_cost": round(state.actual_cost, 4),
+            "model": self.processor.model,
+            "failed_chunks": len(state.failed_chunks),
+            "cache_hits": sum(r.cached for r in results)
+        }
+
+    def _process_with_backoff(
+        self,
+        chunk: Chunk,
+        attempt: int,
+        prompt_template: str,
+        video_title: str,
+        output_language: str
+    ) -> ProcessedChunk:
+        """Process chunk in a worker, first sleeping out the backoff for retries"""
+        if attempt > 0:
+            time.sleep(self._backoff_delay(attempt))
+        return self.processor.process_chunk(
+            chunk, prompt_template, video_title, output_language
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with up to 1s of jitter for retry attempt (1-based)"""
+        delay = self.BACKOFF_BASE * 2 ** (attempt - 1) + random.uniform(0, 1)
+        return min(delay, self.MAX_BACKOFF)
+
+    def _on_rate_limited(self):
+        """Multiplicative decrease of in-flight requests"""
+        self.current_concurrency = max(1, self.current_concurrency // 2)
+        self._success_streak = 0
+
+    def _on_success(self):
+        """Additive increase after a streak of successes, up to the ceiling"""
+        self._success_streak += 1
+        if self._success_streak >= self.INCREASE_AFTER:
+            self._success_streak = 0
+            self.current_concurrency = min(self.max_concurrency, self.current_concurrency + 1)
 
     def pause(self):
-        """Request pause (will complete current chunk before pausing)"""
+        """Request pause (will complete in-flight chunks before pausing)"""
         self.pause_event.set()
 
     def is_processing(self) -> bool:
@@ -280,28 +596,44 @@ class ResumableProcessor:
         """Clear saved state"""
         self.state_manager.clear_state()
 
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        """Check if error is a provider rate limit (HTTP 429)"""
+        return isinstance(error, _provider_errors()[0])
+
     def _is_recoverable_error(self, error: Exception) -> bool:
-        """Check if error is recoverable (network, rate limit, etc.)"""
-        # Import here to avoid circular dependency issues
-        try:
-            import anthropic
-            recoverable_anthropic = (
-                anthropic.RateLimitError,
-                anthropic.APIConnectionError,
-                anthropic.InternalServerError
-            )
-        except ImportError:
-            recoverable_anthropic = ()
+        """Check if error is recoverable (network, rate limit, garbled batch sections, etc.)"""
+        if isinstance(error, ProcessingError):
+            return error.recoverable
+        return isinstance(error, _provider_errors()[1])
 
-        try:
-            from openai import RateLimitError, APIConnectionError, InternalServerError
-            recoverable_openai = (RateLimitError, APIConnectionError, InternalServerError)
-        except ImportError:
-            recoverable_openai = ()
 
-        all_recoverable = recoverable_anthropic + recoverable_openai
+@lru_cache(maxsize=1)
+def _provider_errors() -> Tuple[tuple, tuple]:
+    """
+    (rate limit, recoverable) exception classes of installed SDKs.
+
+    Resolved on first failure, so openai is only imported when needed.
+    """
+    rate_limit, recoverable = (), ()
+    try:
+        import anthropic
+        rate_limit += (anthropic.RateLimitError,)
+        recoverable += (
+            anthropic.RateLimitError,
+            anthropic.APIConnectionError,
+            anthropic.InternalServerError
+        )
+    except ImportError:
+        pass
+
+    try:
+        from openai import RateLimitError, APIConnectionError, InternalServerError
+        rate_limit += (RateLimitError,)
+        recoverable += (RateLimitError, APIConnectionError, InternalServerError)
+    except ImportError:
+        pass
 
-        return isinstance(error, all_recoverable)
+    return rate_limit, recoverable
 
 
 # Convenience function for simple use cases
@@ -2,16 +2,37 @@
 import json
 import os
 import hashlib
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import contextmanager
 from filelock import FileLock
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .llm_processor import ProcessedChunk
 
 
+def _dumps(data: dict) -> bytes:
+    """Serialize state compactly (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse serialized state (orjson errors subclass json.JSONDecodeError)"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class ProcessingState:
     """Represents the current state of transcript processing"""
@@ -41,8 +62,13 @@ class ProcessingState:
     total_output_tokens: int = 0
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        Shallow: nested lists/dicts are the state's own (already plain JSON
+        types), so serializing never deep-copies the cached results.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ProcessingState':
@@ -54,9 +80,9 @@ class ProcessingState:
         self.last_updated = datetime.now(timezone.utc).isoformat()
 
     def is_resumable(self) -> bool:
-        """Check if this state can be resumed"""
+        """Check if this state can be resumed (including after a crash)"""
         return (
-            self.status in ["processing", "paused"] and
+            self.status in ["processing", "paused", "crashed"] and
             len(self.completed_chunks) < self.total_chunks
         )
 
@@ -67,11 +93,19 @@ class ProcessingState:
         failed = set(int(idx) for idx in self.failed_chunks.keys())
         return sorted(list(all_chunks - completed - failed))
 
+    def is_completed(self, chunk_index: int) -> bool:
+        """Check whether chunk_index is in completed_chunks (kept sorted)"""
+        pos = bisect_left(self.completed_chunks, chunk_index)
+        return pos < len(self.completed_chunks) and self.completed_chunks[pos] == chunk_index
+
     def add_completed_chunk(self, chunk_result: ProcessedChunk):
         """Add a successfully processed chunk"""
-        if chunk_result.chunk_index not in self.completed_chunks:
-            self.completed_chunks.append(chunk_result.chunk_index)
-            self.completed_chunks.sort()
+        seen = self.is_completed(chunk_result.chunk_index)
+        if not seen:
+            insort(self.completed_chunks, chunk_result.chunk_index)
+
+        # A retried chunk is no longer failed
+        self.failed_chunks.pop(str(chunk_result.chunk_index), None)
 
         # Update totals
         self.actual_cost += chunk_result.cost
@@ -87,18 +121,19 @@ class ProcessingState:
             "output_tokens": chunk_result.output_tokens,
             "cost": chunk_result.cost,
             "model": chunk_result.model,
-            "provider": chunk_result.provider
+            "provider": chunk_result.provider,
+            "cached": chunk_result.cached
         }
 
-        # Update or append result
-        existing_idx = None
-        for i, r in enumerate(self.processed_results):
-            if r["chunk_index"] == chunk_result.chunk_index:
-                existing_idx = i
-                break
-
-        if existing_idx is not None:
-            self.processed_results[existing_idx] = result_dict
+        # processed_results holds exactly the completed chunks, so only a
+        # re-added chunk needs the search for its old entry
+        if seen:
+            for i, r in enumerate(self.processed_results):
+                if r["chunk_index"] == chunk_result.chunk_index:
+                    self.processed_results[i] = result_dict
+                    break
+            else:
+                self.processed_results.append(result_dict)
         else:
             self.processed_results.append(result_dict)
 
@@ -116,8 +151,24 @@ class ProcessingState:
         return (len(self.completed_chunks) / self.total_chunks) * 100
 
 
+# Parsed state per state file for read-only checks, keyed on the file's
+# (inode, mtime, size) and the journal's. Writes replace the file (new inode)
+# and appends grow the journal, so changes from any process or StateManager
+# instance invalidate it.
+_peek_cache: Dict[Path, Tuple[Optional[tuple], Optional[ProcessingState]]] = {}
+
+
 class StateManager:
-    """Manages processing state persistence with atomic writes and file locking"""
+    """
+    Manages processing state persistence with atomic writes and file locking.
+
+    Completed chunks are appended to a JSONL journal (record_result) and
+    folded into a full snapshot every SNAPSHOT_EVERY results or on the next
+    write_state(); read_state() replays the journal on top of the snapshot.
+    """
+
+    # Journaled results between full snapshots
+    SNAPSHOT_EVERY = 20
 
     def __init__(self, state_dir: Path = None):
         """
@@ -133,13 +184,15 @@ class StateManager:
         self.state_file = self.state_dir / "processing_state.json"
         self.lock_file = self.state_dir / ".processing_state.lock"
         self.backup_file = self.state_dir / "processing_state.backup.json"
+        self.journal_file = self.state_dir / "processing_results.jsonl"
+        self._journaled = 0
 
     @contextmanager
     def _atomic_write(self, filepath: Path):
-        """Context manager for atomic file writes"""
+        """Context manager for atomic (binary) file writes"""
         temp_path = filepath.parent / f".{filepath.name}.tmp"
         try:
-            with open(temp_path, 'w') as f:
+            with open(temp_path, 'wb') as f:
                 yield f
             # Atomic rename
             os.replace(temp_path, filepath)
@@ -150,7 +203,8 @@ class StateManager:
     def _generate_file_id(self, file_name: str, file_size: int = 0) -> str:
         """Generate unique file ID from name and size"""
         content = f"{file_name}:{file_size}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        # Non-cryptographic ID; blake2b also works where FIPS blocks md5
+        return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
 
     def read_state(self) -> Optional[ProcessingState]:
         """Read current processing state (thread-safe)"""
@@ -159,19 +213,56 @@ class StateManager:
                 return None
 
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                return ProcessingState.from_dict(data)
+                data = _loads(self.state_file.read_bytes())
+                state = ProcessingState.from_dict(data)
             except (json.JSONDecodeError, Exception) as e:
                 # Try backup file
+                state = None
                 if self.backup_file.exists():
                     try:
-                        with open(self.backup_file, 'r') as f:
-                            data = json.load(f)
-                        return ProcessingState.from_dict(data)
+                        data = _loads(self.backup_file.read_bytes())
+                        state = ProcessingState.from_dict(data)
                     except Exception:
                         pass
-                return None
+                if state is None:
+                    return None
+
+            self._replay_journal(state)
+            return state
+
+    def _replay_journal(self, state: ProcessingState) -> None:
+        """Apply journaled results not yet in the snapshot"""
+        try:
+            lines = self.journal_file.read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                result = ProcessedChunk(**_loads(line))
+            except (json.JSONDecodeError, TypeError):
+                # Torn last line from an interrupted append
+                break
+            # Already folded in if a snapshot landed before the journal reset
+            if not state.is_completed(result.chunk_index):
+                state.add_completed_chunk(result)
+
+    def record_result(self, state: ProcessingState, result: ProcessedChunk) -> None:
+        """
+        Add a completed chunk to state and persist it.
+
+        Appends one journal line instead of rewriting the whole state;
+        every SNAPSHOT_EVERY results the state is written in full.
+        """
+        state.add_completed_chunk(result)
+
+        if self._journaled + 1 >= self.SNAPSHOT_EVERY:
+            self.write_state(state)
+            return
+
+        with open(self.journal_file, "ab") as f:
+            f.write(_dumps(asdict(result)) + b"\n")
+        self._journaled += 1
 
     def write_state(self, state: ProcessingState) -> None:
         """Write processing state with atomic guarantee (thread-safe)"""
@@ -185,9 +276,13 @@ class StateManager:
                 except Exception:
                     pass
 
-            # Write new state atomically
+            # Write new state atomically (compact: machine-read only)
             with self._atomic_write(self.state_file) as f:
-                json.dump(state.to_dict(), f, indent=2)
+                f.write(_dumps(state.to_dict()))
+            # Snapshot now holds every journaled result
+            self.journal_file.unlink(missing_ok=True)
+            self._journaled = 0
+            _peek_cache.pop(self.state_file, None)
 
     def create_new_state(
         self,
@@ -219,15 +314,46 @@ class StateManager:
         with FileLock(self.lock_file, timeout=10):
             self.state_file.unlink(missing_ok=True)
             self.backup_file.unlink(missing_ok=True)
+            self.journal_file.unlink(missing_ok=True)
+            self._journaled = 0
+            _peek_cache.pop(self.state_file, None)
+
+    def _file_signature(self) -> Optional[tuple]:
+        """Identity of the current state file and journal (None if no state)"""
+        try:
+            st = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+        try:
+            jt = self.journal_file.stat()
+            journal = (jt.st_ino, jt.st_mtime_ns, jt.st_size)
+        except FileNotFoundError:
+            journal = None
+        return (st.st_ino, st.st_mtime_ns, st.st_size, journal)
+
+    def _peek_state(self) -> Optional[ProcessingState]:
+        """
+        Current state for read-only checks, re-read only when the file changed.
+
+        The returned state is shared; use read_state() to get one to modify.
+        """
+        signature = self._file_signature()
+        cached = _peek_cache.get(self.state_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        state = self.read_state() if signature is not None else None
+        _peek_cache[self.state_file] = (signature, state)
+        return state
 
     def has_resumable_state(self) -> bool:
         """Check if there's a resumable state"""
-        state = self.read_state()
+        state = self._peek_state()
         return state is not None and state.is_resumable()
 
     def get_state_summary(self) -> Optional[Dict[str, Any]]:
         """Get summary of current state for display"""
-        state = self.read_state()
+        state = self._peek_state()
         if state is None:
             return None
 
@@ -236,11 +362,13 @@ class StateManager:
             "file_name": state.file_name,
             "status": state.status,
             "progress": f"{len(state.completed_chunks)}/{state.total_chunks}",
+            "completed_chunks": len(state.completed_chunks),
+            "total_chunks": state.total_chunks,
             "progress_pct": state.get_progress_percentage(),
             "failed_chunks": len(state.failed_chunks),
             "estimated_cost": state.estimated_cost,
             "actual_cost": state.actual_cost,
             "started_at": state.started_at,
             "last_updated": state.last_updated,
-            "config": state.config
+            "config": dict(state.config)
         }
@@ -1,11 +1,22 @@
 """Parse subtitle files to structured format"""
 from dataclasses import dataclass
-from typing import List, Union
+from typing import List, Optional, Union
 from pathlib import Path
 import pysrt
 import webvtt
+import io
 import re
 
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+BLANK_LINES_PATTERN = re.compile(r"\n{2,}")
+TIMESTAMP_LINE_PATTERN = re.compile(r"\n+(\[[\d:]+\])\n+")
+TIMESTAMP_TOKEN_PATTERN = re.compile(r"\[[\d:]+\]")
+# Well-formed SRT timing line: HH:MM:SS,mmm --> HH:MM:SS,mmm [position]
+SRT_TIMING_PATTERN = re.compile(
+    r"([0-9]{2}:[0-5][0-9]:[0-5][0-9])[,.][0-9]{3} --> "
+    r"([0-9]{2}:[0-5][0-9]:[0-5][0-9])[,.][0-9]{3}(?: .*)?"
+)
+
 
 @dataclass
 class TranscriptSegment:
@@ -39,6 +50,20 @@ class TranscriptParser:
         import os
 
         suffix = Path(filename).suffix
+
+        # UTF-8 uploads parse in memory; others go through a temp file so
+        # pysrt/webvtt can detect the encoding
+        if suffix.lower() == ".srt":
+            segments = self._parse_srt_blocks(content)
+            if segments is not None:
+                return self._deduplicate(segments)
+        elif suffix.lower() == ".vtt":
+            text = self._decode_utf8(content)
+            if text is not None:
+                return self._vtt_segments(
+                    webvtt.from_buffer(io.StringIO(text, newline=None))
+                )
+
         with tempfile.NamedTemporaryFile(
             mode="wb", suffix=suffix, delete=False
         ) as f:
@@ -55,22 +80,75 @@ class TranscriptParser:
 
     def _parse_srt(self, path: Path) -> List[TranscriptSegment]:
         """Parse SRT file"""
-        subs = pysrt.open(str(path))
+        segments = self._parse_srt_blocks(path.read_bytes())
+        if segments is None:
+            subs = pysrt.open(str(path))
+            segments = []
+
+            for sub in subs:
+                segments.append(TranscriptSegment(
+                    index=sub.index,
+                    start_time=self._format_time(sub.start),
+                    end_time=self._format_time(sub.end),
+                    text=self._clean_text(sub.text)
+                ))
+
+        return self._deduplicate(segments)
+
+    def _parse_srt_blocks(self, content: bytes) -> Optional[List[TranscriptSegment]]:
+        """
+        Parse well-formed UTF-8 SRT directly (same segments as pysrt).
+
+        Returns None for anything pysrt would read differently (other
+        encodings, missing indexes, unusual timing lines) so the caller
+        falls back to pysrt.
+        """
+        text = self._decode_utf8(content)
+        if text is None:
+            return None
+
         segments = []
+        block = []
+        for line in text.splitlines() + [""]:
+            if line.strip():
+                block.append(line.rstrip())
+                continue
+            if not block:
+                continue
+
+            index, timing = block[0], block[1] if len(block) > 1 else ""
+            match = SRT_TIMING_PATTERN.fullmatch(timing)
+            if not (index.isdecimal() and match and timing.count("-->") == 1):
+                return None
 
-        for sub in subs:
             segments.append(TranscriptSegment(
-                index=sub.index,
-                start_time=self._format_time(sub.start),
-                end_time=self._format_time(sub.end),
-                text=self._clean_text(sub.text)
+                index=int(index),
+                start_time=match.group(1),
+                end_time=match.group(2),
+                text=self._clean_text("\n".join(block[2:]))
             ))
+            block = []
 
-        return self._deduplicate(segments)
+        return segments
+
+    @staticmethod
+    def _decode_utf8(content: bytes) -> Optional[str]:
+        """Decode UTF-8 (optional BOM); None if the file looks otherwise encoded"""
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            return None
+        if text.startswith("\ufeff") or "\x00" in text:
+            # UTF-16/32 content or a doubled BOM
+            return None
+        return text
 
     def _parse_vtt(self, path: Path) -> List[TranscriptSegment]:
         """Parse VTT file"""
-        vtt = webvtt.read(str(path))
+        return self._vtt_segments(webvtt.read(str(path)))
+
+    def _vtt_segments(self, vtt) -> List[TranscriptSegment]:
+        """Segments from parsed WebVTT captions"""
         segments = []
 
         for i, caption in enumerate(vtt):
@@ -89,6 +167,10 @@ class TranscriptParser:
 
     def _vtt_time_to_str(self, time_str: str) -> str:
         """Convert VTT time (00:00:00.000) to HH:MM:SS"""
+        # webvtt normalizes caption times to HH:MM:SS.mmm
+        if len(time_str) == 12 and time_str[2] == time_str[5] == ":" and time_str[8] == ".":
+            return time_str[:8]
+
         parts = time_str.split(":")
         if len(parts) == 2:
             return f"00:{parts[0]}:{parts[1].split('.')[0]}"
@@ -97,7 +179,8 @@ class TranscriptParser:
 
     def _clean_text(self, text: str) -> str:
         """Remove HTML tags and normalize whitespace"""
-        text = re.sub(r"<[^>]+>", "", text)
+        if "<" in text:
+            text = HTML_TAG_PATTERN.sub("", text)
         text = " ".join(text.split())
         return text.strip()
 
@@ -114,16 +197,16 @@ class TranscriptParser:
             Normalized text with reduced whitespace
         """
         # Collapse all multiple newlines to max 2 (paragraph break)
-        text = re.sub(r'\n{2,}', '\n\n', text)
+        text = BLANK_LINES_PATTERN.sub('\n\n', text)
 
         # Remove whitespace around timestamps: \n[00:00:00]\n -> \n[00:00:00]
-        text = re.sub(r'\n+(\[[\d:]+\])\n+', r'\n\1 ', text)
+        text = TIMESTAMP_LINE_PATTERN.sub(r'\n\1 ', text)
 
         # Strip line-level whitespace
         text = '\n'.join(line.strip() for line in text.split('\n'))
 
         # Remove remaining multiple empty lines
-        text = re.sub(r'\n\n+', '\n\n', text)
+        text = BLANK_LINES_PATTERN.sub('\n\n', text)
 
         return text.strip()
 
@@ -135,14 +218,21 @@ class TranscriptParser:
             return segments
 
         result = [segments[0]]
+        append = result.append
+        last = segments[0].text
         for seg in segments[1:]:
-            if seg.text != result[-1].text:
-                result.append(seg)
+            if seg.text != last:
+                append(seg)
+                last = seg.text
 
         return result
 
     def to_plain_text(self, segments: List[TranscriptSegment]) -> str:
         """Convert segments to timestamped plain text with normalization"""
+        text = self._join_plain_segments(segments)
+        if text is not None:
+            return text
+
         lines = []
         current_time = None
 
@@ -155,3 +245,34 @@ class TranscriptParser:
 
         raw_text = "\n".join(lines)
         return self._normalize_transcript_whitespace(raw_text)
+
+    def _join_plain_segments(self, segments: List[TranscriptSegment]) -> Optional[str]:
+        """
+        Build normalized text directly (same result as the regex passes).
+
+        Each timestamp group becomes "[HH:MM:SS] first text" followed by its
+        other texts on their own lines. Returns None when a segment would be
+        reshaped by normalization (empty or multi-line text, a bare
+        timestamp line, unusual start time).
+        """
+        lines = []
+        append = lines.append
+        current_time = None
+
+        for seg in segments:
+            text = seg.text
+            if (
+                not text or "\n" in text or text != text.strip()
+                or (text[0] == "[" and TIMESTAMP_TOKEN_PATTERN.fullmatch(text))
+            ):
+                return None
+
+            if current_time != seg.start_time:
+                current_time = seg.start_time
+                if not TIMESTAMP_TOKEN_PATTERN.fullmatch(f"[{current_time}]"):
+                    return None
+                append(f"[{current_time}] {text}")
+            else:
+                append(text)
+
+        return "\n".join(lines)
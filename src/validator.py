@@ -5,12 +5,26 @@ from typing import List, Optional
 from enum import Enum
 
 
+# Timestamp-like tokens other than [HH:MM:SS] / [HH:MM]. The token holds no
+# "[", so each lookbehind can only see the whole token.
+INVALID_TIMESTAMP_PATTERN = re.compile(
+    r"\[[\d:\.]+\](?<!\[\d{2}:\d{2}:\d{2}\])(?<!\[\d{2}:\d{2}\])"
+)
+
+
 class ValidationSeverity(Enum):
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
 
 
+# Enum member access goes through a descriptor; hot paths (issue creation,
+# property scans) use these instead
+_ERROR = ValidationSeverity.ERROR
+_WARNING = ValidationSeverity.WARNING
+_INFO = ValidationSeverity.INFO
+
+
 @dataclass
 class ValidationIssue:
     """Single validation issue"""
@@ -28,19 +42,19 @@ class ValidationResult:
 
     @property
     def has_errors(self) -> bool:
-        return any(i.severity == ValidationSeverity.ERROR for i in self.issues)
+        return any(i.severity is _ERROR for i in self.issues)
 
     @property
     def has_warnings(self) -> bool:
-        return any(i.severity == ValidationSeverity.WARNING for i in self.issues)
+        return any(i.severity is _WARNING for i in self.issues)
 
     @property
     def error_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == ValidationSeverity.ERROR)
+        return sum(1 for i in self.issues if i.severity is _ERROR)
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == ValidationSeverity.WARNING)
+        return sum(1 for i in self.issues if i.severity is _WARNING)
 
     def to_dict(self) -> dict:
         return {
@@ -78,6 +92,25 @@ class OutputValidator:
         r"\[TRANSCRIPT TO PROCESS\]"
     ]
 
+    # Snippets reported per filler pattern
+    MAX_FILLER_MATCHES = 3
+
+    def __init__(self):
+        # Compile rule patterns once, not per chunk. Fillers are whole words
+        # that never contain one another, so one alternation finds the same
+        # matches as scanning each pattern separately. They all start with
+        # \b, which is hoisted so other positions fail fast, and a lookahead
+        # on the fillers' first letters skips most words before trying each
+        # alternative.
+        words = [p.removeprefix(r"\b") for p in self.FILLERS]
+        alternatives = "|".join(f"(?P<f{i}>{word})" for i, word in enumerate(words))
+        initials = "".join(sorted({c for word in words for c in (word[0].lower(), word[0].upper())}))
+        self._filler_scan = re.compile(
+            rf"\b(?=[{initials}])(?:{alternatives})", re.IGNORECASE
+        )
+        # Markers are escaped literals, so a substring test finds them
+        self._context_markers = [(p, p.replace("\\", "")) for p in self.CONTEXT_MARKERS]
+
     def validate_chunk(
         self,
         original: str,
@@ -115,23 +148,30 @@ class OutputValidator:
     ) -> List[ValidationIssue]:
         """Check for remaining filler words"""
         issues = []
-        text_lower = text.lower()
-
-        for pattern in self.FILLERS:
-            matches = list(re.finditer(pattern, text_lower, re.IGNORECASE))
-            if matches:
-                for match in matches[:3]:
-                    start = max(0, match.start() - 20)
-                    end = min(len(text), match.end() + 20)
-                    snippet = "..." + text[start:end] + "..."
-
-                    issues.append(ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        rule="filler_detected",
-                        message=f"Possible filler word: '{match.group()}'",
-                        chunk_index=chunk_index,
-                        snippet=snippet
-                    ))
+
+        # Bucket matches per pattern in one scan, keeping the first few of each.
+        # The scan is case-insensitive, so it runs on text itself and match
+        # offsets line up with the snippet (lower() can change lengths)
+        found = [[] for _ in self.FILLERS]
+        for match in self._filler_scan.finditer(text):
+            bucket = found[int(match.lastgroup[1:])]
+            if len(bucket) < self.MAX_FILLER_MATCHES:
+                bucket.append(match)
+
+        # Report in pattern order, as before
+        for matches in found:
+            for match in matches:
+                start = max(0, match.start() - 20)
+                end = min(len(text), match.end() + 20)
+                snippet = "..." + text[start:end] + "..."
+
+                issues.append(ValidationIssue(
+                    severity=_WARNING,
+                    rule="filler_detected",
+                    message=f"Possible filler word: '{match.group().lower()}'",
+                    chunk_index=chunk_index,
+                    snippet=snippet
+                ))
 
         return issues
 
@@ -141,10 +181,10 @@ class OutputValidator:
         """Check for context markers that shouldn't appear in output"""
         issues = []
 
-        for pattern in self.CONTEXT_MARKERS:
-            if re.search(pattern, text):
+        for pattern, marker in self._context_markers:
+            if marker in text:
                 issues.append(ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
+                    severity=_ERROR,
                     rule="context_marker_in_output",
                     message=f"Context marker found in output: {pattern}",
                     chunk_index=chunk_index
@@ -157,16 +197,14 @@ class OutputValidator:
     ) -> List[ValidationIssue]:
         """Check timestamp format is correct [HH:MM:SS]"""
         issues = []
-        timestamps = re.findall(r"\[[\d:\.]+\]", text)
 
-        for ts in timestamps:
-            if not re.match(r"\[\d{2}:\d{2}:\d{2}\]|\[\d{2}:\d{2}\]", ts):
-                issues.append(ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    rule="invalid_timestamp_format",
-                    message=f"Invalid timestamp format: {ts}",
-                    chunk_index=chunk_index
-                ))
+        for ts in INVALID_TIMESTAMP_PATTERN.findall(text):
+            issues.append(ValidationIssue(
+                severity=_WARNING,
+                rule="invalid_timestamp_format",
+                message=f"Invalid timestamp format: {ts}",
+                chunk_index=chunk_index
+            ))
 
         return issues
 
@@ -186,14 +224,14 @@ class OutputValidator:
 
         if ratio < 0.3:
             issues.append(ValidationIssue(
-                severity=ValidationSeverity.WARNING,
+                severity=_WARNING,
                 rule="excessive_truncation",
                 message=f"Output too short ({ratio:.0%} of original). May have lost content.",
                 chunk_index=chunk_index
             ))
         elif ratio > 1.2:
             issues.append(ValidationIssue(
-                severity=ValidationSeverity.WARNING,
+                severity=_WARNING,
                 rule="content_expansion",
                 message=f"Output longer than original ({ratio:.0%}). LLM may have added content.",
                 chunk_index=chunk_index
@@ -206,13 +244,14 @@ class OutputValidator:
     ) -> List[ValidationIssue]:
         """Check for questions (should be converted to statements)"""
         issues = []
-        questions = re.findall(r"[^.!?]*\?", text)
+        # Each "?" ends exactly one [^.!?]*\? match, so counting is enough
+        question_count = text.count("?")
 
-        if len(questions) > 2:
+        if question_count > 2:
             issues.append(ValidationIssue(
-                severity=ValidationSeverity.INFO,
+                severity=_INFO,
                 rule="many_questions",
-                message=f"Found {len(questions)} questions. Consider if they should be statements.",
+                message=f"Found {question_count} questions. Consider if they should be statements.",
                 chunk_index=chunk_index
             ))
 
@@ -0,0 +1,15 @@
+"""Shared test fixtures"""
+import pytest
+
+from src.llm_processor import _shared_client
+from src.cost_estimator import _load_encoder
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Tests patch SDK clients and tiktoken, so don't reuse them across tests"""
+    _shared_client.cache_clear()
+    _load_encoder.cache_clear()
+    yield
+    _shared_client.cache_clear()
+    _load_encoder.cache_clear()
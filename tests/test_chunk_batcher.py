@@ -0,0 +1,157 @@
+"""Tests for multi-chunk request packing"""
+import pytest
+from src.chunker import Chunk
+from src.chunk_batcher import ChunkBatcher, ChunkBatch
+from src.llm_processor import ProcessedChunk, ProcessingError
+
+
+@pytest.fixture
+def chunks():
+    return [
+        Chunk(index=i, text=f"Content {i}. " * 10, start_timestamp=f"00:0{i}:00")
+        for i in range(5)
+    ]
+
+
+def make_result(index, text, input_tokens=100, output_tokens=80, cost=0.01):
+    return ProcessedChunk(
+        chunk_index=index,
+        original_text="packed",
+        cleaned_text=text,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cost=cost,
+        model="claude-3-5-sonnet-20241022",
+        provider="anthropic"
+    )
+
+
+class TestChunkBatcher:
+
+    def test_pack_respects_max_chunks(self, chunks):
+        """Never pack more than max_chunks_per_call"""
+        batcher = ChunkBatcher(max_chunks_per_call=2, context_limit=100000)
+        batches = batcher.pack(chunks, "Prompt")
+
+        assert [len(b.members) for b in batches] == [2, 2, 1]
+        assert [b.index for b in batches] == [0, 1, 2]
+
+    def test_pack_respects_token_budget(self, chunks):
+        """Start a new batch when the budget would be exceeded"""
+        batcher = ChunkBatcher(
+            max_chunks_per_call=8,
+            context_limit=50,
+            count_tokens=lambda text: 20
+        )
+        batches = batcher.pack(chunks, "Prompt")
+
+        # 20 prompt + 36 per chunk: only one chunk fits per request
+        assert all(len(b.members) == 1 for b in batches)
+
+    def test_pack_tokenizes_content_once(self, chunks):
+        """Each chunk's content is counted once, even when it opens a new batch"""
+        for chunk in chunks[1:]:
+            chunk.context_buffer = "Earlier context"
+        counted = []
+
+        def count(text):
+            counted.append(text)
+            return len(text) // 4
+
+        ChunkBatcher(max_chunks_per_call=2, count_tokens=count).pack(chunks, "Prompt")
+
+        for chunk in chunks:
+            assert counted.count(chunk.text) == 1
+        assert not any(c.full_text_for_llm in counted for c in chunks)
+
+    def test_batch_size_one_is_passthrough(self, chunks):
+        """Single-member batches send the chunk unchanged"""
+        batcher = ChunkBatcher(max_chunks_per_call=1)
+        batches = batcher.pack(chunks, "Prompt")
+
+        packed = batches[2].to_chunk()
+        assert packed.text == chunks[2].text
+        assert "<<<CHUNK" not in packed.full_text_for_llm
+
+    def test_to_chunk_wraps_members(self, chunks):
+        """Packed chunk carries sentinels and first member's context"""
+        chunks[0].context_buffer = "Earlier context"
+        packed = ChunkBatch(index=0, members=chunks[:2]).to_chunk()
+
+        assert "<<<CHUNK 0>>>" in packed.text
+        assert "<<<END 1>>>" in packed.text
+        assert packed.context_buffer == "Earlier context"
+        assert packed.start_timestamp == chunks[0].start_timestamp
+
+    def test_packed_chunk_checks_sections(self, chunks):
+        """A packed chunk accepts only one output section per member"""
+        packed = ChunkBatch(index=0, members=chunks[:2]).to_chunk()
+        output = "<<<OUT 0>>>\nClean zero\n<<<END 0>>>\n<<<OUT 1>>>\nClean one\n<<<END 1>>>"
+
+        assert packed.accepts_output(output)
+        assert not packed.accepts_output("Unmarked output")
+        assert not packed.accepts_output(output.split("<<<OUT 1>>>")[0])
+        assert ChunkBatch(index=1, members=chunks[2:3]).to_chunk().accepts_output("Anything")
+
+    def test_unpack_splits_sections(self, chunks):
+        """Split combined output by sentinel markers"""
+        batch = ChunkBatch(index=0, members=chunks[:2])
+        output = "<<<OUT 0>>>\nClean zero\n<<<END 0>>>\n<<<OUT 1>>>\nClean one\n<<<END 1>>>"
+
+        results = ChunkBatcher().unpack(batch, make_result(0, output))
+
+        assert [r.chunk_index for r in results] == [0, 1]
+        assert results[0].cleaned_text == "Clean zero"
+        assert results[1].cleaned_text == "Clean one"
+        assert results[0].original_text == chunks[0].text
+        assert sum(r.input_tokens for r in results) == 100
+        assert sum(r.output_tokens for r in results) == 80
+        assert round(sum(r.cost for r in results), 6) == 0.01
+
+    def test_unpack_without_markers_raises(self, chunks):
+        """Output without sentinels isn't attributed to any one chunk"""
+        batch = ChunkBatch(index=3, members=chunks[:2])
+
+        with pytest.raises(ProcessingError) as exc_info:
+            ChunkBatcher().unpack(batch, make_result(3, "Unmarked output"))
+
+        assert exc_info.value.chunk_index == 3
+
+    def test_unpack_missing_section_raises(self, chunks):
+        """A missing or garbled section fails the batch instead of emptying a chunk"""
+        batch = ChunkBatch(index=0, members=chunks[:3])
+        output = "<<<OUT 0>>>\nClean zero\n<<<END 0>>>\n<<<OUT 2>>>\nClean two\n<<<END 1>>>"
+
+        with pytest.raises(ProcessingError):
+            ChunkBatcher().unpack(batch, make_result(0, output))
+
+    def test_unpack_all_restores_chunk_order(self, chunks):
+        """Round-trip pack/unpack yields one result per original chunk"""
+        batcher = ChunkBatcher(max_chunks_per_call=2, context_limit=100000)
+        batches = batcher.pack(chunks, "Prompt")
+        processed = []
+        for b in batches:
+            if len(b.members) == 1:
+                output = f"Clean {b.members[0].index}"
+            else:
+                output = "\n".join(
+                    f"<<<OUT {p}>>>\nClean {m.index}\n<<<END {p}>>>"
+                    for p, m in enumerate(b.members)
+                )
+            processed.append(make_result(b.index, output))
+
+        results = batcher.unpack_all(batches, processed)
+
+        assert [r.chunk_index for r in results] == [0, 1, 2, 3, 4]
+        assert [r.cleaned_text for r in results] == [f"Clean {i}" for i in range(5)]
+
+    def test_suggest_batch_size_bounds(self):
+        """Suggested size stays within [1, upper_bound]"""
+        assert ChunkBatcher.suggest_batch_size(4000, 500, 7900) == 1
+        assert ChunkBatcher.suggest_batch_size(100, 0, 0) == 8
+        assert 1 <= ChunkBatcher.suggest_batch_size(2000, 200, 1500) <= 8
+
+    def test_suggest_batch_size_uses_token_ratio(self):
+        """Denser text (fewer chars per token) fits fewer chunks per request"""
+        assert ChunkBatcher.suggest_batch_size(2000, 200, 500) == 7
+        assert ChunkBatcher.suggest_batch_size(2000, 200, 500, chars_per_token=2.0) == 3
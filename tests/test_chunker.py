@@ -23,6 +23,14 @@ class TestSmartChunker:
         for chunk in chunks[:-1]:
             assert chunk.text.rstrip().endswith(".")
 
+    def test_split_always_advances(self):
+        """Timestamp at chunk start with a small chunk size terminates"""
+        text = "[00:00:01]" + "a" * 90 + "[00:00:02]" + "b" * 90
+        chunker = SmartChunker(chunk_size=80, overlap=0)
+        chunks = chunker.chunk_transcript(text)
+
+        assert "".join(c.text for c in chunks) == text
+
     def test_context_buffer(self):
         """Second chunk has context from first"""
         text = "First part. " * 100 + "Second part. " * 100
@@ -55,3 +63,35 @@ class TestSmartChunker:
         assert "Previous context" in llm_text
         assert "[NEW CONTENT TO PROCESS]" in llm_text
         assert "New content here" in llm_text
+
+    def test_full_text_for_llm_tracks_changes(self):
+        """Cached LLM text is rebuilt when text or context changes"""
+        chunk = Chunk(index=0, text="First", start_timestamp="00:00:00")
+        assert chunk.full_text_for_llm is chunk.full_text_for_llm
+
+        chunk.context_buffer = "Earlier"
+        assert "Earlier" in chunk.full_text_for_llm
+
+        chunk.text = "Second"
+        assert chunk.full_text_for_llm.endswith("Second")
+        assert chunk.char_count == len(chunk.full_text_for_llm)
+
+    def test_adaptive_targets_smaller_chunks(self):
+        """Adaptive mode caps chunks near ADAPTIVE_TARGET when boundaries exist"""
+        text = "This is a sentence of moderate length. " * 300
+        limit = SmartChunker.ADAPTIVE_TARGET + SmartChunker.ADAPTIVE_WINDOW
+
+        adaptive = SmartChunker(chunk_size=4000, overlap=0).chunk_transcript(text)
+        fixed = SmartChunker(chunk_size=4000, overlap=0, adaptive=False).chunk_transcript(text)
+
+        assert all(len(c.text) <= limit for c in adaptive)
+        assert len(adaptive) > len(fixed)
+        assert "".join(c.text for c in adaptive).replace(" ", "") == text.replace(" ", "")
+
+    def test_adaptive_falls_back_without_boundaries(self):
+        """Without a boundary near the target, chunk_size is used"""
+        text = "word " * 3000
+
+        chunks = SmartChunker(chunk_size=4000, overlap=0).chunk_transcript(text)
+
+        assert len(chunks[0].text) > SmartChunker.ADAPTIVE_TARGET + SmartChunker.ADAPTIVE_WINDOW
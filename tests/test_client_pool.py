@@ -0,0 +1,126 @@
+"""Tests for multi-endpoint client pool"""
+import pytest
+from unittest.mock import Mock, patch
+from src.chunker import Chunk
+from src.client_pool import LLMClientPool
+from src.llm_processor import ProcessedChunk
+
+
+class TransientError(Exception):
+    """Stands in for rate limit / connection errors"""
+
+
+def make_result(chunk, model):
+    return ProcessedChunk(
+        chunk_index=chunk.index,
+        original_text=chunk.text,
+        cleaned_text=f"Cleaned {chunk.index}",
+        input_tokens=100,
+        output_tokens=80,
+        cost=0.01,
+        model=model,
+        provider="anthropic"
+    )
+
+
+@pytest.fixture
+def processors():
+    """Two mocked endpoint processors"""
+    created = []
+
+    def factory(api_key, model, **kwargs):
+        processor = Mock()
+        processor.model = model
+        processor._get_retry_exceptions.return_value = (TransientError,)
+        processor.process_chunk.side_effect = lambda chunk, *a: make_result(chunk, model)
+        created.append(processor)
+        return processor
+
+    with patch('src.client_pool.LLMProcessor', side_effect=factory):
+        yield created
+
+
+@pytest.fixture
+def chunks():
+    return [Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00") for i in range(4)]
+
+
+def make_pool(**kwargs):
+    return LLMClientPool(
+        [
+            {"model": "primary-model", "api_key": "key-a", "concurrency_limit": 2},
+            {"model": "fallback-model", "api_key": "key-b", "concurrency_limit": 1},
+        ],
+        backoff_base=0.0,
+        **kwargs
+    )
+
+
+class TestLLMClientPool:
+
+    def test_requires_endpoint(self):
+        """Empty pool is rejected"""
+        with pytest.raises(ValueError):
+            LLMClientPool([])
+
+    def test_exposes_primary_config(self, processors):
+        """Pool reports the primary endpoint's model"""
+        pool = make_pool()
+        assert pool.model == "primary-model"
+        assert pool.total_concurrency == 3
+
+    def test_fails_over_on_retryable_error(self, processors, chunks):
+        """Retryable error moves the chunk to the next endpoint"""
+        pool = make_pool()
+        processors[0].process_chunk.side_effect = TransientError("rate limited")
+
+        result = pool.process_chunk(chunks[0], "Prompt")
+
+        assert result.model == "fallback-model"
+        stats = {s["name"]: s for s in pool.stats()}
+        assert stats["0:primary-model"]["failed"] == 1
+        assert stats["1:fallback-model"]["succeeded"] == 1
+
+    def test_non_retryable_error_raises(self, processors, chunks):
+        """Errors such as bad auth are not retried"""
+        pool = make_pool()
+        processors[0].process_chunk.side_effect = ValueError("bad key")
+
+        with pytest.raises(ValueError):
+            pool.process_chunk(chunks[0], "Prompt")
+        assert processors[1].process_chunk.call_count == 0
+
+    def test_raises_after_retries_exhausted(self, processors, chunks):
+        """Give up after max_retries failovers"""
+        pool = make_pool(max_retries=2)
+        for processor in processors:
+            processor.process_chunk.side_effect = TransientError("down")
+
+        with pytest.raises(TransientError):
+            pool.process_chunk(chunks[0], "Prompt")
+        assert sum(s["requests"] for s in pool.stats()) == 3
+
+    def test_failed_endpoint_skipped_by_caller_retry(self, processors, chunks):
+        """Without failover retries, the next try avoids the endpoint that just failed"""
+        pool = make_pool(max_retries=0)
+        processors[0].process_chunk.side_effect = TransientError("rate limited")
+
+        with pytest.raises(TransientError):
+            pool.process_chunk(chunks[0], "Prompt")
+        result = pool.process_chunk(chunks[0], "Prompt")
+
+        assert result.model == "fallback-model"
+        assert processors[0].process_chunk.call_count == 1
+
+    def test_process_all_chunks_preserves_order(self, processors, chunks):
+        """Results come back in chunk order with progress callbacks"""
+        pool = make_pool()
+        calls = []
+
+        results = pool.process_all_chunks(
+            chunks, "Prompt", progress_callback=lambda c, t: calls.append((c, t))
+        )
+
+        assert [r.chunk_index for r in results] == [0, 1, 2, 3]
+        assert calls[-1] == (4, 4)
+        assert sum(s["succeeded"] for s in pool.stats()) == 4
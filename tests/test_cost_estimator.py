@@ -3,7 +3,11 @@ import pytest
 from unittest.mock import patch, MagicMock
 from src.cost_estimator import (
     CostBreakdown,
-    CostEstimator
+    CostEstimator,
+    LLMProvider,
+    MODEL_PRICING,
+    DEFAULT_MODEL,
+    get_pricing
 )
 from src.chunker import Chunk
 
@@ -262,6 +266,53 @@ class TestCostEstimator:
             # Should account for full_text_for_llm (includes context)
             assert breakdown.input_tokens > 0
 
+    def test_estimate_total_batch_mode_halves_cost(self):
+        """Batch mode applies the Batch API discount"""
+        estimator = CostEstimator()
+        chunks = [Chunk(index=0, text="Some content", start_timestamp="00:00:00")]
+
+        with patch.object(estimator, 'count_tokens', return_value=1000):
+            standard = estimator.estimate_total(chunks, "Prompt")
+            batch = estimator.estimate_total(chunks, "Prompt", batch_mode=True)
+
+        assert batch.input_tokens == standard.input_tokens
+        assert batch.total_cost == pytest.approx(standard.total_cost * 0.5, abs=1e-4)
+
+    def test_estimate_from_counts_matches_total(self):
+        """Re-pricing cached counts matches a full estimate; each text counted once"""
+        estimator = CostEstimator()
+        chunks = [
+            Chunk(index=i, text=f"Content {i}", start_timestamp="00:00:00")
+            for i in range(3)
+        ]
+
+        with patch.object(estimator, 'count_tokens', return_value=500) as mock_count:
+            total = estimator.estimate_total(chunks, "Template")
+            assert mock_count.call_count == 4  # prompt + one per chunk
+
+        counts = [500, 500, 500]
+        assert estimator.estimate_from_counts(counts, 500) == total
+
+        haiku = CostEstimator(model="claude-3-5-haiku-20241022")
+        assert haiku.estimate_from_counts(counts, 500).total_cost < total.total_cost
+
+    def test_estimate_from_counts_prices_routed_models(self):
+        """Per-chunk models price each chunk at the model it goes to"""
+        sonnet = CostEstimator(model="claude-3-5-sonnet-20241022")
+        haiku = CostEstimator(model="claude-3-5-haiku-20241022")
+
+        mixed = sonnet.estimate_from_counts(
+            [1000, 1000], 100,
+            models=["claude-3-5-sonnet-20241022", "claude-3-5-haiku-20241022"]
+        )
+        expected = (
+            sonnet.estimate_from_counts([1000], 100).total_cost
+            + haiku.estimate_from_counts([1000], 100).total_cost
+        )
+
+        assert mixed.total_cost == pytest.approx(expected, abs=1e-4)
+        assert mixed.input_tokens == 2200
+
     def test_estimate_total_empty_chunks(self):
         """Handle empty chunk list"""
         estimator = CostEstimator()
@@ -289,6 +340,27 @@ class TestCostEstimator:
                 assert estimator._encoder is not None
                 mock_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
 
+    def test_encoder_load_failure_falls_back(self):
+        """Failing to load the encoding falls back to the char estimate once"""
+        with patch('src.cost_estimator.HAS_TIKTOKEN', True):
+            with patch('src.cost_estimator.tiktoken') as mock_tiktoken:
+                mock_tiktoken.get_encoding.side_effect = OSError("offline")
+
+                estimator = CostEstimator()
+                assert estimator.count_tokens("a" * 40) == 10
+                assert estimator.count_tokens("a" * 80) == 20
+                mock_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+
+    def test_encoder_shared_across_estimators(self):
+        """Encoder is loaded once per process, not per estimator"""
+        with patch('src.cost_estimator.HAS_TIKTOKEN', True):
+            with patch('src.cost_estimator.tiktoken') as mock_tiktoken:
+                first = CostEstimator().encoder
+                second = CostEstimator(model="deepseek-chat").encoder
+
+                assert first is second
+                mock_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+
     def test_encoder_without_tiktoken(self):
         """Return None when tiktoken not available"""
         with patch('src.cost_estimator.HAS_TIKTOKEN', False):
@@ -317,6 +389,22 @@ class TestCostEstimator:
             assert isinstance(time, (int, float))
             assert time > 0
 
+    def test_pricing_shared_with_processor(self):
+        """Estimator and processor bill from one frozen price table"""
+        from src.llm_processor import LLMProcessor, LLMProvider as ProcessorProvider
+
+        assert ProcessorProvider is LLMProvider
+        with pytest.raises(TypeError):
+            MODEL_PRICING["new-model"] = MODEL_PRICING[DEFAULT_MODEL]
+
+        for model, prices in MODEL_PRICING.items():
+            assert get_pricing(model) is prices
+            assert LLMProcessor.MODEL_PROVIDER[model] is prices.provider
+            processor = LLMProcessor(api_key="test-key", model=model)
+            assert processor._calculate_cost(1000, 1000) == round(prices.input + prices.output, 6)
+
+        assert get_pricing("unknown-model") is MODEL_PRICING[DEFAULT_MODEL]
+
     def test_estimate_chunk_tokens_ratio(self):
         """Verify output token estimation ratio is 0.8"""
         estimator = CostEstimator()
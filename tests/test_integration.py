@@ -1,4 +1,6 @@
 """Integration tests for full pipeline"""
+import subprocess
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -16,9 +18,10 @@ from src import (
 class TestFullPipeline:
     """Test complete processing pipeline"""
 
-    @pytest.fixture
-    def sample_srt(self, tmp_path):
-        """Create sample SRT file"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_srt(cls, tmp_path_factory):
+        """Create sample SRT file (read-only, shared by the class)"""
         content = """1
 00:00:01,000 --> 00:00:05,000
 Uh, hello everyone, welcome to the lecture.
@@ -39,13 +42,14 @@ The concept is really quite simple, actually.
 00:00:21,000 --> 00:00:25,000
 Why does this matter? Because it helps automate decisions.
 """
-        srt_file = tmp_path / "sample.srt"
+        srt_file = tmp_path_factory.mktemp("integration") / "sample.srt"
         srt_file.write_text(content)
         return srt_file
 
-    @pytest.fixture
-    def prompt_template(self, tmp_path):
-        """Create prompt template"""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def prompt_template(cls, tmp_path_factory):
+        """Create prompt template (read-only, shared by the class)"""
         content = """Clean this transcript.
 
 [VIDEO INFO]
@@ -54,7 +58,7 @@ Title: {{fileName}}
 [TRANSCRIPT TO PROCESS]
 {{chunkText}}
 """
-        prompt_file = tmp_path / "prompt.txt"
+        prompt_file = tmp_path_factory.mktemp("integration") / "prompt.txt"
         prompt_file.write_text(content)
         return prompt_file
 
@@ -136,6 +140,29 @@ Title: {{fileName}}
         assert "Test Video" in md_path.read_text()
 
 
+class TestPackageImports:
+    """Test lazy package exports"""
+
+    def test_submodule_import_stays_lazy(self):
+        """Importing one submodule doesn't load the rest of the package"""
+        code = (
+            "import sys, src.chunker; "
+            "print('src.llm_processor' in sys.modules, 'src.state_manager' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent.parent
+        ).stdout
+        assert out.split() == ["False", "False"]
+
+    def test_exports_resolve(self):
+        """Every name in __all__ resolves on access"""
+        import src
+        for name in src.__all__:
+            assert getattr(src, name) is not None
+
+
 class TestErrorHandling:
     """Test error handling scenarios"""
 
@@ -1,13 +1,17 @@
 """Tests for LLM processor with mocked API calls"""
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from src.chunker import Chunk
 from src.llm_processor import (
     LLMProcessor,
     LLMProvider,
     ProcessedChunk,
     ProcessingError,
-    process_transcript
+    process_transcript,
+    _lazy_import,
+    _retry_after,
+    _wait_retry_after
 )
 
 
@@ -51,6 +55,48 @@ class TestProcessingError:
         assert "Chunk 1: API timeout" in str(error)
 
 
+class TestLazyImport:
+    """Test deferred SDK imports"""
+
+    def test_returns_loaded_module(self):
+        """Already imported modules are returned as-is"""
+        import json
+        assert _lazy_import("json") is json
+
+    def test_missing_module_raises(self):
+        """Missing modules fail at import time, not first use"""
+        with pytest.raises(ImportError):
+            _lazy_import("not_a_real_module_xyz")
+
+
+class TestRetryAfter:
+    """Test Retry-After aware backoff"""
+
+    @staticmethod
+    def error(headers):
+        error = Exception("rate limited")
+        error.response = Mock(headers=headers)
+        return error
+
+    def test_parses_seconds_and_http_date(self):
+        """Both Retry-After forms are understood"""
+        assert _retry_after(self.error({"retry-after": "7"})) == 7.0
+        assert _retry_after(self.error({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+        assert _retry_after(self.error({})) is None
+        assert _retry_after(Exception("no response")) is None
+
+    def test_wait_prefers_header_then_fallback(self):
+        """Header delay (capped) wins; otherwise the fallback wait is used"""
+        wait = _wait_retry_after(lambda state: 2.0, max_wait=60.0)
+
+        def state(error):
+            return Mock(outcome=Mock(exception=Mock(return_value=error)))
+
+        assert wait(state(self.error({"retry-after": "12"}))) == 12.0
+        assert wait(state(self.error({"retry-after": "600"}))) == 60.0
+        assert wait(state(Exception("plain"))) == 2.0
+
+
 class TestLLMProcessor:
     """Test LLMProcessor class"""
 
@@ -61,6 +107,30 @@ class TestLLMProcessor:
             assert processor.api_key == "test-key-123"
             assert processor.model == "claude-3-5-sonnet-20241022"
 
+    def test_client_shared_per_key(self):
+        """Processors with the same key reuse one client"""
+        with patch('src.llm_processor.anthropic.Anthropic') as mock_anthropic:
+            first = LLMProcessor(api_key="key-a")
+            second = LLMProcessor(api_key="key-a", model="claude-3-5-haiku-20241022")
+            other = LLMProcessor(api_key="key-b")
+
+        assert first.client is second.client
+        assert mock_anthropic.call_count == 2
+        assert other.api_key == "key-b"
+
+    def test_client_uses_http2_when_available(self):
+        """An HTTP/2 httpx client is injected only if h2 is installed"""
+        with patch('src.llm_processor.anthropic.Anthropic') as mock_anthropic, \
+                patch('src.llm_processor.anthropic.DefaultHttpxClient') as mock_http:
+            with patch('src.llm_processor.HAS_H2', False):
+                LLMProcessor(api_key="key-h1").client
+            with patch('src.llm_processor.HAS_H2', True):
+                LLMProcessor(api_key="key-h2").client
+
+        mock_http.assert_called_once_with(http2=True)
+        assert "http_client" not in mock_anthropic.call_args_list[0].kwargs
+        assert mock_anthropic.call_args_list[1].kwargs["http_client"] is mock_http.return_value
+
     def test_init_without_api_key_raises_error(self):
         """Raise ValueError when no API key provided"""
         with patch.dict('os.environ', {}, clear=True):
@@ -128,6 +198,21 @@ class TestLLMProcessor:
             assert "[NEW CONTENT TO PROCESS]" in prompt
             assert "New content" in prompt
 
+    def test_split_prompt_matches_build_prompt(self):
+        """Cached prefix plus user message is exactly the full prompt"""
+        chunk = Chunk(index=0, text="Says {{outputLanguage}}", start_timestamp="00:00:00")
+        template = "{{outputLanguage}} for {{fileName}}: {{chunkText}} ({{fileName}})"
+
+        with patch('src.llm_processor.anthropic.Anthropic'):
+            processor = LLMProcessor(api_key="test-key")
+            prompt = processor._build_prompt(chunk, template, "Video", "German")
+            prefix, message = processor._split_prompt(chunk, template, "Video", "German")
+
+        assert prefix == "German for Video: "
+        assert prefix + message == prompt
+        # Placeholders inside the transcript itself are left alone
+        assert prompt.endswith("Says {{outputLanguage}} (Video)")
+
     @patch('src.llm_processor.anthropic.Anthropic')
     def test_process_chunk_success(self, mock_anthropic):
         """Successfully process a chunk"""
@@ -156,6 +241,119 @@ class TestLLMProcessor:
         assert result.model == "claude-3-5-sonnet-20241022"
         assert result.provider == "anthropic"
 
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_static_prompt_prefix_cached(self, mock_anthropic):
+        """Prompt before {{chunkText}} goes in a cached system block, billed at cache rates"""
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Cleaned")]
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 0
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_response.usage.cache_read_input_tokens = 1000
+
+        mock_client = Mock()
+        mock_client.messages.create.return_value = mock_response
+        mock_anthropic.return_value = mock_client
+
+        chunk = Chunk(index=0, text="Original text", start_timestamp="00:00:00")
+        template = "Write {{outputLanguage}} for {{fileName}}:\n{{chunkText}}\nEnd of {{fileName}}"
+
+        processor = LLMProcessor(api_key="test-key")
+        result = processor.process_chunk(chunk, template, "Test Video", "German")
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [{
+            "type": "text",
+            "text": "Write German for Test Video:\n",
+            "cache_control": {"type": "ephemeral"}
+        }]
+        assert kwargs["messages"][0]["content"] == chunk.full_text_for_llm + "\nEnd of Test Video"
+        assert result.input_tokens == 1010
+        # 10 tokens at full price + 1000 cached tokens at 10% (Sonnet: $0.003/1K)
+        assert result.cost == pytest.approx(0.00003 + 0.0003)
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_short_chunks_routed_to_small_model(self, mock_anthropic):
+        """Chunks under ROUTE_MAX_CHARS go to small_model and are priced at its rates"""
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Cleaned")]
+        mock_response.usage.input_tokens = 1000
+        mock_response.usage.output_tokens = 0
+
+        mock_client = Mock()
+        mock_client.messages.create.return_value = mock_response
+        mock_anthropic.return_value = mock_client
+
+        processor = LLMProcessor(api_key="test-key", small_model="claude-3-5-haiku-20241022")
+        short = Chunk(index=0, text="Short", start_timestamp="00:00:00")
+        long = Chunk(index=1, text="x" * LLMProcessor.ROUTE_MAX_CHARS, start_timestamp="00:01:00")
+
+        result = processor.process_chunk(short, "Clean: {{chunkText}}")
+        assert mock_client.messages.create.call_args.kwargs["model"] == "claude-3-5-haiku-20241022"
+        assert result.model == "claude-3-5-haiku-20241022"
+        assert result.cost == 0.001
+
+        result = processor.process_chunk(long, "Clean: {{chunkText}}")
+        assert mock_client.messages.create.call_args.kwargs["model"] == "claude-3-5-sonnet-20241022"
+        assert result.cost == 0.003
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_process_chunk_streaming(self, mock_anthropic):
+        """Streaming reads the final message assembled by the SDK"""
+        final = Mock()
+        final.content = [Mock(text="Streamed output")]
+        final.usage.input_tokens = 100
+        final.usage.output_tokens = 80
+
+        mock_client = MagicMock()
+        stream = mock_client.messages.stream.return_value.__enter__.return_value
+        stream.get_final_message.return_value = final
+        mock_anthropic.return_value = mock_client
+
+        chunk = Chunk(index=0, text="Original text", start_timestamp="00:00:00")
+        processor = LLMProcessor(api_key="test-key", stream=True)
+        result = processor.process_chunk(chunk, "Clean: {{chunkText}}")
+
+        mock_client.messages.create.assert_not_called()
+        assert result.cleaned_text == "Streamed output"
+        assert result.input_tokens == 100
+
+    @patch('time.sleep')
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_process_chunk_retries_transient_errors(self, mock_anthropic, mock_sleep):
+        """Provider's retryable errors are retried up to max_attempts"""
+        class Transient(Exception):
+            pass
+
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Cleaned")]
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 5
+
+        mock_client = Mock()
+        mock_client.messages.create.side_effect = [Transient(), mock_response]
+        mock_anthropic.return_value = mock_client
+
+        chunk = Chunk(index=0, text="Text", start_timestamp="00:00:00")
+        processor = LLMProcessor(api_key="test-key")
+        with patch.object(processor, "_get_retry_exceptions", return_value=(Transient,)):
+            result = processor.process_chunk(chunk, "Clean: {{chunkText}}")
+
+            assert result.cleaned_text == "Cleaned"
+            assert mock_client.messages.create.call_count == 2
+
+            processor.max_attempts = 1
+            mock_client.messages.create.side_effect = Transient()
+            with pytest.raises(Transient):
+                processor.process_chunk(chunk, "Clean: {{chunkText}}")
+            assert mock_client.messages.create.call_count == 3
+
+    def test_small_model_must_match_provider(self):
+        """Routing across providers isn't possible with one client"""
+        with patch('src.llm_processor.anthropic.Anthropic'):
+            with pytest.raises(ValueError, match="small_model"):
+                LLMProcessor(api_key="test-key", small_model="deepseek-chat")
+
     @patch('src.llm_processor.anthropic.Anthropic')
     def test_process_all_chunks_with_callback(self, mock_anthropic):
         """Process multiple chunks with progress callback"""
@@ -209,6 +407,246 @@ class TestLLMProcessor:
 
         assert len(results) == 1
 
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_process_all_chunks_concurrent_preserves_order(self, mock_anthropic):
+        """Concurrent dispatch returns results in chunk order"""
+        import time
+
+        def fake_create(**kwargs):
+            content = kwargs["messages"][0]["content"]
+            # Earlier chunks finish last
+            time.sleep(0.05 if "Text 0" in content else 0.0)
+            response = Mock()
+            response.content = [Mock(text=content)]
+            response.usage.input_tokens = 10
+            response.usage.output_tokens = 5
+            return response
+
+        mock_client = Mock()
+        mock_client.messages.create.side_effect = fake_create
+        mock_anthropic.return_value = mock_client
+
+        chunks = [
+            Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00")
+            for i in range(4)
+        ]
+
+        callback_calls = []
+        processor = LLMProcessor(api_key="test-key")
+        results = processor.process_all_chunks(
+            chunks, "{{chunkText}}",
+            progress_callback=lambda c, t: callback_calls.append((c, t)),
+            max_concurrency=4
+        )
+
+        assert [r.chunk_index for r in results] == [0, 1, 2, 3]
+        assert all(f"Text {r.chunk_index}" in r.cleaned_text for r in results)
+        assert callback_calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+class TestAsyncProcessing:
+    """Test async processing path"""
+
+    @staticmethod
+    def async_client(mock_async_anthropic, create):
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=create)
+        mock_async_anthropic.return_value.__aenter__.return_value = mock_client
+        return mock_client
+
+    @staticmethod
+    def response(text):
+        mock_response = Mock()
+        mock_response.content = [Mock(text=text)]
+        mock_response.usage.input_tokens = 50
+        mock_response.usage.output_tokens = 40
+        return mock_response
+
+    @patch('src.llm_processor.anthropic.AsyncAnthropic')
+    def test_async_bounded_and_ordered(self, mock_async_anthropic):
+        """Requests overlap up to max_concurrency; results keep chunk order"""
+        in_flight = peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.response(kwargs["messages"][0]["content"])
+
+        self.async_client(mock_async_anthropic, create)
+        chunks = [
+            Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00")
+            for i in range(6)
+        ]
+        progress = []
+
+        processor = LLMProcessor(api_key="test-key")
+        results = asyncio.run(processor.process_all_chunks_async(
+            chunks, "{{chunkText}}",
+            progress_callback=lambda done, total: progress.append(done),
+            max_concurrency=3
+        ))
+
+        assert [r.chunk_index for r in results] == list(range(6))
+        assert all(f"Text {r.chunk_index}" in r.cleaned_text for r in results)
+        assert peak == 3
+        assert progress == [1, 2, 3, 4, 5, 6]
+        mock_async_anthropic.assert_called_once_with(api_key="test-key")
+
+    @patch('src.llm_processor.anthropic.AsyncAnthropic')
+    def test_async_failure_cancels_waiting_chunks(self, mock_async_anthropic):
+        """A non-retryable error stops chunks that haven't started"""
+        async def create(**kwargs):
+            if "Text 0" in kwargs["messages"][0]["content"]:
+                raise ValueError("bad request")
+            await asyncio.sleep(0.01)
+            return self.response("ok")
+
+        mock_client = self.async_client(mock_async_anthropic, create)
+        chunks = [
+            Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00")
+            for i in range(5)
+        ]
+
+        processor = LLMProcessor(api_key="test-key")
+        with pytest.raises(ValueError):
+            asyncio.run(processor.process_all_chunks_async(
+                chunks, "{{chunkText}}", max_concurrency=1
+            ))
+
+        assert mock_client.messages.create.await_count == 1
+
+    @patch('src.llm_processor.anthropic.AsyncAnthropic')
+    def test_async_streaming(self, mock_async_anthropic):
+        """stream=True also streams on the async path"""
+        mock_client = MagicMock()
+        stream = mock_client.messages.stream.return_value.__aenter__.return_value
+        stream.get_final_message = AsyncMock(return_value=self.response("Streamed output"))
+        mock_async_anthropic.return_value.__aenter__.return_value = mock_client
+
+        chunk = Chunk(index=0, text="Text 0", start_timestamp="00:00:00")
+        processor = LLMProcessor(api_key="test-key", stream=True)
+        result = asyncio.run(processor.process_chunk_async(chunk, "{{chunkText}}"))
+
+        mock_client.messages.create.assert_not_called()
+        assert result.cleaned_text == "Streamed output"
+
+
+class TestBatchMode:
+    """Test Message Batches API path"""
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_submit_batch_builds_requests(self, mock_anthropic):
+        """One request per chunk, keyed by chunk index"""
+        mock_client = Mock()
+        mock_client.messages.batches.create.return_value = Mock(id="msgbatch_123")
+        mock_anthropic.return_value = mock_client
+
+        chunks = [
+            Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00")
+            for i in range(3)
+        ]
+        processor = LLMProcessor(api_key="test-key")
+        batch_id = processor.submit_batch(chunks, "Clean: {{chunkText}}")
+
+        assert batch_id == "msgbatch_123"
+        requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["chunk_0", "chunk_1", "chunk_2"]
+        assert "Text 1" in requests[1]["params"]["messages"][0]["content"]
+        assert requests[0]["params"]["model"] == "claude-3-5-sonnet-20241022"
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_collect_batch_results_maps_custom_ids(self, mock_anthropic):
+        """Results are keyed back to chunks and billed at the batch rate"""
+        def entry(custom_id, result_type="succeeded"):
+            e = Mock()
+            e.custom_id = custom_id
+            e.result.type = result_type
+            e.result.message.content = [Mock(text=f"Cleaned {custom_id}")]
+            e.result.message.usage.input_tokens = 1000
+            e.result.message.usage.output_tokens = 1000
+            return e
+
+        mock_client = Mock()
+        mock_client.messages.batches.results.return_value = [
+            entry("chunk_2"), entry("chunk_0"), entry("chunk_1", "errored")
+        ]
+        mock_anthropic.return_value = mock_client
+
+        chunks = [
+            Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00")
+            for i in range(3)
+        ]
+        processor = LLMProcessor(api_key="test-key")
+        results, failed = processor.collect_batch_results("msgbatch_123", chunks)
+
+        assert [r.chunk_index for r in results] == [0, 2]
+        assert results[0].cleaned_text == "Cleaned chunk_0"
+        assert failed == {1: "errored"}
+        # (0.003 + 0.015) * 0.5
+        assert results[0].cost == 0.009
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_collect_batch_results_rejects_garbled_sections(self, mock_anthropic):
+        """A packed request without its output sections counts as failed"""
+        from src.chunk_batcher import ChunkBatch
+
+        entry = Mock()
+        entry.custom_id = "chunk_0"
+        entry.result.type = "succeeded"
+        entry.result.message.content = [Mock(text="Unmarked output")]
+        entry.result.message.usage.input_tokens = 1000
+        entry.result.message.usage.output_tokens = 1000
+        mock_client = Mock()
+        mock_client.messages.batches.results.return_value = [entry]
+        mock_anthropic.return_value = mock_client
+
+        members = [Chunk(index=i, text=f"Text {i}", start_timestamp="00:00:00") for i in range(2)]
+        packed = ChunkBatch(index=0, members=members).to_chunk()
+        processor = LLMProcessor(api_key="test-key")
+        results, failed = processor.collect_batch_results("msgbatch_123", [packed])
+
+        assert results == []
+        assert failed == {0: "mismatched_sections"}
+
+    @patch('src.llm_processor.time.sleep')
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_wait_for_batch_backs_off(self, mock_anthropic, mock_sleep):
+        """Poll interval doubles while idle and resets on progress"""
+        def status(state, processing):
+            batch = Mock()
+            batch.processing_status = state
+            batch.request_counts = Mock(
+                processing=processing, succeeded=0, errored=0, canceled=0, expired=0
+            )
+            return batch
+
+        mock_client = Mock()
+        mock_client.messages.batches.retrieve.side_effect = [
+            status("in_progress", 4),
+            status("in_progress", 4),
+            status("in_progress", 4),
+            status("in_progress", 2),
+            status("ended", 0),
+        ]
+        mock_anthropic.return_value = mock_client
+
+        processor = LLMProcessor(api_key="test-key")
+        final = processor.wait_for_batch("msgbatch_123", 4, poll_interval=10, max_poll_interval=30)
+
+        assert final["status"] == "ended"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [10, 20, 30, 10]
+
+    @patch.object(LLMProcessor, '_init_client')
+    def test_submit_batch_deepseek_unsupported(self, mock_init_client):
+        """Batch mode is Anthropic-only"""
+        processor = LLMProcessor(api_key="test-key", model="deepseek-chat")
+
+        with pytest.raises(ValueError, match="Batch mode not supported"):
+            processor.submit_batch([], "Template")
+
 
 class TestProcessTranscript:
     """Test convenience function"""
@@ -246,6 +684,29 @@ class TestProcessTranscript:
         assert "total_cost" in summary
 
 
+    @patch.object(LLMProcessor, 'process_all_chunks')
+    @patch.object(LLMProcessor, 'process_all_chunks_batch')
+    @patch.object(LLMProcessor, 'load_prompt_template', return_value="Template")
+    @patch.object(LLMProcessor, '_init_client')
+    def test_auto_batch_mode_uses_threshold(self, _client, _template, mock_batch, mock_interactive):
+        """batch_mode=None picks batches only for large jobs on Anthropic"""
+        mock_batch.return_value = mock_interactive.return_value = []
+        small = [Chunk(index=0, text="Text", start_timestamp="00:00:00")]
+        large = [
+            Chunk(index=i, text="Text", start_timestamp="00:00:00")
+            for i in range(LLMProcessor.BATCH_THRESHOLD)
+        ]
+
+        process_transcript(small, "test-key", "Video", batch_mode=None)
+        assert mock_interactive.call_count == 1 and mock_batch.call_count == 0
+
+        process_transcript(large, "test-key", "Video", batch_mode=None)
+        assert mock_batch.call_count == 1
+
+        process_transcript(large, "test-key", "Video", model="deepseek-chat", batch_mode=None)
+        assert mock_batch.call_count == 1 and mock_interactive.call_count == 2
+
+
 class TestLLMProcessorDeepSeek:
     """Test LLMProcessor with DeepSeek provider"""
 
@@ -330,6 +791,33 @@ class TestLLMProcessorDeepSeek:
         assert result.model == "deepseek-chat"
         assert result.provider == "deepseek"
 
+    @patch('builtins.__import__')
+    def test_deepseek_process_chunk_streaming(self, mock_import):
+        """Streamed deltas are joined; usage comes from the final event"""
+        mock_openai = Mock()
+        mock_client = Mock()
+
+        def event(content=None, usage=None):
+            choices = [Mock(delta=Mock(content=content))] if usage is None else []
+            return Mock(choices=choices, usage=usage)
+
+        mock_client.chat.completions.create.return_value = iter([
+            event("DeepSeek "), event(None), event("streamed"),
+            event(usage=Mock(prompt_tokens=90, completion_tokens=70))
+        ])
+        mock_openai.OpenAI.return_value = mock_client
+        mock_import.return_value = mock_openai
+
+        chunk = Chunk(index=0, text="Original text", start_timestamp="00:00:00")
+        processor = LLMProcessor(api_key="test-key", model="deepseek-chat", stream=True)
+        result = processor.process_chunk(chunk, "Clean: {{chunkText}}")
+
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert result.cleaned_text == "DeepSeek streamed"
+        assert result.input_tokens == 90
+        assert result.output_tokens == 70
+
     @patch('builtins.__import__')
     def test_cost_calculation_deepseek_chat(self, mock_import):
         """Calculate cost for deepseek-chat model"""
@@ -25,6 +25,30 @@ Today we'll learn about Python.
         assert segments[0].text == "Hello, welcome to the lecture."
         assert segments[0].start_time == "00:00:01"
 
+    @pytest.mark.parametrize("srt_content", [
+        "1\r\n00:00:01,000 --> 00:00:04,000\r\n<i>Hello</i>  there\r\nsecond line\r\n",
+        # Irregular files go through pysrt
+        "1\n0:00:01,000 --> 0:00:04,000\nShort hour\n\n2\n00:00:05,000 --> 00:00:06,000\nOk\n",
+        "00:00:01,000 --> 00:00:04,000\nNo index\n",
+    ])
+    def test_srt_direct_parse_matches_pysrt(self, tmp_path, srt_content):
+        """Direct SRT parsing yields the same segments as pysrt"""
+        import pysrt
+
+        srt_file = tmp_path / "test.srt"
+        srt_file.write_bytes(b"\xef\xbb\xbf" + srt_content.encode("utf-8"))
+
+        parser = TranscriptParser()
+        expected = [
+            TranscriptSegment(
+                sub.index, parser._format_time(sub.start),
+                parser._format_time(sub.end), parser._clean_text(sub.text)
+            )
+            for sub in pysrt.open(str(srt_file))
+        ]
+
+        assert parser.parse(srt_file) == expected
+
     def test_deduplicate_segments(self, tmp_path):
         """Remove consecutive duplicate lines"""
         srt_content = """1
@@ -78,6 +102,39 @@ Different text
         assert "Same timestamp" in text
         assert "Later line" in text
 
+    @pytest.mark.parametrize("name, encoding", [
+        ("sample.srt", "utf-8"),
+        ("sample.vtt", "utf-8"),
+        ("sample.srt", "utf-16"),
+        ("sample.vtt", "utf-16"),
+    ])
+    def test_parse_from_bytes_matches_file(self, name, encoding):
+        """In-memory parsing of uploads matches parsing the file"""
+        from pathlib import Path
+
+        path = Path(__file__).parent / "fixtures" / name
+        content = path.read_text(encoding="utf-8").encode(encoding)
+
+        parser = TranscriptParser()
+        assert parser.parse_from_bytes(content, name) == parser.parse(path)
+
+    @pytest.mark.parametrize("texts", [
+        ["First line", "Same timestamp", "Later line"],
+        ["[Music]", "Welcome back", "[Applause]"],
+        ["", "After empty", "Tail"],
+        ["[00:01:00]", "Looks like a timestamp", "Normal"],
+    ])
+    def test_direct_join_matches_normalization(self, texts):
+        """Direct join gives the same text as the regex normalization"""
+        segments = [
+            TranscriptSegment(i, time, time, text)
+            for i, (time, text) in enumerate(zip(["00:00:01", "00:00:01", "00:00:10"], texts))
+        ]
+        raw = "\n[00:00:01]\n" + "\n".join(texts[:2]) + "\n\n[00:00:10]\n" + texts[2]
+
+        parser = TranscriptParser()
+        assert parser.to_plain_text(segments) == parser._normalize_transcript_whitespace(raw)
+
 
 class TestWhitespaceNormalization:
     """Tests for _normalize_transcript_whitespace method"""
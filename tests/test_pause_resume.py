@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 
 from src.state_manager import StateManager, ProcessingState
 from src.resumable_processor import ResumableProcessor, PauseRequested
-from src.llm_processor import ProcessedChunk
+from src.llm_processor import ProcessedChunk, LLMProvider
 from src.chunker import Chunk
 
 
@@ -104,6 +104,10 @@ class TestProcessingState:
         state.status = "paused"
         assert state.is_resumable()
 
+        # Crashed mid-run - resumable
+        state.status = "crashed"
+        assert state.is_resumable()
+
     def test_get_remaining_chunks(self):
         """Test getting remaining chunks"""
         state = ProcessingState(
@@ -126,6 +130,27 @@ class TestProcessingState:
         assert state.total_input_tokens == sample_processed_chunk.input_tokens
         assert len(state.processed_results) == 1
 
+    def test_add_completed_chunk_out_of_order(self):
+        """Chunks stay sorted and a re-added chunk replaces its result"""
+        state = ProcessingState(total_chunks=4)
+        for i in (2, 0, 3):
+            state.add_completed_chunk(ProcessedChunk(i, "o", f"c{i}", 1, 1, 0.0, "m", "anthropic"))
+        state.add_completed_chunk(ProcessedChunk(0, "o", "redo", 1, 1, 0.0, "m", "anthropic"))
+
+        assert state.completed_chunks == [0, 2, 3]
+        assert state.is_completed(3) and not state.is_completed(1)
+        assert [r["cleaned_text"] for r in state.processed_results] == ["c2", "redo", "c3"]
+
+    def test_retried_chunk_clears_failure(self, sample_processed_chunk):
+        """Completing a previously failed chunk removes the failure"""
+        state = ProcessingState(total_chunks=5)
+        state.add_failed_chunk(0, "Timeout")
+
+        state.add_completed_chunk(sample_processed_chunk)
+
+        assert state.failed_chunks == {}
+        assert state.completed_chunks == [0]
+
     def test_add_failed_chunk(self):
         """Test recording failed chunk"""
         state = ProcessingState()
@@ -183,6 +208,73 @@ class TestStateManager:
         # Backup should exist
         assert state_manager.backup_file.exists()
 
+    def test_state_round_trip_without_orjson(self, state_manager, sample_processed_chunk):
+        """Stdlib fallback writes compact JSON that reads back the same"""
+        state = ProcessingState(file_id="test1", total_chunks=3)
+        state.add_completed_chunk(sample_processed_chunk)
+
+        with patch('src.state_manager.HAS_ORJSON', False):
+            state_manager.write_state(state)
+            fallback = state_manager.state_file.read_bytes()
+            loaded = state_manager.read_state()
+
+        assert b"\n" not in fallback
+        assert json.loads(fallback)["file_id"] == "test1"
+        assert loaded.processed_results == state.processed_results
+        # Files from either serializer read back identically
+        assert state_manager.read_state().to_dict() == loaded.to_dict()
+
+    def test_record_result_replays_journal(self, state_manager, sample_processed_chunk):
+        """Results are appended to the journal and replayed on read"""
+        state = ProcessingState(file_id="test1", status="processing", total_chunks=3)
+        state_manager.write_state(state)
+        snapshot = state_manager.state_file.read_bytes()
+
+        state_manager.record_result(state, sample_processed_chunk)
+
+        # Snapshot untouched; result only in the journal
+        assert state_manager.state_file.read_bytes() == snapshot
+        assert state_manager.journal_file.exists()
+
+        loaded = state_manager.read_state()
+        assert loaded.completed_chunks == [0]
+        assert loaded.processed_results == state.processed_results
+        assert loaded.total_input_tokens == 100
+
+        # Full write folds the journal into the snapshot
+        state_manager.write_state(state)
+        assert not state_manager.journal_file.exists()
+        assert state_manager.read_state().completed_chunks == [0]
+
+    def test_journal_snapshot_every(self, state_manager):
+        """Every SNAPSHOT_EVERY results the state is rewritten in full"""
+        state = ProcessingState(file_id="test1", status="processing", total_chunks=30)
+        state_manager.write_state(state)
+
+        for i in range(StateManager.SNAPSHOT_EVERY):
+            state_manager.record_result(state, ProcessedChunk(
+                i, "a", "b", 1, 1, 0.001, "m", "anthropic"
+            ))
+
+        assert not state_manager.journal_file.exists()
+        on_disk = json.loads(state_manager.state_file.read_bytes())
+        assert len(on_disk["completed_chunks"]) == StateManager.SNAPSHOT_EVERY
+
+    def test_journal_replay_tolerates_crash(self, state_manager, sample_processed_chunk):
+        """Torn last lines and already-snapshotted entries are skipped"""
+        state = ProcessingState(file_id="test1", status="processing", total_chunks=3)
+        state_manager.record_result(state, sample_processed_chunk)
+        journal = state_manager.journal_file.read_bytes()
+
+        # Crash after the snapshot landed but before the journal was reset
+        state_manager.write_state(state)
+        state_manager.journal_file.write_bytes(journal + b'{"chunk_index": 1, "orig')
+
+        loaded = state_manager.read_state()
+        assert loaded.completed_chunks == [0]
+        assert loaded.total_input_tokens == 100
+        assert loaded.actual_cost == pytest.approx(0.005)
+
     def test_create_new_state(self, state_manager):
         """Test creating new state"""
         config = {"model": "claude-3-5-sonnet-20241022", "provider": "anthropic"}
@@ -264,6 +356,7 @@ class TestResumableProcessor:
             # Configure mock to have necessary attributes
             mock_instance = mock_llm.return_value
             mock_instance.model = "claude-3-5-sonnet-20241022"
+            mock_instance.small_model = None
             mock_instance.provider = Mock()
             mock_instance.provider.value = "anthropic"
             mock_instance.temperature = 0.3
@@ -315,6 +408,342 @@ class TestResumableProcessor:
         assert resumed_state.status == "paused"
         assert len(resumed_state.completed_chunks) == 2
 
+    def test_find_resumable_job_matches_fingerprint(self, mock_processor, sample_chunks):
+        """Only a state created for the same chunks and prompt is resumable"""
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        state = mock_processor.state_manager.read_state()
+        state.status = "crashed"
+        state.completed_chunks = [0]
+        mock_processor.state_manager.write_state(state)
+
+        assert mock_processor.find_resumable_job(sample_chunks, "Prompt", "Test") is not None
+        assert mock_processor.find_resumable_job(sample_chunks, "Other prompt", "Test") is None
+        assert mock_processor.find_resumable_job(sample_chunks[:2], "Prompt", "Test") is None
+
+    def test_resume_skips_completed_chunks(self, mock_processor, sample_chunks):
+        """Resuming after a crash only processes unfinished chunks"""
+        def fake_process(chunk, *args):
+            return ProcessedChunk(
+                chunk_index=chunk.index,
+                original_text=chunk.text,
+                cleaned_text=f"Clean {chunk.index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.001,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        mock_processor.processor.process_chunk.side_effect = [
+            fake_process(sample_chunks[0]),
+            ValueError("boom")
+        ]
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        with pytest.raises(ValueError):
+            mock_processor.process_all_chunks(sample_chunks, "Prompt", "Test")
+
+        assert mock_processor.find_resumable_job(sample_chunks, "Prompt", "Test") is not None
+
+        mock_processor.processor.process_chunk.side_effect = fake_process
+        results, summary = mock_processor.process_all_chunks(
+            sample_chunks, "Prompt", "Test", resume=True
+        )
+
+        processed = [c.args[0].index for c in mock_processor.processor.process_chunk.call_args_list]
+        assert processed == [0, 1, 1, 2]
+        assert [r.chunk_index for r in results] == [0, 1, 2]
+        assert summary["failed_chunks"] == 0
+
+    def test_resume_requires_resumable_state(self, mock_processor, sample_chunks):
+        """resume=True refuses to start a job that was never interrupted"""
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+
+        with pytest.raises(ValueError, match="No resumable job"):
+            mock_processor.process_all_chunks(sample_chunks, "Prompt", "Test", resume=True)
+
+        mock_processor.processor.process_chunk.assert_not_called()
+        assert not mock_processor.is_processing()
+
+    def test_concurrent_processing_keeps_order(self, mock_processor, sample_chunks):
+        """Chunks run concurrently; results come back in chunk order"""
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_process(chunk, *args):
+            barrier.wait()  # All three must be in flight at once
+            return ProcessedChunk(
+                chunk_index=chunk.index,
+                original_text=chunk.text,
+                cleaned_text=f"Clean {chunk.index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.001,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        mock_processor.max_concurrency = 3
+        mock_processor.processor.process_chunk.side_effect = fake_process
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        results, summary = mock_processor.process_all_chunks(sample_chunks, "Prompt", "Test")
+
+        assert [r.chunk_index for r in results] == [0, 1, 2]
+        assert summary["total_input_tokens"] == 30
+        assert mock_processor.state_manager.read_state().status == "completed"
+
+    def test_result_callback_after_checkpoint(self, mock_processor, sample_chunks):
+        """Each completed chunk is reported once it is saved"""
+        def fake_process(chunk, *args):
+            return ProcessedChunk(
+                chunk_index=chunk.index,
+                original_text=chunk.text,
+                cleaned_text=f"Clean {chunk.index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.001,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        seen = []
+
+        def on_result(result):
+            state = mock_processor.state_manager.read_state()
+            seen.append((result.chunk_index, result.chunk_index in state.completed_chunks))
+
+        mock_processor.processor.process_chunk.side_effect = fake_process
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        mock_processor.process_all_chunks(
+            sample_chunks, "Prompt", "Test", result_callback=on_result
+        )
+
+        assert seen == [(0, True), (1, True), (2, True)]
+
+    def test_pause_saves_in_flight_chunks(self, mock_processor, sample_chunks):
+        """Pausing stops new requests but keeps finished ones"""
+        def fake_process(chunk, *args):
+            mock_processor.pause()
+            return ProcessedChunk(
+                chunk_index=chunk.index,
+                original_text=chunk.text,
+                cleaned_text=f"Clean {chunk.index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.001,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        mock_processor.processor.process_chunk.side_effect = fake_process
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        with pytest.raises(PauseRequested):
+            mock_processor.process_all_chunks(sample_chunks, "Prompt", "Test")
+
+        state = mock_processor.state_manager.read_state()
+        assert state.status == "paused"
+        assert state.completed_chunks == [0]
+
+    def test_rate_limit_backs_off_and_retries(self, mock_processor, sample_chunks):
+        """A 429 halves concurrency and requeues the chunk instead of failing it"""
+        class RateLimited(Exception):
+            pass
+
+        calls = []
+
+        def fake_process(chunk, *args):
+            calls.append(chunk.index)
+            if chunk.index == 1 and calls.count(1) == 1:
+                raise RateLimited("429")
+            return ProcessedChunk(
+                chunk_index=chunk.index,
+                original_text=chunk.text,
+                cleaned_text=f"Clean {chunk.index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.001,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        mock_processor.max_concurrency = 4
+        mock_processor.processor.process_chunk.side_effect = fake_process
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        with patch.object(mock_processor, "_backoff_delay", return_value=0), \
+                patch.object(mock_processor, "_is_rate_limit_error",
+                             side_effect=lambda e: isinstance(e, RateLimited)), \
+                patch.object(mock_processor, "_is_recoverable_error",
+                             side_effect=lambda e: isinstance(e, RateLimited)):
+            results, _ = mock_processor.process_all_chunks(sample_chunks, "Prompt", "Test")
+
+        assert [r.chunk_index for r in results] == [0, 1, 2]
+        assert calls.count(1) == 2
+        assert mock_processor.current_concurrency == 2
+        state = mock_processor.state_manager.read_state()
+        assert state.failed_chunks == {}
+
+    def test_rate_limit_one_provider_call_per_attempt(self, temp_state_dir):
+        """A 429 is retried by the requeue only, not again inside LLMProcessor"""
+        import anthropic
+
+        response = Mock()
+        response.content = [Mock(text="Clean")]
+        response.usage.input_tokens = 10
+        response.usage.output_tokens = 8
+        rate_limited = anthropic.RateLimitError(
+            "429", response=Mock(status_code=429, headers={}), body=None
+        )
+
+        with patch('src.llm_processor.anthropic.Anthropic') as mock_anthropic:
+            client = mock_anthropic.return_value
+            client.messages.create.side_effect = [rate_limited, response]
+            processor = ResumableProcessor(api_key="test-key", state_dir=temp_state_dir)
+            chunks = [Chunk(index=0, text="Chunk 0", start_timestamp="00:00:00")]
+            processor.start_new_job(
+                chunks=chunks, file_name="test.srt", video_title="Test", prompt_template="Prompt"
+            )
+            with patch.object(processor, "_backoff_delay", return_value=0):
+                results, _ = processor.process_all_chunks(chunks, "Prompt", "Test")
+
+        assert [r.cleaned_text for r in results] == ["Clean"]
+        assert client.messages.create.call_count == 2
+        assert processor.current_concurrency == processor.max_concurrency // 2
+
+    def test_concurrency_recovers_after_successes(self, mock_processor):
+        """Concurrency grows back by one per success streak, up to the ceiling"""
+        mock_processor.max_concurrency = 4
+        mock_processor.current_concurrency = 4
+        mock_processor._on_rate_limited()
+        mock_processor._on_rate_limited()
+        assert mock_processor.current_concurrency == 1
+
+        for _ in range(mock_processor.INCREASE_AFTER * 5):
+            mock_processor._on_success()
+        assert mock_processor.current_concurrency == 4
+
+    def test_garbled_packed_response_not_cached(self, temp_state_dir, tmp_path):
+        """A packed response missing its sections fails the request and stays resumable"""
+        from src.chunk_batcher import ChunkBatch
+        from src.response_cache import ResponseCache
+
+        response = Mock()
+        response.content = [Mock(text="Unmarked output")]
+        response.usage.input_tokens = 10
+        response.usage.output_tokens = 8
+        members = [Chunk(index=i, text=f"Chunk {i}", start_timestamp="00:00:00") for i in range(2)]
+        chunks = [ChunkBatch(index=0, members=members).to_chunk()]
+        cache = ResponseCache(tmp_path / "cache")
+
+        with patch('src.llm_processor.anthropic.Anthropic') as mock_anthropic:
+            mock_anthropic.return_value.messages.create.return_value = response
+            processor = ResumableProcessor(
+                api_key="test-key", state_dir=temp_state_dir, cache=cache
+            )
+            processor.start_new_job(
+                chunks=chunks, file_name="test.srt", video_title="Test", prompt_template="Prompt"
+            )
+            with patch.object(processor, "_backoff_delay", return_value=0):
+                results, summary = processor.process_all_chunks(chunks, "Prompt", "Test")
+
+        assert results == []
+        assert summary["failed_chunks"] == 1
+        assert cache.count_cached(processor.processor.model, chunks, "Prompt", "Test") == 0
+        state = processor.state_manager.read_state()
+        assert state.completed_chunks == []
+        assert state.is_resumable()
+
+    def test_fallback_pool_keeps_primary_concurrency(self, temp_state_dir):
+        """Adding a fallback adds capacity; retries stay with the requeue"""
+        with patch('src.client_pool.LLMProcessor'):
+            processor = ResumableProcessor(
+                api_key="test-key",
+                state_dir=temp_state_dir,
+                fallback_endpoints=[{"model": "deepseek-chat", "api_key": "key-b"}]
+            )
+
+        primary = ResumableProcessor.DEFAULT_CONCURRENCY[LLMProvider.ANTHROPIC]
+        assert processor.max_concurrency == primary + 2
+        assert processor.processor.max_retries == 0
+
+    def test_batch_checkpoints_results(self, mock_processor, sample_chunks):
+        """Batch results are saved to state; failures leave the job resumable"""
+        def result(index):
+            return ProcessedChunk(
+                chunk_index=index,
+                original_text=f"Chunk {index}",
+                cleaned_text=f"Clean {index}",
+                input_tokens=10,
+                output_tokens=8,
+                cost=0.0005,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+
+        llm = mock_processor.processor
+        llm.cache = None
+        llm.submit_batch.return_value = "msgbatch_1"
+        llm.collect_batch_results.return_value = ([result(0), result(2)], {1: "errored"})
+
+        mock_processor.start_new_job(
+            chunks=sample_chunks,
+            file_name="test.srt",
+            video_title="Test",
+            prompt_template="Prompt"
+        )
+        batch_id = mock_processor.submit_batch(sample_chunks, "Prompt", "Test")
+        # Saved so polling can resume after a restart
+        assert mock_processor.pending_batch_id() == "msgbatch_1"
+        results, summary = mock_processor.collect_batch(batch_id, sample_chunks, "Prompt", "Test")
+
+        assert batch_id == "msgbatch_1"
+        assert mock_processor.pending_batch_id() is None
+        assert [r.chunk_index for r in results] == [0, 2]
+        assert summary["failed_chunks"] == 1
+        assert summary["batch_id"] == "msgbatch_1"
+
+        state = mock_processor.state_manager.read_state()
+        assert state.status == "paused"
+        assert state.completed_chunks == [0, 2]
+
+        # Resubmitting only sends the failed chunk
+        mock_processor.submit_batch(sample_chunks, "Prompt", "Test")
+        resubmitted = llm.submit_batch.call_args.args[0]
+        assert [c.index for c in resubmitted] == [1]
+
     def test_pause_functionality(self, mock_processor):
         """Test pause mechanism"""
         assert not mock_processor.pause_event.is_set()
@@ -339,6 +768,25 @@ class TestResumableProcessor:
         assert state is None
 
 
+def test_state_summary_rereads_only_on_change(temp_state_dir):
+    """Read-only checks reuse the parsed state until the file changes"""
+    writer = StateManager(state_dir=temp_state_dir)
+    reader = StateManager(state_dir=temp_state_dir)
+    writer.write_state(ProcessingState(file_id="a", status="paused", total_chunks=3))
+
+    with patch.object(reader, 'read_state', wraps=reader.read_state) as mock_read:
+        assert reader.has_resumable_state()
+        assert reader.get_state_summary()["status"] == "paused"
+        assert mock_read.call_count == 1
+
+        writer.write_state(ProcessingState(file_id="a", status="completed", total_chunks=3))
+        assert not reader.has_resumable_state()
+        assert mock_read.call_count == 2
+
+    writer.clear_state()
+    assert reader.get_state_summary() is None
+
+
 def test_file_locking(temp_state_dir):
     """Test file locking prevents concurrent writes"""
     manager1 = StateManager(state_dir=temp_state_dir)
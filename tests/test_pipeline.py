@@ -0,0 +1,72 @@
+"""Tests for UI-free pipeline steps"""
+import pytest
+
+from src import pipeline
+from src.llm_processor import LLMProcessor, ProcessedChunk, summarize_results
+from src.response_cache import ResponseCache
+
+
+SRT = b"""1
+00:00:01,000 --> 00:00:05,000
+Hello everyone, welcome to the lecture.
+
+2
+00:00:06,000 --> 00:00:10,000
+Today we're going to talk about machine learning.
+"""
+
+
+def make_result(chunk, text="Cleaned text."):
+    return ProcessedChunk(
+        chunk_index=chunk.index,
+        original_text=chunk.text,
+        cleaned_text=text,
+        input_tokens=100,
+        output_tokens=50,
+        cost=0.01,
+        model="claude-3-5-sonnet-20241022",
+        provider="anthropic"
+    )
+
+
+class TestPipeline:
+
+    def test_uncached_indices(self, tmp_path):
+        """Only chunks without cached responses are reported"""
+        chunks = pipeline.chunk(pipeline.parse(SRT, "lecture.srt"), chunk_size=1000, overlap=0)
+        cache = ResponseCache(tmp_path / "cache")
+        model = "claude-3-5-sonnet-20241022"
+
+        assert pipeline.uncached_indices(chunks, model, "Prompt", cache=cache) == [0]
+        cache.set(cache.make_key(model, chunks[0], "Prompt"), make_result(chunks[0]))
+        assert pipeline.uncached_indices(chunks, model, "Prompt", cache=cache) == []
+
+    def test_cache_keys_follow_routing(self, tmp_path):
+        """Chunks routed to small_model are found under the key the processor caches them at"""
+        chunks = pipeline.chunk(pipeline.parse(SRT, "lecture.srt"), chunk_size=1000, overlap=0)
+        cache = ResponseCache(tmp_path / "cache")
+        model, small = "claude-3-5-sonnet-20241022", "claude-3-5-haiku-20241022"
+        processor = LLMProcessor(api_key="test-key", model=model, small_model=small)
+        routed = processor.route_model(chunks[0])
+        cache.set(cache.make_key(routed, chunks[0], "Prompt"), make_result(chunks[0]))
+
+        assert routed == small
+        assert pipeline.route_models(chunks, model, small) == [small]
+        assert pipeline.uncached_indices(
+            chunks, model, "Prompt", cache=cache, small_model=small
+        ) == []
+        assert cache.count_cached(model, chunks, "Prompt", small_model=small) == 1
+
+    def test_finalize_writes_output(self, tmp_path):
+        """Finalize validates and writes markdown + metadata"""
+        chunks = pipeline.chunk(pipeline.parse(SRT, "lecture.srt"))
+        results = [make_result(c) for c in chunks]
+        summary = summarize_results(results, "claude-3-5-sonnet-20241022")
+
+        final = pipeline.finalize(results, summary, "Lecture", output_dir=str(tmp_path))
+
+        assert summary["total_cost"] == pytest.approx(0.01 * len(chunks))
+        assert summary["cache_hits"] == 0
+        assert final.output.md_path.exists()
+        assert b"Cleaned text." in final.output.markdown_bytes
+        assert len(final.results) == len(chunks)
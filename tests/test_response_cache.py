@@ -0,0 +1,105 @@
+"""Tests for chunk response cache"""
+import pytest
+from unittest.mock import Mock, patch
+from src.chunker import Chunk
+from src.llm_processor import LLMProcessor, ProcessedChunk
+from src.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def chunk():
+    return Chunk(index=3, text="Some transcript text", start_timestamp="00:03:00")
+
+
+def make_result(chunk):
+    return ProcessedChunk(
+        chunk_index=chunk.index,
+        original_text=chunk.text,
+        cleaned_text="Cleaned text",
+        input_tokens=100,
+        output_tokens=80,
+        cost=0.0015,
+        model="claude-3-5-sonnet-20241022",
+        provider="anthropic"
+    )
+
+
+class TestResponseCache:
+
+    def test_key_depends_on_inputs(self, chunk):
+        """Any input that shapes the response changes the key"""
+        base = ResponseCache.make_key("model-a", chunk, "Prompt", "Title", "English")
+
+        assert base == ResponseCache.make_key("model-a", chunk, "Prompt", "Title", "English")
+        assert base != ResponseCache.make_key("model-b", chunk, "Prompt", "Title", "English")
+        assert base != ResponseCache.make_key("model-a", chunk, "Other", "Title", "English")
+        assert base != ResponseCache.make_key("model-a", chunk, "Prompt", "Title", "Vietnamese")
+        assert base != ResponseCache.make_key("model-a", chunk, "Prompt", "Title", "English", 0.7)
+
+        chunk.context_buffer = "Previous"
+        assert base != ResponseCache.make_key("model-a", chunk, "Prompt", "Title", "English")
+
+    def test_key_fields_do_not_collide(self, chunk):
+        """Text shifted from one field into the next gives a different key"""
+        assert ResponseCache.make_key("model-a", chunk, "Prompt", "Talk", "English|Notes") != \
+            ResponseCache.make_key("model-a", chunk, "Prompt", "Notes|Talk", "English")
+
+    def test_get_miss_returns_none(self, cache, chunk):
+        """Missing entry is a miss"""
+        assert cache.get("0" * 64, chunk) is None
+
+    def test_set_get_round_trip(self, cache, chunk):
+        """Stored result comes back at zero cost"""
+        key = cache.make_key("model-a", chunk, "Prompt")
+        cache.set(key, make_result(chunk))
+
+        assert cache.contains(key)
+        result = cache.get(key, chunk)
+        assert result.cleaned_text == "Cleaned text"
+        assert result.chunk_index == 3
+        assert result.input_tokens == 100
+        assert result.cost == 0.0
+        assert result.cached
+
+    def test_corrupt_entry_is_miss(self, cache, chunk):
+        """Unreadable entries are ignored"""
+        key = cache.make_key("model-a", chunk, "Prompt")
+        cache.set(key, make_result(chunk))
+        cache._path(key).write_text("{not json")
+
+        assert cache.get(key, chunk) is None
+
+    def test_count_cached_and_clear(self, cache, chunk):
+        """Count hits across chunks and clear entries"""
+        other = Chunk(index=4, text="Other text", start_timestamp="00:04:00")
+        cache.set(cache.make_key("model-a", chunk, "Prompt"), make_result(chunk))
+
+        assert cache.count_cached("model-a", [chunk, other], "Prompt") == 1
+        cache.clear()
+        assert cache.count_cached("model-a", [chunk, other], "Prompt") == 0
+
+    @patch('src.llm_processor.anthropic.Anthropic')
+    def test_processor_skips_api_on_hit(self, mock_anthropic, cache, chunk):
+        """Second call for the same chunk is served from cache"""
+        mock_response = Mock()
+        mock_response.content = [Mock(text="Cleaned output")]
+        mock_response.usage.input_tokens = 100
+        mock_response.usage.output_tokens = 80
+
+        mock_client = Mock()
+        mock_client.messages.create.return_value = mock_response
+        mock_anthropic.return_value = mock_client
+
+        processor = LLMProcessor(api_key="test-key", cache=cache)
+        first = processor.process_chunk(chunk, "Clean: {{chunkText}}", "Video")
+        second = processor.process_chunk(chunk, "Clean: {{chunkText}}", "Video")
+
+        assert mock_client.messages.create.call_count == 1
+        assert second.cleaned_text == first.cleaned_text
+        assert second.cost == 0.0
+        assert not first.cached and second.cached
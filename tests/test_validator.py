@@ -117,6 +117,35 @@ class TestOutputValidator:
         assert len(filler_issues) > 0
         assert all(i.severity == ValidationSeverity.WARNING for i in filler_issues)
 
+    def test_filler_matches_capped_per_pattern(self):
+        """Report at most three matches per filler, in pattern order"""
+        validator = OutputValidator()
+        issues = validator.validate_chunk(
+            original="x" * 100,
+            cleaned="Um, uh, um, um, um, uh, okay.",
+            chunk_index=0
+        )
+
+        messages = [i.message for i in issues if i.rule == "filler_detected"]
+        assert messages == (
+            ["Possible filler word: 'uh'"] * 2 +
+            ["Possible filler word: 'um'"] * 3 +
+            ["Possible filler word: 'okay'"]
+        )
+
+    def test_filler_snippet_aligned_with_text(self):
+        """Snippets point at the filler even when lower() changes lengths"""
+        validator = OutputValidator()
+        issues = validator.validate_chunk(
+            original="x" * 100,
+            cleaned="İ" * 30 + " and then, Um, it works.",
+            chunk_index=0
+        )
+
+        fillers = [i for i in issues if i.rule == "filler_detected"]
+        assert [i.message for i in fillers] == ["Possible filler word: 'um'"]
+        assert "Um" in fillers[0].snippet
+
     def test_detect_context_markers(self):
         """Detect context markers as errors"""
         validator = OutputValidator()
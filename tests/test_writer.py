@@ -2,9 +2,11 @@
 import pytest
 import json
 from pathlib import Path
+from unittest.mock import patch
 from src.markdown_writer import (
     TranscriptMetadata,
-    MarkdownWriter
+    MarkdownWriter,
+    _dumps_pretty
 )
 from src.llm_processor import ProcessedChunk
 from datetime import datetime
@@ -242,6 +244,36 @@ class TestMarkdownWriter:
         assert "[00:00:00] Cleaned transcript content." in content
         assert "Duration:" not in content  # No duration provided
 
+    def test_write_with_content_matches_files(self, tmp_path):
+        """In-memory content matches what was written to disk"""
+        writer = MarkdownWriter(str(tmp_path))
+        chunks = [
+            ProcessedChunk(
+                chunk_index=0,
+                original_text="Original",
+                cleaned_text="==**Key idea**== explained.",
+                input_tokens=30,
+                output_tokens=25,
+                cost=0.0003,
+                model="claude-3-5-sonnet-20241022",
+                provider="anthropic"
+            )
+        ]
+        summary = {
+            "model": "claude-3-5-sonnet-20241022",
+            "total_cost": 0.0003,
+            "chunks_processed": 1,
+            "total_input_tokens": 30,
+            "total_output_tokens": 25
+        }
+
+        output = writer.write_with_content(chunks, "My Test Video", summary)
+
+        assert output.markdown_bytes == output.md_path.read_bytes()
+        assert output.metadata_bytes == output.json_path.read_bytes()
+        assert "<mark" in output.highlighted_markdown
+        assert "==**" not in output.highlighted_markdown
+
     def test_write_json_metadata(self, tmp_path):
         """Verify JSON metadata file content"""
         writer = MarkdownWriter(str(tmp_path))
@@ -282,6 +314,16 @@ class TestMarkdownWriter:
         assert metadata["cost_usd"] == 0.001
         assert metadata["tokens"]["total"] == 180
 
+    def test_metadata_json_same_without_orjson(self):
+        """stdlib fallback writes the same indented UTF-8 JSON"""
+        data = {"title": "Bài giảng", "original_duration": None, "tokens": {"input": 1}}
+
+        with patch("src.markdown_writer.HAS_ORJSON", False):
+            fallback = _dumps_pretty(data)
+
+        assert fallback == _dumps_pretty(data)
+        assert "Bài giảng" in fallback.decode("utf-8")
+
     def test_write_multiple_chunks(self, tmp_path):
         """Write multiple chunks in sequence"""
         writer = MarkdownWriter(str(tmp_path))